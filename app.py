@@ -1,17 +1,16 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from flask_cors import CORS
-from content_engine.content_generator import ContentGenerator
-from content_engine.enhanced_generator import EnhancedContentGenerator
-from content_engine.post_recommender import PostRecommender
-from content_engine.story_collector import BusinessStoryCollector
-from content_engine.auto_recommender import AutoPostRecommender
 import os
 from dotenv import load_dotenv
 import openai
 import json
 from datetime import datetime
-from scripts.setup import setup_environment
-from database.db_manager import DatabaseManager
+from scripts.setup import check_ready
+from content_engine.llm_cache import get_llm_cache
+from content_engine.http_cache import get_http_cache
+from content_engine.job_queue import JOB_HANDLERS
+from content_engine.services import get_services
+from content_engine import job_handlers
 
 # Load environment variables
 load_dotenv()
@@ -21,20 +20,20 @@ def create_app():
     app = Flask(__name__)
     CORS(app)  # Enable CORS for all routes
     
-    # Ensure environment is set up
-    if not setup_environment():
-        raise RuntimeError("Failed to initialize application environment")
-    
     # Initialize OpenAI
     openai.api_key = os.getenv('OPENAI_API_KEY')
     
-    # Initialize components
-    app.content_generator = ContentGenerator()
-    app.generator = EnhancedContentGenerator()
-    app.recommender = PostRecommender()
-    app.collector = BusinessStoryCollector()
-    app.auto_recommender = AutoPostRecommender()  # Add auto recommender
-    app.db = DatabaseManager()
+    # Components are built on first use and shared across routes
+    app.services = get_services()
+    
+    # Database setup happens once via `python run.py init`; serving only
+    # checks that the pool can answer a query
+    app.readiness = check_ready(app.services)
+    if not app.readiness['ready']:
+        raise RuntimeError(
+            f"Database not ready ({app.readiness['error']}); run `python run.py init` first"
+        )
+    print(f"Database ready in {app.readiness['pool_ms'] + app.readiness['total_ms']:.0f} ms")
     
     return app
 
@@ -63,7 +62,7 @@ def add_example():
         'tone': data.get('tone', 'professional')
     }
     
-    app.content_generator.add_training_example(content, metadata)
+    app.services.content_generator.add_training_example(content, metadata)
     return jsonify({'status': 'success'})
 
 @app.route('/generate-post', methods=['POST'])
@@ -77,7 +76,7 @@ def generate_post():
     }
     
     try:
-        content = app.content_generator.generate_content(params)
+        content = app.services.content_generator.generate_content(params)
         return jsonify({
             'status': 'success',
             'content': content
@@ -88,6 +87,123 @@ def generate_post():
             'message': str(e)
         }), 500
 
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@app.route('/api/generate/stream', methods=['POST'])
+def stream_generated_post():
+    """Stream post generation as Server-Sent Events.
+
+    With company_name, a story is collected for that company and the post
+    type comes from the recommender's settings (like /api/generate); with
+    auto, a random stored story is used and the post goes through the
+    same cache, quality bar and regeneration as /api/generate_post, so a
+    post that never passes is rejected rather than saved; otherwise the
+    topic form parameters are used (like /generate-post). Events: 'phase'
+    (story, draft, enhance, score, regenerate), 'token' chunks for the
+    draft and enhance passes, 'scores', then 'done' with the final post,
+    or 'error'.
+    """
+    data = request.json or {}
+    services = app.services
+
+    def events():
+        try:
+            story = None
+            post_type = None
+            if data.get('company_name') or data.get('auto'):
+                yield _sse('phase', {'phase': 'story'})
+                if data.get('company_name'):
+                    settings = services.recommender.get_recommended_settings(
+                        data['company_name'], data.get('industry')
+                    )
+                    post_type = settings['post_type']
+                    story = services.collector.collect_story(data['company_name'], data.get('industry'))
+                else:
+                    story = services.collector.get_random_story()
+                if not story:
+                    yield _sse('error', {'message': 'Could not find a story'})
+                    return
+
+            if data.get('auto'):
+                cached = services.auto_recommender.get_cached_post(story)
+                if cached:
+                    # Reuse a cached post that still passes the quality bar
+                    yield _sse('token', {'phase': 'enhance', 'text': cached['content']})
+                    yield _sse('scores', cached['scores'])
+                    post_id = services.auto_recommender.save_post(story, cached['content'], cached['scores'])
+                    yield _sse('done', {
+                        'post_id': post_id,
+                        'content': cached['content'],
+                        'company_name': story.get('company_name'),
+                        'industry': story.get('industry'),
+                        **cached['scores']
+                    })
+                    return
+
+            if story:
+                stream = services.generator.stream_single_post(
+                    story, post_type or services.generator._story_post_type(story)
+                )
+            else:
+                stream = services.content_generator.stream_content({
+                    'topic': data.get('topic'),
+                    'industry': data.get('industry'),
+                    'tone': data.get('tone', 'professional'),
+                    'story_type': data.get('story_type', 'insight')
+                })
+
+            post = None
+            for event, payload in stream:
+                if event == 'post':
+                    post = payload
+                else:
+                    yield _sse(event, payload)
+
+            yield _sse('phase', {'phase': 'score'})
+            content = post['content']
+            scores = services.scorer.score(content)
+            yield _sse('scores', scores)
+
+            post_id = None
+            if data.get('auto'):
+                recommender = services.auto_recommender
+                if recommender._should_regenerate(scores):
+                    yield _sse('phase', {'phase': 'regenerate'})
+                review = recommender.review_post(story, content, scores)
+                if not review['accepted']:
+                    yield _sse('error', {
+                        'message': 'No draft passed the quality bar',
+                        'scores': review['scores']
+                    })
+                    return
+                if review['content'] != content:
+                    yield _sse('scores', review['scores'])
+                post_id, content, scores = review['post_id'], review['content'], review['scores']
+            elif data.get('company_name'):
+                post_id = services.recommender.save_post(
+                    content=content,
+                    company_name=data['company_name'],
+                    industry=data.get('industry'),
+                    post_type=data.get('post_type'),
+                    metrics=services.generator.quality_metrics
+                )
+            yield _sse('done', {
+                'post_id': post_id,
+                'content': content,
+                'company_name': story.get('company_name') if story else None,
+                'industry': story.get('industry') if story else data.get('industry'),
+                **scores
+            })
+        except Exception as e:
+            yield _sse('error', {'message': str(e)})
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/schedule-post', methods=['POST'])
 def schedule_post():
     data = request.json
@@ -133,10 +249,10 @@ def generate_post_recommender():
         post_type = data.get('post_type')
         
         # Get recommended settings based on past feedback
-        settings = app.recommender.get_recommended_settings(company_name, industry)
+        settings = app.services.recommender.get_recommended_settings(company_name, industry)
         
         # Collect company story
-        story = app.collector.collect_story(company_name)
+        story = app.services.collector.collect_story(company_name)
         if not story:
             return jsonify({
                 'success': False,
@@ -144,15 +260,15 @@ def generate_post_recommender():
             })
         
         # Generate post with recommended settings
-        content = app.generator._generate_single_post(story, settings['post_type'])
+        content = app.services.generator._generate_single_post(story, settings['post_type'])
         
         # Save post to database
-        post_id = app.recommender.save_post(
+        post_id = app.services.recommender.save_post(
             content=content,
             company_name=company_name,
             industry=industry,
             post_type=post_type,
-            metrics=app.generator.quality_metrics
+            metrics=app.services.generator.quality_metrics
         )
         
         return jsonify({
@@ -174,51 +290,44 @@ def generate_batch():
         company_names = data.get('company_names', [])
         industry = data.get('industry')
         
-        if not company_names or not industry:
-            return jsonify({
-                'success': False,
-                'error': 'Company names and industry are required'
-            })
+        # Same checks the generate_batch job runs
+        rejection = app.services.recommender.check_new_batch(company_names, industry)
+        if rejection:
+            return jsonify({'success': False, **rejection})
+        
+        # Create new batch
+        batch_id = app.services.recommender.create_batch()
+        company_names = company_names[:app.services.recommender.MAX_BATCH_COMPANIES]
         
-        # Check if there's a pending batch that needs feedback
-        current_batch = app.recommender.get_current_batch_status()
-        if current_batch and current_batch['total_posts'] > current_batch['posts_with_feedback']:
+        if data.get('async'):
+            # Return immediately and save posts as they finish
+            _start_background_batch(batch_id, company_names, industry)
             return jsonify({
-                'success': False,
-                'error': 'Previous batch requires feedback',
-                'pending_batch': current_batch
-            })
+                'success': True,
+                'batch_id': batch_id,
+                'status': 'generating',
+                'total_posts': len(company_names)
+            }), 202
         
-        # Create new batch
-        batch_id = app.recommender.create_batch()
-        
-        # Generate 5 posts
-        generated_posts = []
-        for company_name in company_names[:5]:  # Limit to 5 companies
-            # Get recommended settings
-            settings = app.recommender.get_recommended_settings(company_name, industry)
-            
-            # Collect company story
-            story = app.collector.collect_story(company_name)
-            if story:
-                # Generate post
-                content = app.generator._generate_single_post(story, settings['post_type'])
-                
-                # Save post
-                post_id = app.recommender.save_post(
-                    content=content,
-                    company_name=company_name,
-                    industry=industry,
-                    post_type=settings['post_type'],
-                    metrics=app.generator.quality_metrics,
-                    batch_id=batch_id
-                )
-                
-                generated_posts.append({
-                    'post_id': post_id,
-                    'content': content,
-                    'company_name': company_name
-                })
+        # Generate posts for all companies in parallel
+        futures = [
+            app.services.batch_executor.submit(_generate_company_post, company_name, industry)
+            for company_name in company_names
+        ]
+        results = [future.result() for future in futures]
+        posts = [post for post in results if post]
+        
+        # Save all posts in one transaction
+        post_ids = app.services.recommender.save_posts(posts, batch_id=batch_id)
+        
+        generated_posts = [
+            {
+                'post_id': post_id,
+                'content': post['content'],
+                'company_name': post['company_name']
+            }
+            for post_id, post in zip(post_ids, posts)
+        ]
         
         return jsonify({
             'success': True,
@@ -232,10 +341,38 @@ def generate_batch():
             'error': str(e)
         })
 
+def _generate_company_post(company_name, industry):
+    """Run the settings, story and generation pipeline for one company"""
+    try:
+        return job_handlers.build_company_post(company_name, industry)
+    except Exception as e:
+        print(f"Error generating post for {company_name}: {str(e)}")
+        return None
+
+def _start_background_batch(batch_id, company_names, industry):
+    """Generate a batch in the background, saving each post as it finishes"""
+    recommender = app.services.recommender
+    recommender.start_batch_progress(batch_id, len(company_names))
+    
+    def on_done(future):
+        post = future.result()
+        try:
+            if post:
+                recommender.save_post(batch_id=batch_id, **post)
+        except Exception as e:
+            print(f"Error saving post for batch {batch_id}: {str(e)}")
+            post = None
+        finally:
+            recommender.record_batch_result(batch_id, bool(post))
+    
+    for company_name in company_names:
+        future = app.services.batch_executor.submit(_generate_company_post, company_name, industry)
+        future.add_done_callback(on_done)
+
 @app.route('/api/batch/<int:batch_id>/posts', methods=['GET'])
 def get_batch_posts(batch_id):
     try:
-        posts = app.recommender.get_batch_posts(batch_id)
+        posts = app.services.recommender.get_batch_posts(batch_id)
         return jsonify({
             'success': True,
             'posts': posts
@@ -249,7 +386,7 @@ def get_batch_posts(batch_id):
 @app.route('/api/current-batch', methods=['GET'])
 def get_current_batch():
     try:
-        current_batch = app.recommender.get_current_batch_status()
+        current_batch = app.services.recommender.get_current_batch_status()
         return jsonify({
             'success': True,
             'batch': current_batch
@@ -263,7 +400,15 @@ def get_current_batch():
 @app.route('/api/batch/<int:batch_id>/status', methods=['GET'])
 def get_batch_status(batch_id):
     try:
-        current_batch = app.recommender.get_current_batch_status()
+        progress = app.services.recommender.get_batch_progress(batch_id)
+        if progress:
+            return jsonify({
+                'success': True,
+                'status': 'generating',
+                **progress
+            })
+        
+        current_batch = app.services.recommender.get_current_batch_status()
         if current_batch and current_batch['batch_id'] == batch_id:
             return jsonify({
                 'success': True,
@@ -289,7 +434,7 @@ def submit_feedback():
         feedback_type = data.get('feedback_type')
         additional_text = data.get('additional_text')
         
-        success = app.recommender.save_feedback(
+        success = app.services.recommender.save_feedback(
             post_id=post_id,
             feedback_type=feedback_type,
             additional_text=additional_text
@@ -320,12 +465,12 @@ def submit_feedback_batch():
             })
         
         # Save feedback
-        app.recommender.save_feedback(post_id, feedback_type, feedback_text)
+        app.services.recommender.save_feedback(post_id, feedback_type, feedback_text)
         
         # Check if all posts in the batch have feedback
-        current_batch = app.recommender.get_current_batch_status()
+        current_batch = app.services.recommender.get_current_batch_status()
         if current_batch and current_batch['total_posts'] == current_batch['posts_with_feedback']:
-            app.recommender.mark_batch_complete(current_batch['batch_id'])
+            app.services.recommender.mark_batch_complete(current_batch['batch_id'])
         
         return jsonify({'success': True})
         
@@ -341,7 +486,7 @@ def get_history():
         company_name = request.args.get('company_name')
         industry = request.args.get('industry')
         
-        history = app.recommender.get_feedback_history(
+        history = app.services.recommender.get_feedback_history(
             company_name=company_name,
             industry=industry
         )
@@ -362,8 +507,7 @@ def get_recommendations():
     """Get automatic post recommendations"""
     try:
         num_recommendations = int(request.args.get('num', 5))
-        recommender = PostRecommender()
-        recommendations = recommender.get_automatic_recommendations(num_recommendations)
+        recommendations = app.services.recommender.get_automatic_recommendations(num_recommendations)
         return jsonify(recommendations)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -376,9 +520,16 @@ def generate_posts():
         print("Starting post generation...")
         count = request.json.get('count', 5)
         print(f"Requested {count} posts")
-        posts = app.auto_recommender.generate_batch_posts(count)
-        print(f"Generated {len(posts)} posts")
-        return jsonify(posts), 200
+        result = app.services.auto_recommender.generate_batch_posts(
+            count,
+            max_workers=request.json.get('max_workers'),
+            timeout=request.json.get('timeout')
+        )
+        print(f"Generated {len(result['posts'])} posts, {len(result['failures'])} failed")
+        return jsonify({
+            'posts': result['posts'],
+            'failures': result['failures']
+        }), 200
     except Exception as e:
         print(f"Error in generate_posts: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -387,7 +538,7 @@ def generate_posts():
 def get_pending_posts():
     """Get posts pending review"""
     try:
-        posts = app.auto_recommender.get_pending_posts()
+        posts = app.services.auto_recommender.get_pending_posts()
         return jsonify(posts), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -401,14 +552,14 @@ def approve_post():
         feedback_tags = request.json.get('feedback_tags', [])
         
         # Record approval
-        app.auto_recommender.record_approval(post_id, approved)
+        app.services.auto_recommender.record_approval(post_id, approved)
         
         # If not approved, record feedback
         if not approved and feedback_tags:
-            app.auto_recommender.add_feedback(post_id, feedback_tags)
+            app.services.auto_recommender.add_feedback(post_id, feedback_tags)
         
         # Learn from feedback
-        app.auto_recommender.learn_from_feedback()
+        app.services.auto_recommender.learn_from_feedback()
         
         return jsonify({'success': True}), 200
     except Exception as e:
@@ -418,7 +569,7 @@ def approve_post():
 def get_system_stats():
     """Get system performance statistics"""
     try:
-        stats = app.auto_recommender.get_system_stats()
+        stats = app.services.auto_recommender.get_system_stats()
         return jsonify(stats), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -427,7 +578,7 @@ def get_system_stats():
 def get_feedback_tags():
     """Get available feedback tags"""
     try:
-        return jsonify(app.auto_recommender.FEEDBACK_TAGS), 200
+        return jsonify(app.services.auto_recommender.FEEDBACK_TAGS), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -435,7 +586,7 @@ def get_feedback_tags():
 def generate_auto_post():
     """Generate a new post automatically"""
     try:
-        post_data = app.auto_recommender.generate_post()
+        post_data = app.services.auto_recommender.generate_post()
         return jsonify(post_data), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -451,7 +602,7 @@ def submit_auto_feedback():
         if post_id is None or not feedback_tags:
             return jsonify({'error': 'Missing required fields'}), 400
         
-        app.auto_recommender.add_feedback(post_id, feedback_tags)
+        app.services.auto_recommender.add_feedback(post_id, feedback_tags)
         return jsonify({'success': True}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -460,10 +611,87 @@ def submit_auto_feedback():
 def get_feedback_stats(post_id):
     """Get feedback statistics for a post"""
     try:
-        stats = app.auto_recommender.get_feedback_stats(post_id)
+        stats = app.services.auto_recommender.get_feedback_stats(post_id)
         return jsonify(stats), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/llm_cache/stats', methods=['GET'])
+def get_llm_cache_stats():
+    """Get LLM response cache statistics"""
+    try:
+        return jsonify(get_llm_cache().stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/http_cache/stats', methods=['GET'])
+def get_http_cache_stats():
+    """Get collector HTTP cache statistics"""
+    try:
+        cache = get_http_cache()
+        if cache is None:
+            return jsonify({'enabled': False}), 200
+        return jsonify({'enabled': True, **cache.stats()}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/providers/stats', methods=['GET'])
+def get_provider_stats():
+    """Get news provider latency statistics"""
+    try:
+        return jsonify(app.services.collector.providers.get_stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/ready', methods=['GET'])
+def readiness():
+    """Readiness probe: a pooled SELECT 1, with timings"""
+    result = app.services.db.ping()
+    return jsonify({**result, 'startup': app.readiness}), 200 if result['ready'] else 503
+
+@app.route('/api/services/stats', methods=['GET'])
+def get_service_stats():
+    """Get which components are initialized and how long each took to build"""
+    try:
+        return jsonify(app.services.stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """Queue a long-running generation job for the worker pool"""
+    try:
+        data = request.json or {}
+        job_type = data.get('type')
+        if job_type not in JOB_HANDLERS:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown job type. Expected one of: {', '.join(sorted(JOB_HANDLERS))}"
+            }), 400
+        
+        # Bounded, since every attempt can spend LLM and news API quota
+        attempts_limit = int(os.getenv('JOB_MAX_ATTEMPTS_LIMIT', 5))
+        max_attempts = max(1, min(int(data.get('max_attempts', 3)), attempts_limit))
+        
+        job_id = app.services.job_queue.enqueue(job_type, data.get('payload', {}), max_attempts=max_attempts)
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued'
+        }), 202
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/jobs/<int:job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the status and result of a queued job"""
+    try:
+        job = app.services.job_queue.get(job_id)
+        if not job:
+            return jsonify({'success': False, 'error': 'Job not found'}), 404
+        return jsonify({'success': True, 'job': job}), 200
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001)
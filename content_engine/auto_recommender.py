@@ -1,12 +1,16 @@
 from typing import List, Dict, Optional
+import os
 import json
+import time
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from database.db_manager import DatabaseManager
 from content_engine.story_collector import BusinessStoryCollector
 from content_engine.enhanced_generator import EnhancedContentGenerator
-from textblob import TextBlob
-import re
+from content_engine.quality_scorer import QualityScorer
+from content_engine.regeneration import RegenerationEngine, RegenerationResult
+from psycopg2.extras import execute_values
 
 class AutoPostRecommender:
     """Automatic LinkedIn post recommender with feedback system"""
@@ -42,11 +46,16 @@ class AutoPostRecommender:
         ]
     }
     
-    def __init__(self):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None,
+                 story_collector: Optional[BusinessStoryCollector] = None,
+                 post_generator: Optional[EnhancedContentGenerator] = None,
+                 scorer: Optional[QualityScorer] = None):
         """Initialize the recommender system"""
-        self.db_manager = DatabaseManager()
-        self.story_collector = BusinessStoryCollector()
-        self.post_generator = EnhancedContentGenerator()
+        self.db_manager = db_manager or DatabaseManager()
+        self.story_collector = story_collector or BusinessStoryCollector()
+        self.post_generator = post_generator or EnhancedContentGenerator()
+        self.scorer = scorer or QualityScorer()
+        self.regenerator = RegenerationEngine(self.post_generator.llm)
         self.logger = logging.getLogger(__name__)
         self._init_database()
 
@@ -105,8 +114,9 @@ class AutoPostRecommender:
             )
         """)
 
-    def generate_batch_posts(self, count: int = 5) -> List[Dict]:
-        """Generate a batch of posts"""
+    def generate_batch_posts(self, count: int = 5, max_workers: Optional[int] = None,
+                             timeout: Optional[float] = None) -> Dict:
+        """Generate a batch of posts, returning the posts and per-story failures"""
         print(f"AutoPostRecommender: Starting batch generation of {count} posts")
         try:
             # Get stories from database
@@ -115,26 +125,80 @@ class AutoPostRecommender:
             
             if not stories:
                 print("No stories found in database")
-                return []
+                return {'posts': [], 'failures': [], 'elapsed': 0.0}
             
-            # Generate posts in parallel
-            posts = []
-            for story in stories:
-                try:
-                    print(f"Generating post for story: {story.get('company_name', 'Unknown Company')}")
-                    post = self.post_generator.generate_single_post(story)
-                    if post:
-                        posts.append(post)
-                except Exception as e:
-                    print(f"Error generating post for story: {str(e)}")
+            result = self.run_batch(stories, max_workers=max_workers, timeout=timeout)
+            for failure in result['failures']:
+                self.logger.warning(
+                    f"Failed to generate post for story {failure['story_id']} "
+                    f"({failure['company_name']}): {failure['error']}"
+                )
             
-            print(f"Successfully generated {len(posts)} posts")
-            return posts
+            print(f"Successfully generated {len(result['posts'])} posts in {result['elapsed']:.1f}s")
+            return result
             
         except Exception as e:
             print(f"Error in batch post generation: {str(e)}")
             raise
 
+    def run_batch(self, stories: List[Dict], max_workers: Optional[int] = None,
+                  timeout: Optional[float] = None) -> Dict:
+        """Generate posts for stories in parallel.
+
+        Posts are returned in the same order as the input stories. Stories that
+        fail or exceed the per-story timeout are reported in ``failures`` while
+        the remaining posts are still returned. Requested max_workers and
+        timeout are clamped to BATCH_MAX_WORKERS_LIMIT and
+        BATCH_STORY_TIMEOUT_LIMIT, since they may come from a request.
+        """
+        workers_limit = int(os.getenv('BATCH_MAX_WORKERS_LIMIT', 10))
+        timeout_limit = float(os.getenv('BATCH_STORY_TIMEOUT_LIMIT', 180))
+        max_workers = max(1, min(int(max_workers or os.getenv('BATCH_MAX_WORKERS', 5)), workers_limit))
+        timeout = max(1.0, min(float(timeout or os.getenv('BATCH_STORY_TIMEOUT', 90)), timeout_limit))
+        
+        async def generate_all():
+            semaphore = asyncio.Semaphore(max_workers)
+            
+            async def generate(story):
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        self.post_generator.agenerate_single_post(story),
+                        timeout
+                    )
+            
+            return await asyncio.gather(
+                *[generate(story) for story in stories],
+                return_exceptions=True
+            )
+        
+        started = time.monotonic()
+        results = self.post_generator.llm.run(generate_all())
+        
+        posts = []
+        failures = []
+        for index, (story, result) in enumerate(zip(stories, results)):
+            if isinstance(result, asyncio.TimeoutError):
+                error = f"Timed out after {timeout:.0f}s"
+            elif isinstance(result, Exception):
+                error = str(result) or type(result).__name__
+            elif not result:
+                error = "Empty result"
+            else:
+                posts.append(result)
+                continue
+            failures.append({
+                'index': index,
+                'story_id': story.get('id'),
+                'company_name': story.get('company_name', 'Unknown Company'),
+                'error': error
+            })
+        
+        return {
+            'posts': posts,
+            'failures': failures,
+            'elapsed': time.monotonic() - started
+        }
+
     def get_pending_posts(self) -> List[Dict]:
         """Get posts that haven't been reviewed yet"""
         return self.db_manager.execute("""
@@ -153,155 +217,152 @@ class AutoPostRecommender:
                 self.logger.error("No stories found in database")
                 return None
             
-            # Check cache first
+            # A cached post is reused as long as it still passes the quality bar
             cache_key = self._cache_key(story)
-            cached_content = self._get_cached_post(cache_key)
-            
-            if cached_content:
-                post_content = cached_content
-            else:
-                # Generate post content
-                post_content = self.post_generator.generate_post(
-                    story["content"],
-                    story["industry"],
-                    story["company_name"]
-                )
-                # Cache the content
+            post_content = self._get_cached_post(cache_key)
+            quality_scores = self._validate_post_quality(post_content) if post_content else None
+            regeneration = None
+
+            if not post_content or self._should_regenerate(quality_scores):
+                regeneration = self._regenerate(story)
+                if regeneration.post is None:
+                    self.logger.error(f"No post generated: {regeneration.metrics()}")
+                    return None
+                if not regeneration.accepted:
+                    self.logger.warning(
+                        f"No candidate passed the quality threshold ({regeneration.stop_reason}), "
+                        "keeping the best one"
+                    )
+                post_content = regeneration.post['content']
+                quality_scores = regeneration.scores
                 self._cache_post(cache_key, post_content)
             
-            # Validate quality
-            quality_scores = self._validate_post_quality(post_content)
-            
-            # Regenerate if quality is poor
-            if self._should_regenerate(quality_scores):
-                self.logger.info("Post quality below threshold, regenerating...")
-                return self.generate_post()  # Recursive call
-            
-            # Save to database
-            self.db_manager.execute("""
-                INSERT INTO auto_posts (
-                    content, story_id, industry, company_name, 
-                    post_type, engagement_score, relevance_score,
-                    readability_score, authenticity_score
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                post_content,
-                story["id"],
-                story["industry"],
-                story["company_name"],
-                story["type"],
-                quality_scores['engagement_score'],
-                quality_scores['relevance_score'],
-                quality_scores['readability_score'],
-                quality_scores['authenticity_score']
-            ))
-            
-            post_id = self.db_manager.get_last_row_id()
+            post_id = self.save_post(story, post_content, quality_scores)
             
             return {
                 "post_id": post_id,
                 "content": post_content,
                 "industry": story["industry"],
                 "company_name": story["company_name"],
-                **quality_scores
+                **quality_scores,
+                "regeneration": regeneration.metrics() if regeneration else None
             }
             
         except Exception as e:
             self.logger.error(f"Error in generate_post: {str(e)}")
             return None
 
-    def _validate_post_quality(self, content: str) -> Dict[str, float]:
-        """Validate post quality using multiple metrics"""
+    def _regenerate(self, story: Dict) -> RegenerationResult:
+        """Best-of-N generation for a story until a candidate passes the quality bar"""
+        return self.regenerator.run(
+            lambda max_tokens: self.post_generator.agenerate_single_post(
+                story, use_cache=False, max_tokens=max_tokens
+            ),
+            self.score_batch,
+            lambda scores: not self._should_regenerate(scores)
+        )
+
+    def get_cached_post(self, story: Dict) -> Optional[Dict]:
+        """A cached post for the story that still passes the quality bar, with its scores"""
+        content = self._get_cached_post(self._cache_key(story))
+        if not content:
+            return None
+        quality_scores = self._validate_post_quality(content)
+        if self._should_regenerate(quality_scores):
+            return None
+        return {'content': content, 'scores': quality_scores}
+
+    def review_post(self, story: Dict, content: str, quality_scores: Dict[str, float]) -> Dict:
+        """Accept a draft generated elsewhere (e.g. streamed) or regenerate it.
+
+        A draft that passes the quality bar is cached and saved as is;
+        otherwise the story goes through the regeneration engine. Only a
+        post that passes is saved, so 'post_id' is None when the draft and
+        every regenerated candidate fall short.
+        """
+        regeneration = None
+        if self._should_regenerate(quality_scores):
+            regeneration = self._regenerate(story)
+            if regeneration.post is not None and regeneration.accepted:
+                content = regeneration.post['content']
+                quality_scores = regeneration.scores
+
+        accepted = not self._should_regenerate(quality_scores)
+        post_id = None
+        if accepted:
+            self._cache_post(self._cache_key(story), content)
+            post_id = self.save_post(story, content, quality_scores)
+        else:
+            self.logger.warning(f"Rejected post for story {story.get('id')}: {quality_scores}")
         return {
-            'engagement_score': self._calculate_engagement_score(content),
-            'relevance_score': self._calculate_relevance_score(content),
-            'readability_score': self._calculate_readability_score(content),
-            'authenticity_score': self._calculate_authenticity_score(content)
+            'post_id': post_id,
+            'accepted': accepted,
+            'content': content,
+            'scores': quality_scores,
+            'regeneration': regeneration.metrics() if regeneration else None
         }
 
-    def _should_regenerate(self, scores: Dict[str, float]) -> bool:
-        """Determine if post should be regenerated based on quality scores"""
-        return any(score < 0.7 for score in scores.values())
+    def save_post(self, story: Dict, content: str, quality_scores: Dict[str, float]) -> Optional[int]:
+        """Store a generated post for review and return its id"""
+        rows = self.db_manager.execute("""
+            INSERT INTO auto_posts (
+                content, story_id, industry, company_name, 
+                post_type, engagement_score, relevance_score,
+                readability_score, authenticity_score
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING id
+        """, (
+            content,
+            story["id"],
+            story["industry"],
+            story["company_name"],
+            self.post_generator._story_post_type(story),
+            quality_scores['engagement_score'],
+            quality_scores['relevance_score'],
+            quality_scores['readability_score'],
+            quality_scores['authenticity_score']
+        ))
+        return rows[0]['id'] if rows else None
 
-    def _calculate_engagement_score(self, content: str) -> float:
-        """Calculate predicted engagement score for post content"""
-        score = 0.5  # Base score
-        
-        # Check for engagement elements
-        engagement_elements = {
-            'question_marks': '?',
-            'call_to_action': ['comment', 'share', 'like', 'follow', 'thoughts'],
-            'emojis': r'[\U0001F300-\U0001F9FF]',
-            'hashtags': '#',
-            'numbers': r'\d+'
-        }
-        
-        for element, pattern in engagement_elements.items():
-            if isinstance(pattern, list):
-                if any(word in content.lower() for word in pattern):
-                    score += 0.1
-            else:
-                if re.search(pattern, content):
-                    score += 0.1
-        
-        # Analyze sentiment
-        blob = TextBlob(content)
-        sentiment = blob.sentiment.polarity
-        score += 0.2 if sentiment > 0 else 0.1
-        
-        return min(1.0, score)
+    def _validate_post_quality(self, content: str) -> Dict[str, float]:
+        """Validate post quality using multiple metrics.
 
-    def _calculate_readability_score(self, content: str) -> float:
-        """Calculate readability score using various metrics"""
-        words = content.split()
-        sentences = content.split('.')
-        
-        if not words or not sentences:
-            return 0.0
-        
-        # Basic metrics
-        avg_word_length = sum(len(word) for word in words) / len(words)
-        avg_sentence_length = len(words) / len(sentences)
-        
-        # Penalize very long or very short content
-        length_score = 1.0
-        if len(words) < 50:
-            length_score = 0.5
-        elif len(words) > 300:
-            length_score = 0.7
-            
-        # Calculate final score
-        readability_score = 1.0
-        if avg_word_length > 8:  # Penalize too many long words
-            readability_score -= 0.2
-        if avg_sentence_length > 20:  # Penalize too long sentences
-            readability_score -= 0.2
-            
-        return max(0.0, min(1.0, readability_score * length_score))
+        Engagement sentiment comes from the scorer's sentiment callable,
+        the shared lexicon SentimentAnalyzer unless one was injected.
+        """
+        return self.scorer.score(content)
 
-    def _calculate_authenticity_score(self, content: str) -> float:
-        """Calculate authenticity score based on various markers"""
-        score = 0.5  # Base score
-        
-        # Check for authenticity markers
-        authenticity_markers = {
-            'specific_dates': r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b',
-            'numbers_and_stats': r'\b\d+%|\$\d+|\d+x|\d+\+\b',
-            'credible_sources': ['according to', 'research shows', 'study finds'],
-            'industry_terms': ['market', 'industry', 'sector', 'technology'],
-            'real_examples': ['for example', 'such as', 'like']
-        }
-        
-        for marker, pattern in authenticity_markers.items():
-            if isinstance(pattern, list):
-                if any(phrase in content.lower() for phrase in pattern):
-                    score += 0.1
-            else:
-                if re.search(pattern, content):
-                    score += 0.1
-        
-        return min(1.0, score)
+    def score_batch(self, contents: List[str]) -> List[Dict[str, float]]:
+        """Score many posts at once with the shared QualityScorer"""
+        return self.scorer.score_batch(contents)
+
+    def rescore_posts(self, batch_size: int = 500) -> int:
+        """Recompute the quality scores of every post in auto_posts"""
+        posts = self.db_manager.execute("SELECT id, content FROM auto_posts ORDER BY id")
+        for start in range(0, len(posts), batch_size):
+            chunk = posts[start:start + batch_size]
+            scores = self.score_batch([post['content'] for post in chunk])
+            rows = [
+                (post['id'], s['engagement_score'], s['relevance_score'],
+                 s['readability_score'], s['authenticity_score'])
+                for post, s in zip(chunk, scores)
+            ]
+            with self.db_manager.cursor() as cur:
+                execute_values(cur, """
+                    UPDATE auto_posts AS p
+                    SET engagement_score = v.engagement_score,
+                        relevance_score = v.relevance_score,
+                        readability_score = v.readability_score,
+                        authenticity_score = v.authenticity_score
+                    FROM (VALUES %s) AS v(id, engagement_score, relevance_score,
+                                          readability_score, authenticity_score)
+                    WHERE p.id = v.id
+                """, rows, page_size=len(rows))
+        return len(posts)
+
+    def _should_regenerate(self, scores: Dict[str, float]) -> bool:
+        """Determine if post should be regenerated based on quality scores"""
+        return any(score < 0.7 for score in scores.values())
 
     def learn_from_feedback(self):
         """Analyze feedback patterns to improve generation"""
@@ -341,7 +402,7 @@ class AutoPostRecommender:
 
     def _cache_key(self, story: Dict) -> str:
         """Generate cache key for a story"""
-        return f"{story['id']}:{story['industry']}:{story['type']}"
+        return f"{story['id']}:{story['industry']}:{self.post_generator._story_post_type(story)}"
 
     def _get_cached_post(self, cache_key: str) -> Optional[str]:
         """Get cached post if available and not expired"""
@@ -0,0 +1,106 @@
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+# Company suffixes, in the order they take precedence
+COMPANY_SUFFIXES = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
+
+# Capitalized words that start sentences rather than name companies
+NON_COMPANIES = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
+
+# Companies recognized by name even without a suffix
+KNOWN_COMPANIES = [
+    'Netflix', 'Moderna', 'Stripe', 'Warby Parker', 'Beyond Meat', 'Sunrun', 'Duolingo',
+    'GitLab', '23andMe', 'Robinhood', 'Apple', 'Microsoft', 'Google', 'Alphabet', 'Amazon',
+    'Meta', 'Tesla', 'Nvidia', 'OpenAI', 'IBM', 'Intel', 'Salesforce', 'Shopify', 'Airbnb',
+    'Uber', 'Spotify', 'Nike', 'Starbucks', 'Walmart', 'Pfizer'
+]
+
+_CAPITALIZED_PHRASE = re.compile(r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b')
+
+
+class CompanyNameExtractor:
+    """Company name extraction with precompiled patterns.
+
+    One alternation regex finds which suffixes occur in the text, so only
+    those suffix patterns run; a gazetteer regex of known companies comes
+    next, then the first plausible capitalized phrase. Results are memoized
+    per input text.
+    """
+
+    def __init__(self, known_companies: Iterable[str] = None, cache_size: int = None):
+        self._suffix_hint = re.compile(r'\s(' + '|'.join(COMPANY_SUFFIXES) + r')\b')
+        self._suffix_patterns = {
+            suffix: re.compile(fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b')
+            for suffix in COMPANY_SUFFIXES
+        }
+        self._known = set(KNOWN_COMPANIES if known_companies is None else known_companies)
+        self._gazetteer = self._compile_gazetteer()
+        self._lock = threading.Lock()
+        self._extract_cached = lru_cache(
+            maxsize=cache_size or int(os.getenv('COMPANY_EXTRACTOR_CACHE_SIZE', 4096))
+        )(self._extract)
+
+    def _compile_gazetteer(self) -> Optional[re.Pattern]:
+        if not self._known:
+            return None
+        # Longest names first so 'Warby Parker' wins over a shorter overlapping name
+        names = sorted(self._known, key=len, reverse=True)
+        return re.compile(r'\b(?:' + '|'.join(re.escape(name) for name in names) + r')\b')
+
+    def add_companies(self, names: Iterable[str]):
+        """Add names to the gazetteer"""
+        with self._lock:
+            self._known.update(name for name in names if name)
+            self._gazetteer = self._compile_gazetteer()
+            self._extract_cached.cache_clear()
+
+    def _extract(self, text: str) -> Optional[str]:
+        # Name with a suffix, trying suffixes in precedence order
+        present = {match.group(1) for match in self._suffix_hint.finditer(text)}
+        for suffix in COMPANY_SUFFIXES:
+            if suffix in present:
+                match = self._suffix_patterns[suffix].search(text)
+                if match:
+                    return match.group(0).strip()
+
+        # Known company
+        if self._gazetteer is not None:
+            match = self._gazetteer.search(text)
+            if match:
+                return match.group(0)
+
+        # Standalone capitalized name (likely a company name)
+        for match in _CAPITALIZED_PHRASE.finditer(text):
+            name = match.group(0)
+            if name not in NON_COMPANIES and len(name) > 2:
+                return name
+        return None
+
+    def extract(self, text: str) -> Optional[str]:
+        """Extract the most likely company name from text"""
+        if not text:
+            return None
+        return self._extract_cached(text)
+
+    def extract_many(self, texts: Iterable[str]) -> List[Optional[str]]:
+        """Extract company names from several texts"""
+        return [self.extract(text) for text in texts]
+
+    def cache_info(self):
+        return self._extract_cached.cache_info()
+
+
+_default_extractor = None
+_default_extractor_lock = threading.Lock()
+
+
+def get_company_extractor() -> CompanyNameExtractor:
+    """Get the process-wide company name extractor"""
+    global _default_extractor
+    with _default_extractor_lock:
+        if _default_extractor is None:
+            _default_extractor = CompanyNameExtractor()
+        return _default_extractor
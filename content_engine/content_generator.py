@@ -1,13 +1,14 @@
 import random
-from typing import Dict, List, Optional
-import openai
+from typing import Dict, Iterator, List, Optional, Tuple
 from .content_analyzer import ContentAnalyzer
 from .enhanced_generator import EnhancedContentGenerator
+from .llm_client import get_llm_client
 
 class ContentGenerator:
-    def __init__(self):
+    def __init__(self, enhanced_generator: Optional[EnhancedContentGenerator] = None):
         self.analyzer = ContentAnalyzer()
-        self.enhanced_generator = EnhancedContentGenerator()
+        self.enhanced_generator = enhanced_generator or EnhancedContentGenerator()
+        self.llm = get_llm_client()
         self.models = {
             'primary': 'gpt-4',
             'fallback': 'gpt-3.5-turbo'
@@ -46,32 +47,34 @@ class ContentGenerator:
         # Otherwise return the first post
         return posts[0]['content']
     
-    def _simple_generate(self, params: Dict) -> str:
-        """Simple fallback generation method"""
-        prompt = f"""Create a compelling LinkedIn post about {params.get('topic', 'business')}. 
+    def stream_content(self, params: Dict) -> Iterator[Tuple[str, Dict]]:
+        """Streaming generation: the topic prompt when a topic is given, else a stored story from the industry"""
+        generator = self.enhanced_generator
+        if params.get('topic'):
+            return generator.stream_post(self._simple_prompt(params))
+        stories = generator.story_collector.get_random_stories(1, industry=params.get('industry'))
+        if stories:
+            story = stories[0]
+            return generator.stream_single_post(story, generator._story_post_type(story))
+        return generator.stream_post(self._simple_prompt(params))
+    
+    def _simple_prompt(self, params: Dict) -> str:
+        """Prompt for a post about a topic without a source story"""
+        return f"""Create a compelling LinkedIn post about {params.get('topic', 'business')}. 
         Focus on providing valuable insights and engaging the audience. 
         Include relevant hashtags."""
+    
+    def _simple_generate(self, params: Dict) -> str:
+        """Simple fallback generation method"""
+        prompt = self._simple_prompt(params)
+        
+        messages = [
+            {"role": "system", "content": "You are a professional business content writer."},
+            {"role": "user", "content": prompt}
+        ]
         
         try:
-            response = openai.ChatCompletion.create(
-                model=self.models['primary'],
-                messages=[
-                    {"role": "system", "content": "You are a professional business content writer."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            return response.choices[0].message.content
+            return self.llm.chat(messages, model=self.models['primary'], temperature=0.7, max_tokens=500)
         except Exception as e:
             # Final fallback to GPT-3.5-turbo
-            response = openai.ChatCompletion.create(
-                model=self.models['fallback'],
-                messages=[
-                    {"role": "system", "content": "You are a professional business content writer."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            return response.choices[0].message.content
+            return self.llm.chat(messages, model=self.models['fallback'], temperature=0.7, max_tokens=500)
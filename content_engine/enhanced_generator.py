@@ -1,17 +1,18 @@
-import openai
-from typing import List, Dict, Optional, Union
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 import json
-import concurrent.futures
 from datetime import datetime
 import logging
 from .story_collector import BusinessStoryCollector
 from .templates import ContentTemplates
+from .llm_client import get_llm_client
+from .marker_scanner import get_marker_scanner
 
 class EnhancedContentGenerator:
-    def __init__(self):
-        self.story_collector = BusinessStoryCollector()
+    def __init__(self, story_collector: Optional[BusinessStoryCollector] = None):
+        self.story_collector = story_collector or BusinessStoryCollector()
         self.templates = ContentTemplates()
         self.logger = logging.getLogger(__name__)
+        self.llm = get_llm_client()
         
         # OpenAI configuration
         self.models = {
@@ -95,65 +96,62 @@ Generate the post now:
         
         return "\n".join(formatted_news)
 
+    def _messages(self, prompt: str) -> List[Dict]:
+        """Chat messages for a generation prompt"""
+        return [
+            {"role": "system", "content": "You are a professional business content writer creating engaging LinkedIn posts."},
+            {"role": "user", "content": prompt}
+        ]
+
     def _call_openai(self, prompt: str, model: str = None) -> str:
         """Make an API call to OpenAI with fallback"""
+        return self.llm.run(self._acall_openai(prompt, model))
+
+    async def _acall_openai(self, prompt: str, model: str = None, use_cache: bool = True,
+                            max_tokens: int = 800) -> str:
+        """Make an async API call to OpenAI with fallback"""
         try:
             print(f"Calling OpenAI API with model: {model or self.models['primary']}")
             model = model or self.models['primary']
-            response = openai.ChatCompletion.create(
+            content = await self.llm.achat(
+                messages=self._messages(prompt),
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are a professional business content writer creating engaging LinkedIn posts."},
-                    {"role": "user", "content": prompt}
-                ],
                 temperature=0.7,
-                max_tokens=800
+                max_tokens=max_tokens,
+                use_cache=use_cache
             )
             print("Successfully received response from OpenAI")
-            return response.choices[0].message.content
+            return content
         except Exception as e:
             if model == self.models['primary']:
                 print(f"Primary model failed with error: {str(e)}, falling back to {self.models['fallback']}")
-                return self._call_openai(prompt, self.models['fallback'])
+                return await self._acall_openai(prompt, self.models['fallback'], use_cache, max_tokens)
+            print(f"OpenAI API call failed: {str(e)}")
+            raise e
+
+    def _stream_openai(self, prompt: str, model: str = None) -> Iterator[str]:
+        """Stream an OpenAI completion chunk by chunk, falling back if nothing was sent yet"""
+        model = model or self.models['primary']
+        streamed = False
+        try:
+            for chunk in self.llm.stream(self._messages(prompt), model, temperature=0.7, max_tokens=800):
+                streamed = True
+                yield chunk
+        except Exception as e:
+            if model == self.models['primary'] and not streamed:
+                print(f"Primary model failed with error: {str(e)}, falling back to {self.models['fallback']}")
+                yield from self._stream_openai(prompt, self.models['fallback'])
+                return
             print(f"OpenAI API call failed: {str(e)}")
             raise e
 
     def _check_authenticity_markers(self, content: str) -> Dict[str, bool]:
         """Check for authenticity markers in the content"""
-        content = content.lower()
-        return {
-            'specific_dates': any(char.isdigit() and ("," in content or "-" in content) for char in content),
-            'real_numbers': any(char.isdigit() for char in content),
-            'named_sources': any(m in content for m in ["according to", "said", "stated", "ceo", "founder", "director", "leader"]),
-            'direct_quotes': '"' in content or '"' in content or '"' in content,
-            'verifiable_facts': any(m in content for m in ["reported", "announced", "published", "confirmed", "launched", "achieved", "milestone"])
-        }
+        return get_marker_scanner().scan(content).authenticity
 
     def _check_insight_markers(self, content: str) -> Dict[str, bool]:
         """Check for insight quality markers in the content"""
-        content = content.lower()
-        return {
-            'behind_scenes': any(m in content for m in [
-                "internally", "behind the scenes", "within the company",
-                "process", "system", "building", "development", "integration"
-            ]),
-            'counter_intuitive': any(m in content for m in [
-                "surprisingly", "contrary to", "unexpected", "unlike",
-                "instead of", "rather than", "despite", "however"
-            ]),
-            'industry_specific': any(m in content for m in [
-                "in the industry", "sector-specific", "market dynamics",
-                "landscape", "segment", "vertical", "market"
-            ]),
-            'decision_rationale': any(m in content for m in [
-                "decided to", "chose to", "reasoning behind",
-                "strategy", "approach", "solution", "method"
-            ]),
-            'failure_lessons': any(m in content for m in [
-                "learned from", "mistake", "challenge", "hurdle",
-                "obstacle", "issue", "problem", "difficulty"
-            ])
-        }
+        return get_marker_scanner().scan(content).insight
 
     def _validate_authenticity(self, content: str) -> bool:
         """Validate the authenticity markers in the content"""
@@ -171,6 +169,16 @@ Generate the post now:
 
     def _enhance_content(self, content: str) -> str:
         """Enhance the generated content with engagement elements"""
+        return self._call_openai(self._build_enhance_prompt(content))
+
+    async def _aenhance_content(self, content: str, use_cache: bool = True, max_tokens: int = 800) -> str:
+        """Async version of _enhance_content"""
+        return await self._acall_openai(
+            self._build_enhance_prompt(content), use_cache=use_cache, max_tokens=max_tokens
+        )
+
+    def _build_enhance_prompt(self, content: str) -> str:
+        """Build the enhancement prompt for a draft"""
         # First validate the content quality
         if not self._validate_authenticity(content) or not self._validate_insights(content):
             # If content doesn't meet quality standards, regenerate with stronger emphasis on quality
@@ -208,11 +216,10 @@ Requirements:
 
 Enhanced version:"""
 
-        return self._call_openai(enhance_prompt)
+        return enhance_prompt
 
-    def _generate_single_post(self, story: Dict, post_type: str) -> str:
-        """Generate a single post from a story"""
-        # Get appropriate template
+    def _get_template(self, post_type: str) -> Union[str, Dict]:
+        """Get the template for a post type"""
         template = None
         if post_type == 'pivot':
             template = self.templates.get_pivot_template()
@@ -225,16 +232,88 @@ Enhanced version:"""
         
         if not template:
             raise ValueError(f"Invalid post type: {post_type}")
+        return template
+
+    def _generate_single_post(self, story: Dict, post_type: str) -> str:
+        """Generate a single post from a story"""
+        return self.llm.run(self._agenerate_single_post(story, post_type))
+
+    async def _agenerate_single_post(self, story: Dict, post_type: str, use_cache: bool = True,
+                                     max_tokens: Optional[int] = None) -> str:
+        """Generate a single post from a story without blocking the event loop.
+
+        use_cache=False skips the LLM response cache, so a regeneration gets
+        a fresh completion instead of the draft it is replacing. max_tokens
+        caps the completion tokens of the whole post, split between the
+        draft and the enhancement pass.
+        """
+        call_tokens = 800 if max_tokens is None else max(1, min(800, max_tokens // 2))
+        
+        # Get appropriate template
+        template = self._get_template(post_type)
         
         # Generate initial content
         prompt = self._prepare_story_prompt(story, template)
-        content = self._call_openai(prompt)
+        content = await self._acall_openai(prompt, use_cache=use_cache, max_tokens=call_tokens)
         
         # Enhance content
-        enhanced_content = self._enhance_content(content)
+        enhanced_content = await self._aenhance_content(content, use_cache, call_tokens)
         
         return enhanced_content
 
+    def stream_post(self, prompt: str) -> Iterator[Tuple[str, Dict]]:
+        """Generate a post as (event, data) pairs: draft tokens, then enhancement tokens.
+
+        Events are 'phase' when a pass starts, 'token' for each chunk and a
+        final 'post' with the enhanced content.
+        """
+        yield 'phase', {'phase': 'draft'}
+        draft = []
+        for chunk in self._stream_openai(prompt):
+            draft.append(chunk)
+            yield 'token', {'phase': 'draft', 'text': chunk}
+        draft = ''.join(draft)
+
+        yield 'phase', {'phase': 'enhance'}
+        enhanced = []
+        for chunk in self._stream_openai(self._build_enhance_prompt(draft)):
+            enhanced.append(chunk)
+            yield 'token', {'phase': 'enhance', 'text': chunk}
+        yield 'post', {'draft': draft, 'content': ''.join(enhanced)}
+
+    def stream_single_post(self, story: Dict, post_type: str) -> Iterator[Tuple[str, Dict]]:
+        """Streaming version of _generate_single_post"""
+        prompt = self._prepare_story_prompt(story, self._get_template(post_type))
+        return self.stream_post(prompt)
+
+    def _story_post_type(self, story: Dict) -> str:
+        """Map a stored story's type onto a template post type"""
+        story_type = (story.get('story_type') or story.get('type') or '').lower()
+        if 'pivot' in story_type:
+            return 'pivot'
+        if 'success' in story_type or 'growth' in story_type:
+            return 'success'
+        return 'innovation'
+
+    def generate_single_post(self, story: Dict) -> Dict:
+        """Generate a post for a stored story"""
+        return self.llm.run(self.agenerate_single_post(story))
+
+    async def agenerate_single_post(self, story: Dict, use_cache: bool = True,
+                                    max_tokens: Optional[int] = None) -> Dict:
+        """Generate a post for a stored story without blocking the event loop"""
+        post_type = self._story_post_type(story)
+        content = await self._agenerate_single_post(story, post_type, use_cache, max_tokens)
+        return {
+            'content': content,
+            'type': post_type,
+            'story_id': story.get('id'),
+            'story_title': story.get('title', ''),
+            'company_name': story.get('company_name', ''),
+            'industry': story.get('industry', ''),
+            'generated_at': datetime.now().isoformat()
+        }
+
     def generate_multiple_posts(self, num_posts: int = 3) -> List[str]:
         """Generate multiple unique posts in parallel"""
         # Collect fresh stories
@@ -246,26 +325,24 @@ Enhanced version:"""
             for story in stories[:num_posts]:
                 tasks.append((story, post_type.replace('_stories', '')))
         
-        # Generate posts in parallel
+        # Generate posts concurrently on the shared LLM client
+        tasks = tasks[:num_posts]  # Limit to requested number of posts
+        results = self.llm.run_many([
+            self._agenerate_single_post(story, post_type)
+            for story, post_type in tasks
+        ])
+        
         posts = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_task = {
-                executor.submit(self._generate_single_post, story, post_type): (story, post_type)
-                for story, post_type in tasks[:num_posts]  # Limit to requested number of posts
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_task):
-                story, post_type = future_to_task[future]
-                try:
-                    post = future.result()
-                    posts.append({
-                        'content': post,
-                        'type': post_type,
-                        'story_title': story.get('title', ''),
-                        'generated_at': datetime.now().isoformat()
-                    })
-                except Exception as e:
-                    self.logger.error(f"Error generating post: {e}")
+        for (story, post_type), result in zip(tasks, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error generating post: {result}")
+                continue
+            posts.append({
+                'content': result,
+                'type': post_type,
+                'story_title': story.get('title', ''),
+                'generated_at': datetime.now().isoformat()
+            })
         
         return posts
 
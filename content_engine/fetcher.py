@@ -0,0 +1,214 @@
+import os
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from .lazy_imports import lazy_import
+from .http_cache import HTTPCache, get_http_cache, make_request_key
+
+# Statuses worth retrying after a backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+newspaper = lazy_import('newspaper')
+
+
+def _parse_host_rates(spec: str) -> Dict[str, float]:
+    """Parse per-host rates in the form 'duckduckgo.com=0.5,newsapi.org=1'"""
+    rates = {}
+    for item in spec.split(','):
+        if '=' in item:
+            host, rate = item.split('=', 1)
+            rates[host.strip()] = float(rate)
+    return rates
+
+
+class TokenBucket:
+    """Blocking token bucket rate limiter"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until a token is available and take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchEngine:
+    """Shared HTTP fetcher for the story collector.
+
+    All requests go through one pooled session with per-host token bucket
+    rate limits and concurrency caps, timeouts, and retries with jittered
+    exponential backoff. Responses are kept in the on-disk HTTP cache and
+    revalidated with conditional requests. Independent hosts are fetched in
+    parallel on a shared worker pool.
+    """
+
+    def __init__(self, max_workers: int = None, per_host_concurrency: int = None,
+                 default_rate: float = None, host_rates: Dict[str, float] = None,
+                 timeout: float = None, max_retries: int = None, backoff: float = 0.5,
+                 cache: Optional[HTTPCache] = None):
+        self.max_workers = max_workers or int(os.getenv('FETCH_MAX_WORKERS', 16))
+        self.per_host_concurrency = per_host_concurrency or int(os.getenv('FETCH_PER_HOST_CONCURRENCY', 4))
+        self.default_rate = default_rate or float(os.getenv('FETCH_RATE', 2))
+        self.host_rates = {'duckduckgo.com': 0.5}
+        self.host_rates.update(
+            host_rates if host_rates is not None
+            else _parse_host_rates(os.getenv('FETCH_HOST_RATES', ''))
+        )
+        self.timeout = timeout or float(os.getenv('FETCH_TIMEOUT', 10))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('FETCH_RETRIES', 2))
+        self.backoff = backoff
+        self.cache = cache if cache is not None else get_http_cache()
+        self.logger = logging.getLogger(__name__)
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'LinkedInContentAI/1.0'
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fetch')
+        self._local = threading.local()
+        self._buckets = {}
+        self._host_slots = {}
+        self._lock = threading.Lock()
+
+    def _host_key(self, host: str) -> str:
+        host = host.lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.host_rates.get(host, self.default_rate))
+            return self._buckets[host]
+
+    @contextmanager
+    def _host_slot(self, host: str):
+        with self._lock:
+            slot = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.per_host_concurrency))
+        with slot:
+            yield
+
+    def throttle(self, host: str):
+        """Wait for the host's rate limit; for clients that do their own HTTP"""
+        self._bucket(self._host_key(host)).acquire()
+
+    def get(self, url: str, params: Dict = None, headers: Dict = None,
+            timeout: float = None, use_cache: bool = True) -> requests.Response:
+        """GET a URL through the HTTP cache, fetching or revalidating when needed"""
+        if self.cache is None or not use_cache:
+            return self._fetch(url, params, headers, timeout)
+
+        key = make_request_key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.fresh:
+            return entry.to_response()
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.validators())
+        response = self._fetch(url, params, request_headers, timeout)
+        if response.status_code == 304 and entry is not None:
+            return self.cache.revalidated(entry, response)
+        self.cache.store(key, response)
+        return response
+
+    def _fetch(self, url: str, params: Dict = None, headers: Dict = None,
+               timeout: float = None) -> requests.Response:
+        """GET a URL, retrying connection errors and retryable statuses"""
+        host = self._host_key(urlparse(url).netloc)
+        for attempt in range(self.max_retries + 1):
+            self._bucket(host).acquire()
+            response, error = None, None
+            with self._host_slot(host):
+                try:
+                    response = self.session.get(url, params=params, headers=headers,
+                                                timeout=timeout or self.timeout)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+            if attempt == self.max_retries:
+                if response is not None:
+                    return response
+                raise error
+
+            delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            self.logger.debug(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 1})")
+            time.sleep(delay)
+
+    def download_article(self, url: str) -> 'newspaper.Article':
+        """Download a page through the engine and parse it with newspaper"""
+        response = self.get(url)
+        response.raise_for_status()
+        article = newspaper.Article(url)
+        article.download(input_html=response.text)
+        article.parse()
+        return article
+
+    def _run(self, func: Callable, item):
+        self._local.in_worker = True
+        try:
+            return func(item)
+        finally:
+            self._local.in_worker = False
+
+    def map(self, func: Callable, items: List) -> List:
+        """Apply func to items in parallel, returning results or exceptions in input order"""
+        if getattr(self._local, 'in_worker', False):
+            # Already on a fetch worker; run inline so nested calls can't starve the pool
+            futures = None
+        else:
+            futures = [self._executor.submit(self._run, func, item) for item in items]
+
+        results = []
+        for index, item in enumerate(items):
+            try:
+                results.append(futures[index].result() if futures else func(item))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def fetch_many(self, urls: List[str]) -> List[Optional[requests.Response]]:
+        """GET several URLs in parallel; failed fetches come back as None"""
+        return [
+            None if isinstance(result, Exception) else result
+            for result in self.map(self.get, urls)
+        ]
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def get_fetch_engine() -> FetchEngine:
+    """Get the process-wide fetch engine"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = FetchEngine()
+        return _default_engine
@@ -0,0 +1,263 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+def make_request_key(url: str, params: Dict = None) -> str:
+    """Hash a request URL and its query params.
+
+    Only the hash is stored, so API keys passed as query params never
+    end up on disk.
+    """
+    payload = json.dumps({'url': url, 'params': params or {}}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a directive dict"""
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _strip_query(url: str) -> str:
+    """Drop the query string so credentials in it aren't stored"""
+    return (url or '').split('?', 1)[0]
+
+
+class CachedEntry:
+    """A stored response and its freshness metadata"""
+
+    def __init__(self, key: str, url: str, status: int, headers: Dict, body: bytes,
+                 expires_at: float):
+        self.key = key
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.headers.get('ETag'):
+            headers['If-None-Match'] = self.headers['ETag']
+        if self.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a requests.Response from the stored entry"""
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.url = self.url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+class HTTPCache:
+    """On-disk HTTP response cache honoring Cache-Control, ETag and Last-Modified.
+
+    Successful GET responses are stored in SQLite under a hash of the request.
+    Fresh entries are served without a request; stale entries with validators
+    are revalidated with a conditional request, and a 304 refreshes them. The
+    cache is capped by total body size with least recently used eviction.
+    """
+
+    def __init__(self, db_path: str = None, max_bytes: int = None, default_ttl: float = None):
+        self.db_path = db_path or os.getenv('HTTP_CACHE_PATH', 'http_cache.db')
+        self.max_bytes = max_bytes or int(os.getenv('HTTP_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+        self.default_ttl = default_ttl if default_ttl is not None else float(os.getenv('HTTP_CACHE_DEFAULT_TTL', 3600))
+        self._counters = {'hits': 0, 'stale': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the cache table if it doesn't exist"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_http_cache_last_access
+                ON http_cache (last_access)
+            """)
+            conn.commit()
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _ttl(self, headers: Dict) -> Optional[float]:
+        """Freshness lifetime for a response, or None if it must not be stored"""
+        directives = _parse_cache_control(headers.get('Cache-Control'))
+        if 'no-store' in directives or 'private' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0.0
+        for directive in ('s-maxage', 'max-age'):
+            if (directives.get(directive) or '').isdigit():
+                return float(directives[directive])
+
+        expires = _http_date(headers.get('Expires'))
+        if expires is not None:
+            return max(0.0, expires - (_http_date(headers.get('Date')) or time.time()))
+
+        last_modified = _http_date(headers.get('Last-Modified'))
+        if last_modified is not None:
+            # Heuristic freshness: 10% of the time since last modification
+            return min(self.default_ttl, max(0.0, 0.1 * (time.time() - last_modified)))
+        return self.default_ttl
+
+    def lookup(self, key: str) -> Optional[CachedEntry]:
+        """Get a stored entry, fresh or stale"""
+        with self._connect() as conn:
+            row = conn.execute("""
+                SELECT url, status, headers, body, expires_at
+                FROM http_cache WHERE cache_key = ?
+            """, (key,)).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+            conn.execute("UPDATE http_cache SET last_access = ? WHERE cache_key = ?", (time.time(), key))
+            conn.commit()
+        url, status, headers, body, expires_at = row
+        entry = CachedEntry(key, url, status, CaseInsensitiveDict(json.loads(headers)), body, expires_at)
+        self._count('hits' if entry.fresh else 'stale')
+        return entry
+
+    def store(self, key: str, response: requests.Response):
+        """Store a successful response if its headers allow it"""
+        if response.status_code != 200:
+            return
+        headers = CaseInsensitiveDict(response.headers)
+        ttl = self._ttl(headers)
+        if ttl is None:
+            return
+        if ttl == 0 and not ('ETag' in headers or 'Last-Modified' in headers):
+            # Would need revalidating on every use and can't be revalidated
+            return
+
+        body = response.content
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO http_cache
+                    (cache_key, url, status, headers, body, size, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, _strip_query(response.url), response.status_code, json.dumps(dict(headers)),
+                  body, len(body), now + ttl, now))
+            self._evict(conn)
+            conn.commit()
+        self._count('stores')
+
+    def revalidated(self, entry: CachedEntry, response: requests.Response) -> requests.Response:
+        """Refresh a stale entry after a 304 and return the cached response"""
+        headers = CaseInsensitiveDict(entry.headers)
+        for name in ('Cache-Control', 'Expires', 'Date', 'ETag', 'Last-Modified'):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        ttl = self._ttl(headers) or 0.0
+        entry.headers = headers
+        entry.expires_at = time.time() + ttl
+        with self._connect() as conn:
+            conn.execute("""
+                UPDATE http_cache SET headers = ?, expires_at = ?, last_access = ?
+                WHERE cache_key = ?
+            """, (json.dumps(dict(headers)), entry.expires_at, time.time(), entry.key))
+            conn.commit()
+        self._count('revalidated')
+        return entry.to_response()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in conn.execute("SELECT cache_key, size FROM http_cache ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM http_cache WHERE cache_key = ?", (key,))
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._counters['evictions'] += evicted
+
+    def clear(self):
+        """Remove all entries"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM http_cache")
+            conn.commit()
+
+    def stats(self) -> Dict:
+        """Get cache hit/miss counters and size"""
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache"
+            ).fetchone()
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters['hits'] + counters['stale'] + counters['misses']
+        served = counters['hits'] + counters['revalidated']
+        return {
+            **counters,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hit_rate': served / lookups if lookups else 0.0
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Get the process-wide HTTP cache, or None if HTTP_CACHE_ENABLED is off"""
+    global _default_cache
+    if os.getenv('HTTP_CACHE_ENABLED', '1').lower() in ('0', 'false', 'no'):
+        return None
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = HTTPCache()
+    return _default_cache
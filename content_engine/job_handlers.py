@@ -0,0 +1,85 @@
+from typing import Dict
+from .job_queue import JobRejected, register_job
+from .services import get_services
+
+
+@register_job('generate_content')
+def generate_content(payload: Dict) -> Dict:
+    """Topic-based generation, as served by /generate-post"""
+    params = {
+        'topic': payload.get('topic'),
+        'industry': payload.get('industry'),
+        'tone': payload.get('tone', 'professional'),
+        'story_type': payload.get('story_type', 'insight')
+    }
+    return {'content': get_services().content_generator.generate_content(params)}
+
+
+def build_company_post(company_name: str, industry: str) -> Dict:
+    """Run the settings, story and generation pipeline for one company"""
+    services = get_services()
+    generator = services.generator
+    settings = services.recommender.get_recommended_settings(company_name, industry)
+    story = services.collector.collect_story(company_name, industry)
+    if not story:
+        raise ValueError('Could not find company story')
+
+    content = generator._generate_single_post(story, settings['post_type'])
+    return {
+        'content': content,
+        'company_name': company_name,
+        'industry': industry,
+        'post_type': settings['post_type'],
+        'metrics': generator.quality_metrics
+    }
+
+
+@register_job('generate_story_post')
+def generate_story_post(payload: Dict) -> Dict:
+    """Company story post, as served by /api/generate"""
+    post = build_company_post(payload['company_name'], payload.get('industry'))
+    post_id = get_services().recommender.save_post(batch_id=payload.get('batch_id'), **post)
+    return {'post_id': post_id, 'content': post['content']}
+
+
+@register_job('generate_batch')
+def generate_batch(payload: Dict) -> Dict:
+    """Feedback batch of company posts, as served by /api/generate-batch"""
+    services = get_services()
+    recommender = services.recommender
+    company_names = payload.get('company_names', [])
+    industry = payload.get('industry')
+
+    rejection = recommender.check_new_batch(company_names, industry)
+    if rejection:
+        raise JobRejected(rejection['error'])
+
+    batch_id = recommender.create_batch()
+    futures = [
+        (company_name, services.batch_executor.submit(build_company_post, company_name, industry))
+        for company_name in company_names[:recommender.MAX_BATCH_COMPANIES]
+    ]
+    posts = []
+    errors = []
+    for company_name, future in futures:
+        try:
+            posts.append(future.result())
+        except Exception as e:
+            errors.append({'company_name': company_name, 'error': str(e)})
+
+    post_ids = recommender.save_posts(posts, batch_id=batch_id)
+    return {
+        'batch_id': batch_id,
+        'posts': [
+            {'post_id': post_id, 'content': post['content'], 'company_name': post['company_name']}
+            for post_id, post in zip(post_ids, posts)
+        ],
+        'errors': errors
+    }
+
+
+@register_job('generate_posts')
+def generate_posts(payload: Dict) -> Dict:
+    """Auto-recommender batch, as served by /api/generate_posts"""
+    result = get_services().auto_recommender.generate_batch_posts(payload.get('count', 5))
+    return {'posts': result['posts'], 'failures': result['failures']}
@@ -0,0 +1,331 @@
+import os
+import json
+import time
+import signal
+import sqlite3
+import logging
+import threading
+import multiprocessing
+from typing import Callable, Dict, List, Optional
+
+JOB_STATUSES = ('queued', 'running', 'succeeded', 'failed')
+
+# Registered job handlers, keyed by job type
+JOB_HANDLERS: Dict[str, Callable[[Dict], Dict]] = {}
+
+
+def register_job(job_type: str):
+    """Register a function as the handler for a job type"""
+    def decorator(func):
+        JOB_HANDLERS[job_type] = func
+        return func
+    return decorator
+
+
+class JobRejected(Exception):
+    """Raised by a handler for errors another attempt cannot fix"""
+
+
+class JobQueue:
+    """SQLite-backed job queue with retries and result storage"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.getenv('JOB_QUEUE_PATH', 'jobs.db')
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Create the jobs table if it doesn't exist"""
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    result TEXT,
+                    error TEXT,
+                    worker TEXT,
+                    run_after REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after
+                ON jobs (status, run_after)
+            """)
+        finally:
+            conn.close()
+
+    def enqueue(self, job_type: str, payload: Dict, max_attempts: int = 3) -> int:
+        """Add a job to the queue and return its ID"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute("""
+                INSERT INTO jobs (job_type, payload, max_attempts, run_after, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (job_type, json.dumps(payload), max_attempts, now, now))
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    def claim(self, worker: str) -> Optional[Dict]:
+        """Atomically claim the oldest runnable job"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("""
+                SELECT job_id FROM jobs
+                WHERE status = 'queued' AND run_after <= ?
+                ORDER BY job_id
+                LIMIT 1
+            """, (now,)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute("""
+                UPDATE jobs
+                SET status = 'running', attempts = attempts + 1,
+                    worker = ?, started_at = ?
+                WHERE job_id = ?
+            """, (worker, now, row['job_id']))
+            conn.execute("COMMIT")
+        except Exception:
+            # BEGIN itself may have failed (e.g. database locked past the timeout)
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return self.get(row['job_id'])
+
+    def complete(self, job_id: int, worker: str, result: Dict) -> bool:
+        """Store a job's result and mark it as succeeded.
+
+        Only the worker currently running the job may finish it. Returns
+        False if the job was re-queued or claimed by another worker in the
+        meantime, in which case nothing is written.
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute("""
+                UPDATE jobs
+                SET status = 'succeeded', result = ?, error = NULL, finished_at = ?
+                WHERE job_id = ? AND worker = ? AND status = 'running'
+            """, (json.dumps(result, default=str), time.time(), job_id, worker))
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def fail(self, job_id: int, worker: str, error: str, retry: bool = True) -> bool:
+        """Record a failure, re-queueing with backoff until attempts run out.
+
+        With retry=False the job is marked failed straight away, for errors
+        another attempt cannot fix. Like complete(), returns False without
+        writing anything if the worker no longer owns the job.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("""
+                SELECT attempts, max_attempts FROM jobs
+                WHERE job_id = ? AND worker = ? AND status = 'running'
+            """, (job_id, worker)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return False
+            if retry and row['attempts'] < row['max_attempts']:
+                conn.execute("""
+                    UPDATE jobs
+                    SET status = 'queued', error = ?, run_after = ?
+                    WHERE job_id = ?
+                """, (error, now + 2 ** row['attempts'], job_id))
+            else:
+                conn.execute("""
+                    UPDATE jobs
+                    SET status = 'failed', error = ?, finished_at = ?
+                    WHERE job_id = ?
+                """, (error, now, job_id))
+            conn.execute("COMMIT")
+            return True
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def requeue_stale(self, timeout: float) -> int:
+        """Re-queue running jobs whose worker has not finished within timeout.
+
+        A stale job that has already used all its attempts is marked failed
+        instead. Returns the number of jobs re-queued.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                UPDATE jobs
+                SET status = 'failed', error = 'Worker did not finish in time', finished_at = ?
+                WHERE status = 'running' AND started_at < ? AND attempts >= max_attempts
+            """, (now, now - timeout))
+            cursor = conn.execute("""
+                UPDATE jobs
+                SET status = 'queued', run_after = ?
+                WHERE status = 'running' AND started_at < ?
+            """, (now, now - timeout))
+            conn.execute("COMMIT")
+            return cursor.rowcount
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        """Get a job by ID"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of jobs in each status"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        finally:
+            conn.close()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row['status']: row['count'] for row in rows})
+        return counts
+
+
+def run_worker(db_path: str, stop_event=None, poll_interval: float = 1.0):
+    """Claim and run jobs until stop_event is set"""
+    # Importing the handlers registers them with JOB_HANDLERS
+    from content_engine import job_handlers  # noqa: F401
+
+    logger = logging.getLogger(__name__)
+    queue = JobQueue(db_path)
+    worker = f"{os.uname().nodename}:{os.getpid()}"
+    stop_event = stop_event or threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    claim_errors = 0
+    while not stop_event.is_set():
+        try:
+            job = queue.claim(worker)
+            claim_errors = 0
+        except Exception as e:
+            # e.g. "database is locked" under heavy contention; back off and try again
+            claim_errors += 1
+            delay = min(poll_interval * 2 ** claim_errors, 60)
+            logger.error(f"Worker {worker} could not claim a job ({str(e)}), retrying in {delay:.0f}s")
+            stop_event.wait(delay)
+            continue
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+
+        handler = JOB_HANDLERS.get(job['job_type'])
+        if handler is None:
+            queue.fail(job['job_id'], worker, f"Unknown job type: {job['job_type']}", retry=False)
+            continue
+
+        try:
+            logger.info(f"Running job {job['job_id']} ({job['job_type']}), attempt {job['attempts']}")
+            owned = queue.complete(job['job_id'], worker, handler(job['payload']))
+        except JobRejected as e:
+            logger.warning(f"Job {job['job_id']} rejected: {str(e)}")
+            owned = queue.fail(job['job_id'], worker, str(e), retry=False)
+        except Exception as e:
+            logger.error(f"Job {job['job_id']} failed: {str(e)}")
+            owned = queue.fail(job['job_id'], worker, str(e))
+        if not owned:
+            logger.warning(
+                f"Job {job['job_id']} was re-queued while {worker} was running it; result discarded"
+            )
+
+
+class WorkerPool:
+    """Pool of worker processes consuming a JobQueue.
+
+    The supervising process should call maintain() regularly; it re-queues
+    jobs whose worker died or hung, at most every stale_check_interval
+    seconds.
+    """
+
+    def __init__(self, num_workers: int = None, db_path: str = None, poll_interval: float = 1.0,
+                 stale_timeout: float = 600, stale_check_interval: float = None):
+        self.num_workers = num_workers or int(os.getenv('JOB_WORKERS', 2))
+        self.queue = JobQueue(db_path)
+        self.poll_interval = poll_interval
+        self.stale_timeout = stale_timeout
+        self.stale_check_interval = stale_check_interval or float(os.getenv('JOB_STALE_CHECK_INTERVAL', 60))
+        self.logger = logging.getLogger(__name__)
+        self._stop_event = multiprocessing.Event()
+        self._processes: List[multiprocessing.Process] = []
+        self._last_stale_check = 0.0
+
+    def requeue_stale(self) -> int:
+        """Re-queue jobs that have been running longer than stale_timeout"""
+        self._last_stale_check = time.monotonic()
+        requeued = self.queue.requeue_stale(self.stale_timeout)
+        if requeued:
+            self.logger.warning(f"Re-queued {requeued} stale jobs")
+        return requeued
+
+    def maintain(self) -> int:
+        """Periodic supervisor work; returns the number of jobs re-queued"""
+        if time.monotonic() - self._last_stale_check < self.stale_check_interval:
+            return 0
+        return self.requeue_stale()
+
+    def start(self):
+        """Start the worker processes"""
+        self.requeue_stale()
+        for i in range(self.num_workers):
+            process = multiprocessing.Process(
+                target=run_worker,
+                args=(self.queue.db_path, self._stop_event, self.poll_interval),
+                name=f"job-worker-{i}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 30):
+        """Signal workers to stop after their current job and wait for them"""
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def alive(self) -> int:
+        """Number of worker processes still running"""
+        return sum(1 for process in self._processes if process.is_alive())
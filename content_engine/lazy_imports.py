@@ -0,0 +1,50 @@
+import sys
+import importlib
+import threading
+from types import ModuleType
+from typing import Dict, Iterable
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access.
+
+    `newspaper = lazy_import('newspaper')` at module level costs nothing;
+    the real import happens the first time code touches newspaper.build or
+    similar, and a missing package raises ImportError at that point.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__['_module']
+        if module is None:
+            with self.__dict__['_lock']:
+                module = self.__dict__['_module']
+                if module is None:
+                    module = importlib.import_module(self.__dict__['_name'])
+                    self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Get a lazy handle on a module, or the module itself if already imported"""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def loaded_modules(names: Iterable[str]) -> Dict[str, bool]:
+    """Which of the given top-level modules have actually been imported"""
+    return {name: name in sys.modules for name in names}
@@ -0,0 +1,235 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+
+def make_cache_key(model: str, messages: List[Dict], **params) -> str:
+    """Build a content-addressed key from the model, messages and sampling params"""
+    payload = json.dumps(
+        {'model': model, 'messages': messages, 'params': params},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class MemoryCacheBackend:
+    """In-memory LRU backend with TTL expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """Store a value, evicting the least recently used entries over capacity"""
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """On-disk SQLite backend with TTL expiry and LRU eviction"""
+
+    def __init__(self, db_path: str = "llm_cache.db", max_entries: int = 10000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the cache table if it doesn't exist"""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access
+                ON llm_cache (last_access)
+            """)
+            conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached value, or None if missing or expired"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE cache_key = ?",
+                (now, key)
+            )
+            conn.commit()
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """Store a value, evicting expired and least recently used entries"""
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                INSERT INTO llm_cache (cache_key, value, expires_at, last_access)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (cache_key)
+                DO UPDATE SET value = excluded.value,
+                              expires_at = excluded.expires_at,
+                              last_access = excluded.last_access
+            """, (key, value, expires_at, now))
+            conn.execute(
+                "DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,)
+            )
+            conn.execute("""
+                DELETE FROM llm_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_cache
+                    ORDER BY last_access DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            conn.commit()
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+            conn.commit()
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+class LLMResponseCache:
+    """Content-addressed cache for chat completion responses"""
+
+    def __init__(self, backend=None, ttl: Optional[float] = 7 * 24 * 3600):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, model: str, messages: List[Dict], **params) -> Optional[str]:
+        """Look up a response, updating hit/miss counters"""
+        value = self.backend.get(make_cache_key(model, messages, **params))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, model: str, messages: List[Dict], value: str, **params):
+        """Store a response for the given request"""
+        self.backend.set(make_cache_key(model, messages, **params), value, self.ttl)
+
+    def get_or_create(self, model: str, messages: List[Dict], create: Callable[[], str], **params) -> str:
+        """Return the cached response or call create() and cache its result"""
+        value = self.get(model, messages, **params)
+        if value is not None:
+            return value
+        value = create()
+        if value:
+            self.set(model, messages, value, **params)
+        return value
+
+    def clear(self):
+        """Drop all cached responses and reset counters"""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """Get hit/miss statistics"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'backend': type(self.backend).__name__,
+            'entries': len(self.backend),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide response cache, configured from the environment"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                max_entries = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 1024))
+                ttl = float(os.getenv('LLM_CACHE_TTL', 7 * 24 * 3600))
+                if os.getenv('LLM_CACHE_BACKEND', 'memory').lower() == 'sqlite':
+                    backend = SQLiteCacheBackend(
+                        db_path=os.getenv('LLM_CACHE_PATH', 'llm_cache.db'),
+                        max_entries=max_entries
+                    )
+                else:
+                    backend = MemoryCacheBackend(max_entries=max_entries)
+                _default_cache = LLMResponseCache(backend=backend, ttl=ttl or None)
+    return _default_cache
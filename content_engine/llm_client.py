@@ -0,0 +1,277 @@
+import os
+import queue
+import asyncio
+import logging
+import threading
+import contextvars
+from typing import AsyncIterator, Awaitable, Dict, Iterator, List, Optional
+import openai
+from .llm_cache import LLMResponseCache, get_llm_cache
+
+
+def _parse_model_limits(spec: str) -> Dict[str, int]:
+    """Parse per-model limits in the form 'gpt-4=4,gpt-3.5-turbo=16'"""
+    limits = {}
+    for item in spec.split(','):
+        if '=' in item:
+            model, limit = item.split('=', 1)
+            limits[model.strip()] = int(limit)
+    return limits
+
+
+class UsageMeter:
+    """Token usage of the chat completions made inside metered()"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cached_calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            'calls': self.calls,
+            'cached_calls': self.cached_calls,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'total_tokens': self.total_tokens
+        }
+
+
+_current_meter = contextvars.ContextVar('llm_usage_meter', default=None)
+
+
+async def metered(coro: Awaitable, meter: UsageMeter):
+    """Await coro, adding the usage of every achat() it makes to meter.
+
+    The meter is set inside the task, so it follows the coroutine onto the
+    client loop and into any tasks it gathers.
+    """
+    token = _current_meter.set(meter)
+    try:
+        return await coro
+    finally:
+        _current_meter.reset(token)
+
+
+class LLMClient:
+    """Asyncio chat completion client with bounded per-model concurrency.
+
+    Coroutines run on a dedicated event loop thread that owns one shared
+    aiohttp session, so blocking callers (Flask threads) use the sync
+    wrappers while async code can fan out many requests at once.
+    """
+
+    def __init__(self, cache: Optional[LLMResponseCache] = None,
+                 default_concurrency: Optional[int] = None,
+                 model_concurrency: Optional[Dict[str, int]] = None,
+                 connection_limit: Optional[int] = None,
+                 request_timeout: Optional[float] = None):
+        self.cache = cache if cache is not None else get_llm_cache()
+        self.default_concurrency = default_concurrency or int(os.getenv('LLM_CONCURRENCY', 8))
+        self.model_concurrency = (
+            model_concurrency if model_concurrency is not None
+            else _parse_model_limits(os.getenv('LLM_MODEL_CONCURRENCY', ''))
+        )
+        self.connection_limit = connection_limit or int(os.getenv('LLM_CONNECTION_LIMIT', 32))
+        self.request_timeout = request_timeout or float(os.getenv('LLM_REQUEST_TIMEOUT', 120))
+        self.logger = logging.getLogger(__name__)
+        self._semaphores = {}
+        self._session = None
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='llm-client-loop',
+                    daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a model"""
+        if model not in self._semaphores:
+            limit = self.model_concurrency.get(model, self.default_concurrency)
+            self._semaphores[model] = asyncio.Semaphore(limit)
+        return self._semaphores[model]
+
+    async def _get_session(self):
+        """Get the shared HTTP session, creating it on the client loop"""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit)
+            )
+        return self._session
+
+    async def achat(self, messages: List[Dict], model: str, temperature: float = 0.7,
+                    max_tokens: int = 800, use_cache: bool = True) -> str:
+        """Run a chat completion, serving repeated requests from the cache"""
+        if use_cache:
+            cached = self.cache.get(model, messages, temperature=temperature, max_tokens=max_tokens)
+            if cached is not None:
+                meter = _current_meter.get()
+                if meter is not None:
+                    meter.cached_calls += 1
+                return cached
+
+        async with self._semaphore(model):
+            session = await self._get_session()
+            token = openai.aiosession.set(session)
+            try:
+                response = await openai.ChatCompletion.acreate(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    request_timeout=self.request_timeout
+                )
+            finally:
+                openai.aiosession.reset(token)
+
+        meter = _current_meter.get()
+        if meter is not None:
+            usage = response.get('usage') or {}
+            meter.calls += 1
+            meter.prompt_tokens += usage.get('prompt_tokens', 0)
+            meter.completion_tokens += usage.get('completion_tokens', 0)
+
+        content = response.choices[0].message.content
+        if use_cache and content:
+            self.cache.set(model, messages, content, temperature=temperature, max_tokens=max_tokens)
+        return content
+
+    async def astream(self, messages: List[Dict], model: str, temperature: float = 0.7,
+                      max_tokens: int = 800, use_cache: bool = True) -> AsyncIterator[str]:
+        """Stream a chat completion as content chunks; a cached response arrives as one chunk"""
+        if use_cache:
+            cached = self.cache.get(model, messages, temperature=temperature, max_tokens=max_tokens)
+            if cached is not None:
+                meter = _current_meter.get()
+                if meter is not None:
+                    meter.cached_calls += 1
+                yield cached
+                return
+
+        parts = []
+        async with self._semaphore(model):
+            session = await self._get_session()
+            token = openai.aiosession.set(session)
+            try:
+                response = await openai.ChatCompletion.acreate(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    request_timeout=self.request_timeout,
+                    stream=True
+                )
+                async for chunk in response:
+                    text = chunk.choices[0].delta.get('content')
+                    if text:
+                        parts.append(text)
+                        yield text
+            finally:
+                openai.aiosession.reset(token)
+
+        # Streamed responses don't report token usage
+        meter = _current_meter.get()
+        if meter is not None:
+            meter.calls += 1
+
+        content = ''.join(parts)
+        if use_cache and content:
+            self.cache.set(model, messages, content, temperature=temperature, max_tokens=max_tokens)
+
+    def stream(self, messages: List[Dict], model: str, temperature: float = 0.7,
+               max_tokens: int = 800, use_cache: bool = True) -> Iterator[str]:
+        """Blocking iterator over astream() chunks for synchronous callers.
+
+        Closing the iterator early (e.g. a client disconnecting from an SSE
+        response) cancels the underlying request.
+        """
+        chunks = queue.Queue()
+        done = object()
+
+        async def pump():
+            try:
+                async for chunk in self.astream(messages, model, temperature, max_tokens, use_cache):
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(done)
+
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("LLMClient.stream() cannot be called from the client loop; use astream() instead")
+        future = asyncio.run_coroutine_threadsafe(pump(), loop)
+        try:
+            while True:
+                item = chunks.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    def run(self, coro: Awaitable):
+        """Run a coroutine on the client loop and block until it finishes"""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("LLMClient.run() cannot be called from the client loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def run_many(self, coros: List[Awaitable]) -> List:
+        """Run coroutines concurrently, returning results or exceptions in input order"""
+        async def gather():
+            return await asyncio.gather(*coros, return_exceptions=True)
+        return self.run(gather())
+
+    def chat(self, messages: List[Dict], model: str, temperature: float = 0.7,
+             max_tokens: int = 800, use_cache: bool = True) -> str:
+        """Blocking wrapper around achat() for synchronous callers"""
+        return self.run(self.achat(messages, model, temperature, max_tokens, use_cache))
+
+    def close(self):
+        """Close the shared session and stop the event loop"""
+        if self._loop is None:
+            return
+        if self._session is not None and not self._session.closed:
+            self.run(self._session.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._semaphores = {}
+
+
+_default_client = None
+_default_client_pid = None
+_default_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Get the process-wide LLM client (recreated after fork)"""
+    global _default_client, _default_client_pid
+    if _default_client is None or _default_client_pid != os.getpid():
+        with _default_client_lock:
+            if _default_client is None or _default_client_pid != os.getpid():
+                _default_client = LLMClient()
+                _default_client_pid = os.getpid()
+    return _default_client
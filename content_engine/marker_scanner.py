@@ -0,0 +1,129 @@
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+from .phrase_matcher import PhraseMatcher
+
+AUTHENTICITY_PHRASES = {
+    'named_sources': ["according to", "said", "stated", "ceo", "founder", "director", "leader"],
+    'verifiable_facts': ["reported", "announced", "published", "confirmed", "launched", "achieved", "milestone"]
+}
+
+INSIGHT_PHRASES = {
+    'behind_scenes': [
+        "internally", "behind the scenes", "within the company",
+        "process", "system", "building", "development", "integration"
+    ],
+    'counter_intuitive': [
+        "surprisingly", "contrary to", "unexpected", "unlike",
+        "instead of", "rather than", "despite", "however"
+    ],
+    'industry_specific': [
+        "in the industry", "sector-specific", "market dynamics",
+        "landscape", "segment", "vertical", "market"
+    ],
+    'decision_rationale': [
+        "decided to", "chose to", "reasoning behind",
+        "strategy", "approach", "solution", "method"
+    ],
+    'failure_lessons': [
+        "learned from", "mistake", "challenge", "hurdle",
+        "obstacle", "issue", "problem", "difficulty"
+    ]
+}
+
+# Punctuation the authenticity checks look for anywhere in the post
+PUNCTUATION = {
+    'separators': [',', '-'],
+    'quotes': ['"']
+}
+
+MARKER_NAMES = list(AUTHENTICITY_PHRASES) + list(INSIGHT_PHRASES) + list(PUNCTUATION) + ['numbers']
+
+# Posts shorter than this are scanned with the trie pattern, which has less
+# fixed cost per call; longer posts use one substring search per phrase,
+# which scales better (see scripts/benchmark_marker_scanner.py)
+TRIE_MAX_CHARS = int(os.getenv('MARKER_TRIE_MAX_CHARS', 120))
+
+
+class MarkerScan:
+    """Authenticity and insight features of one post.
+
+    Match positions are only collected when `positions` is first read,
+    since scoring needs no more than which markers are present.
+    """
+
+    def __init__(self, found: Set[str], spans: Callable[[], Iterable[Tuple[str, int, int]]]):
+        self.found = found
+        self._spans = spans
+        self._positions = None
+
+    @property
+    def positions(self) -> Dict[str, List[Tuple[int, int]]]:
+        """(start, end) spans for every marker"""
+        if self._positions is None:
+            positions = {name: [] for name in MARKER_NAMES}
+            for name, start, end in self._spans():
+                positions[name].append((start, end))
+            self._positions = positions
+        return self._positions
+
+    def _has(self, name: str) -> bool:
+        return name in self.found
+
+    @property
+    def authenticity(self) -> Dict[str, bool]:
+        return {
+            # A number anywhere plus a date-style separator anywhere
+            'specific_dates': self._has('numbers') and self._has('separators'),
+            'real_numbers': self._has('numbers'),
+            'named_sources': self._has('named_sources'),
+            'direct_quotes': self._has('quotes'),
+            'verifiable_facts': self._has('verifiable_facts')
+        }
+
+    @property
+    def insight(self) -> Dict[str, bool]:
+        return {name: self._has(name) for name in INSIGHT_PHRASES}
+
+
+class MarkerScanner:
+    """Scanner for post quality markers.
+
+    Numbers, punctuation and every marker phrase are looked up in one
+    lowercased copy of the post. Short posts go through the single trie
+    scan and longer ones through per-phrase substring search, whichever
+    is faster at that length. Phrases match as lowercase substrings, like
+    the checks they replace.
+    """
+
+    def __init__(self, trie_max_chars: int = None):
+        categories = {**AUTHENTICITY_PHRASES, **INSIGHT_PHRASES, **PUNCTUATION}
+        tokens = {'numbers': r'\d+'}
+        self.trie_max_chars = TRIE_MAX_CHARS if trie_max_chars is None else trie_max_chars
+        self.matcher = PhraseMatcher(categories, tokens=tokens, use_trie=False)
+        self.trie_matcher = PhraseMatcher(categories, tokens=tokens, use_trie=True)
+
+    def _matcher_for(self, content: str) -> PhraseMatcher:
+        return self.trie_matcher if len(content) < self.trie_max_chars else self.matcher
+
+    def scan(self, content: str) -> MarkerScan:
+        """Scan a post for markers; spans are available via .positions"""
+        matcher = self._matcher_for(content)
+        return MarkerScan(matcher.categories_found(content), lambda: matcher.finditer(content))
+
+    def scan_many(self, contents: List[str]) -> List[MarkerScan]:
+        return [self.scan(content) for content in contents]
+
+
+_default_scanner = None
+_default_scanner_lock = threading.Lock()
+
+
+def get_marker_scanner() -> MarkerScanner:
+    """Get the shared marker scanner"""
+    global _default_scanner
+    if _default_scanner is None:
+        with _default_scanner_lock:
+            if _default_scanner is None:
+                _default_scanner = MarkerScanner()
+    return _default_scanner
@@ -0,0 +1,102 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, List
+from .fetcher import get_fetch_engine
+from .lazy_imports import lazy_import
+
+newspaper = lazy_import('newspaper')
+
+
+class NewsSourceCache:
+    """Caches parsed articles from news source front pages for a refresh window.
+
+    Each source is built with newspaper once per TTL and its first few
+    articles are downloaded and parsed once, so matching a story against
+    recent news is an in-memory scan.
+    """
+
+    def __init__(self, ttl: float = None, articles_per_source: int = 5, fetcher=None):
+        self.fetcher = fetcher or get_fetch_engine()
+        self.ttl = ttl or float(os.getenv('NEWS_CACHE_TTL', 3600))
+        self.articles_per_source = articles_per_source
+        self.logger = logging.getLogger(__name__)
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _source_lock(self, source: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(source, threading.Lock())
+
+    def _build_source(self, source: str) -> List[Dict]:
+        """Build a source index and parse its first articles"""
+        paper = newspaper.build(source, memoize_articles=False)
+        urls = [article.url for article in paper.articles[:self.articles_per_source]]
+        
+        articles = []
+        for article in self.fetcher.map(self.fetcher.download_article, urls):
+            if isinstance(article, Exception):
+                continue
+            articles.append({
+                'title': article.title,
+                'url': article.url,
+                'text': article.text,
+                'text_lower': article.text.lower(),
+                'published_date': article.publish_date.isoformat() if article.publish_date else None
+            })
+        return articles
+
+    def get_articles(self, source: str) -> List[Dict]:
+        """Get parsed articles for a source, rebuilding once the entry expires"""
+        entry = self._entries.get(source)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+
+        with self._source_lock(source):
+            # Another thread may have refreshed the source while we waited
+            entry = self._entries.get(source)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            try:
+                articles = self._build_source(source)
+            except Exception as e:
+                self.logger.error(f"Error building news source {source}: {e}")
+                # Keep serving stale articles rather than none
+                articles = entry[1] if entry else []
+            self._entries[source] = (time.monotonic(), articles)
+            return articles
+
+    def find_mentions(self, sources: List[str], name: str) -> List[Dict]:
+        """Find cached articles that mention a name"""
+        name = name.lower()
+        return [
+            {
+                'title': article['title'],
+                'url': article['url'],
+                'text': article['text'][:500],  # First 500 chars
+                'published_date': article['published_date']
+            }
+            for source in sources
+            for article in self.get_articles(source)
+            if name in article['text_lower']
+        ]
+
+    def clear(self):
+        """Drop all cached sources"""
+        with self._lock:
+            self._entries = {}
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_news_cache() -> NewsSourceCache:
+    """Get the process-wide news source cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = NewsSourceCache()
+        return _default_cache
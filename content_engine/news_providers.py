@@ -0,0 +1,298 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+
+class NewsProvider:
+    """Base class for a story search provider"""
+
+    name = 'provider'
+
+    def __init__(self, collector):
+        self.collector = collector
+
+    def search(self, query: str) -> Optional[Dict]:
+        """Return a story for the query, or None"""
+        raise NotImplementedError
+
+    def is_valid(self, result: Optional[Dict]) -> bool:
+        """Whether a result is good enough to win the race"""
+        return bool(result and result.get('title') and result.get('content'))
+
+
+class _ArticleAPIProvider(NewsProvider):
+    """Shared parsing for NewsAPI-style JSON article search"""
+
+    url = None
+    env_key = None
+
+    def _params(self, query: str, api_key: str) -> Dict:
+        raise NotImplementedError
+
+    def search(self, query: str) -> Optional[Dict]:
+        api_key = os.getenv(self.env_key)
+        if not api_key:
+            return None
+
+        response = self.collector.fetcher.get(self.url, params=self._params(query, api_key))
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        if not data['articles']:
+            return None
+        article = data['articles'][0]
+
+        # Extract company name from title or description
+        company_name = self.collector._extract_company_name(article['title'] + ' ' + article['description'])
+        if not company_name:
+            return None
+
+        return {
+            'title': article['title'],
+            'company_name': company_name,
+            'summary': article['description'],
+            'url': article['url'],
+            'source': article['source']['name'],
+            'content': article['content'] if 'content' in article else article['description']
+        }
+
+
+class NewsAPIProvider(_ArticleAPIProvider):
+    """NewsAPI everything search"""
+
+    name = 'newsapi'
+    url = 'https://newsapi.org/v2/everything'
+    env_key = 'NEWSAPI_KEY'
+
+    def _params(self, query: str, api_key: str) -> Dict:
+        return {
+            'q': query,
+            'apiKey': api_key,
+            'language': 'en',
+            'sortBy': 'relevancy',
+            'pageSize': 1
+        }
+
+
+class GNewsProvider(_ArticleAPIProvider):
+    """GNews search"""
+
+    name = 'gnews'
+    url = 'https://gnews.io/api/v4/search'
+    env_key = 'GNEWS_API_KEY'
+
+    def _params(self, query: str, api_key: str) -> Dict:
+        return {
+            'q': query,
+            'token': api_key,
+            'lang': 'en',
+            'max': 1
+        }
+
+
+class DuckDuckGoProvider(NewsProvider):
+    """DuckDuckGo search restricted to trusted business sites, then article scraping"""
+
+    name = 'duckduckgo'
+    sites = [
+        'techcrunch.com',
+        'forbes.com',
+        'hbr.org',
+        'bloomberg.com',
+        'reuters.com',
+        'fastcompany.com',
+        'inc.com',
+        'technologyreview.com',
+        'businessinsider.com',
+        'wired.com'
+    ]
+
+    def search(self, query: str) -> Optional[Dict]:
+        site_query = ' OR '.join(f'site:{site}' for site in self.sites)
+        results = self.collector.search_duckduckgo(f'{query} ({site_query})', num_results=1)
+        if not results:
+            return None
+
+        result = results[0]
+        # Use newspaper3k to extract article content
+        article = self.collector.fetcher.download_article(result['url'])
+        return {
+            'title': article.title,
+            'content': article.text,
+            'url': result['url'],
+            'source': urlparse(result['url']).netloc,
+            'published_date': article.publish_date.isoformat() if article.publish_date else datetime.now().isoformat()
+        }
+
+
+class WikipediaProvider(NewsProvider):
+    """Company background from Wikipedia"""
+
+    name = 'wikipedia'
+
+    def search(self, query: str) -> Optional[Dict]:
+        wiki_data = self.collector._get_wikipedia_data(query)
+        if not wiki_data:
+            return None
+        return {
+            'title': wiki_data['title'],
+            'summary': wiki_data.get('summary', ''),
+            'content': wiki_data.get('content', ''),
+            'url': wiki_data.get('url', ''),
+            'source': 'wikipedia',
+            'published_date': wiki_data.get('collected_at', datetime.now().isoformat())
+        }
+
+
+class ProviderStats:
+    """Rolling latency and outcome statistics for one provider"""
+
+    def __init__(self, window: int = 200):
+        self.calls = 0
+        self.hits = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, hit: bool = False, error: bool = False):
+        with self._lock:
+            self.calls += 1
+            self.hits += int(hit)
+            self.errors += int(error)
+            self.latencies.append(latency)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency percentile over the rolling window, in seconds"""
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(pct / 100 * len(latencies)))]
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            latencies = list(self.latencies)
+            calls, hits, errors = self.calls, self.hits, self.errors
+        return {
+            'calls': calls,
+            'hits': hits,
+            'errors': errors,
+            'mean_latency': sum(latencies) / len(latencies) if latencies else None,
+            'p50_latency': self.percentile(50),
+            'p95_latency': self.percentile(95)
+        }
+
+
+class ProviderChain:
+    """Registry of story providers, queried concurrently with first-good-result-wins.
+
+    In 'race' mode every provider starts at once. In 'hedged' mode providers
+    start in registration order: the next one launches as soon as a running one
+    comes back empty, or after a delay based on the latest provider's p95 latency, so a slow
+    primary no longer holds up the whole search.
+    """
+
+    MODES = ('hedged', 'race')
+
+    def __init__(self, providers: List[NewsProvider] = None, max_workers: int = None,
+                 timeout: float = None, mode: str = None, hedge_delay: float = None,
+                 hedge_max_delay: float = None, hedge_min_samples: int = 5):
+        self.providers: List[NewsProvider] = []
+        self.stats: Dict[str, ProviderStats] = {}
+        self.timeout = timeout or float(os.getenv('PROVIDER_TIMEOUT', 30))
+        self.mode = mode or os.getenv('NEWS_SEARCH_MODE', 'hedged')
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown search mode: {self.mode}")
+        self.hedge_delay = hedge_delay or float(os.getenv('HEDGE_DELAY', 2))
+        self.hedge_max_delay = hedge_max_delay or float(os.getenv('HEDGE_MAX_DELAY', 10))
+        self.hedge_min_samples = hedge_min_samples
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv('PROVIDER_MAX_WORKERS', 16)),
+            thread_name_prefix='provider'
+        )
+        for provider in providers or []:
+            self.register(provider)
+
+    def register(self, provider: NewsProvider):
+        """Add a provider to the chain"""
+        self.providers.append(provider)
+        self.stats.setdefault(provider.name, ProviderStats())
+
+    def _call(self, provider: NewsProvider, query: str) -> Optional[Dict]:
+        """Run one provider, recording its latency and outcome"""
+        started = time.monotonic()
+        try:
+            result = provider.search(query)
+        except Exception as e:
+            self.stats[provider.name].record(time.monotonic() - started, error=True)
+            print(f"Error with {provider.name}: {str(e)}")
+            return None
+        valid = provider.is_valid(result)
+        self.stats[provider.name].record(time.monotonic() - started, hit=valid)
+        return result if valid else None
+
+    def _hedge_after(self, provider: NewsProvider) -> float:
+        """How long to give a provider before hedging with the next one"""
+        stats = self.stats[provider.name]
+        p95 = stats.percentile(95)
+        if p95 is None or stats.calls < self.hedge_min_samples:
+            return self.hedge_delay
+        return min(p95, self.hedge_max_delay)
+
+    def search(self, query: str) -> Optional[Dict]:
+        """Return the first valid result from the registered providers"""
+        queued = list(self.providers)
+        pending = set()
+        deadline = time.monotonic() + self.timeout
+        next_launch = time.monotonic()
+        try:
+            while queued or pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    self.logger.warning(f"Provider search for '{query}' timed out after {self.timeout}s")
+                    return None
+
+                if queued and (self.mode == 'race' or not pending or now >= next_launch):
+                    provider = queued.pop(0)
+                    pending.add(self._executor.submit(self._call, provider, query))
+                    next_launch = now + self._hedge_after(provider)
+                    continue
+
+                timeout = deadline - now
+                if queued:
+                    timeout = min(timeout, next_launch - now)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result:
+                        return result
+                if done:
+                    # A provider came back empty; don't wait out the hedge delay
+                    next_launch = time.monotonic()
+            return None
+        finally:
+            # Losers that haven't started are dropped; running ones finish in the background
+            for future in pending:
+                future.cancel()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-provider call counts and latency statistics"""
+        return {name: stats.snapshot() for name, stats in self.stats.items()}
+
+
+def build_default_chain(collector) -> ProviderChain:
+    """Chain of the built-in providers for a collector"""
+    return ProviderChain([
+        NewsAPIProvider(collector),
+        GNewsProvider(collector),
+        DuckDuckGoProvider(collector),
+        WikipediaProvider(collector)
+    ])
@@ -0,0 +1,183 @@
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Below this many distinct phrases one substring search per phrase is
+# faster than a single scan with the trie pattern (see
+# scripts/benchmark_phrase_matcher.py for the crossover). No vocabulary
+# in the app comes close: the largest, QualityScorer's, has 36 phrases.
+# So the default choice is always substrings, and the trie only runs
+# where a caller forces it, i.e. MarkerScanner on short texts.
+TRIE_MIN_PHRASES = int(os.getenv('PHRASE_TRIE_MIN_PHRASES', 200))
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Regex for a set of phrases, factored by common prefix.
+
+    Branches at each node start with different characters and a phrase
+    ending inside another is an optional greedy tail, so the engine checks
+    one branch per character and matches the longest phrase at a position.
+    """
+    trie: Dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        ends_here = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends_here:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """Multi-pattern substring matcher over categorized phrase lists.
+
+    Results are identical to testing `phrase in text` for each phrase
+    separately, and there are two ways of getting them. Small vocabularies
+    (the marker and keyword lists, tens of phrases) run one substring
+    search per phrase, which is fast because each search runs in C and a
+    category stops at its first hit. Large vocabularies are compiled once
+    into a single prefix-factored lookahead pattern, so one scan of the
+    text finds the longest phrase starting at every position, and each
+    phrase also credits every shorter phrase that is a prefix of it - the
+    same semantics as an Aho-Corasick automaton, with the scanning done in
+    the regex engine. use_trie forces either one; by default the trie is
+    used from TRIE_MIN_PHRASES phrases up.
+
+    Optional token categories are regexes (e.g. numbers). Tokens and
+    phrases are expected not to overlap, such as digits and words.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]], case_sensitive: bool = False,
+                 tokens: Dict[str, str] = None, use_trie: Optional[bool] = None):
+        self.case_sensitive = case_sensitive
+        self.tokens = dict(tokens or {})
+        self._token_patterns = {name: re.compile(regex) for name, regex in self.tokens.items()}
+        self.categories = {
+            name: [self._normalize(phrase) for phrase in phrases]
+            for name, phrases in categories.items()
+        }
+
+        phrase_categories: Dict[str, Set[str]] = {}
+        for name, phrases in self.categories.items():
+            for phrase in phrases:
+                phrase_categories.setdefault(phrase, set()).add(name)
+
+        phrases = sorted(phrase_categories, key=len, reverse=True)
+        self._phrases = phrases
+        self.use_trie = len(phrases) >= TRIE_MIN_PHRASES if use_trie is None else use_trie
+        # For each phrase, the phrases (itself included) that match wherever it does
+        self._implied = {
+            phrase: frozenset(other for other in phrases if phrase.startswith(other))
+            for phrase in phrases
+        }
+        self._phrase_categories_exact = {phrase: frozenset(names) for phrase, names in phrase_categories.items()}
+        self._phrase_categories = {
+            phrase: frozenset(name for other in implied for name in phrase_categories[other])
+            for phrase, implied in self._implied.items()
+        }
+        self._pattern = None
+        if self.use_trie:
+            alternatives = [f'(?P<{name}>{regex})' for name, regex in self.tokens.items()]
+            if phrases:
+                alternatives.append('(?=(?P<_phrase>' + _trie_pattern(phrases) + '))')
+            self._pattern = re.compile('|'.join(alternatives)) if alternatives else None
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _scan(self, text: str) -> Iterator[re.Match]:
+        if self._pattern is None or not text:
+            return iter(())
+        return self._pattern.finditer(self._normalize(text))
+
+    def _found(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """Longest phrase at each match position, and token categories seen"""
+        phrases, tokens = set(), set()
+        for match in self._scan(text):
+            if match.lastgroup == '_phrase':
+                phrases.add(match.group('_phrase'))
+            else:
+                tokens.add(match.lastgroup)
+        return phrases, tokens
+
+    def _tokens_found(self, text: str) -> Set[str]:
+        return {name for name, pattern in self._token_patterns.items() if pattern.search(text)}
+
+    def phrases_found(self, text: str) -> Set[str]:
+        """Every phrase that occurs in the text"""
+        if not self.use_trie:
+            text = self._normalize(text)
+            return {phrase for phrase in self._phrases if phrase in text}
+        found = set()
+        for phrase in self._found(text)[0]:
+            found.update(self._implied[phrase])
+        return found
+
+    def categories_found(self, text: str) -> Set[str]:
+        """Every category with at least one phrase or token in the text"""
+        if not self.use_trie:
+            text = self._normalize(text)
+            found = self._tokens_found(text)
+            for name, phrases in self.categories.items():
+                if any(phrase in text for phrase in phrases):
+                    found.add(name)
+            return found
+        phrases, found = self._found(text)
+        for phrase in phrases:
+            found.update(self._phrase_categories[phrase])
+        return found
+
+    def matches(self, text: str) -> Dict[str, bool]:
+        """Whether each category has a phrase or token in the text"""
+        found = self.categories_found(text)
+        return {name: name in found for name in list(self.categories) + list(self.tokens)}
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (category, start, end) for every phrase occurrence and token"""
+        if not self.use_trie:
+            yield from self._finditer_substrings(self._normalize(text))
+            return
+        for match in self._scan(text):
+            if match.lastgroup != '_phrase':
+                yield match.lastgroup, match.start(), match.end()
+                continue
+            start = match.start()
+            for phrase in self._implied[match.group('_phrase')]:
+                for name in self._phrase_categories_exact[phrase]:
+                    yield name, start, start + len(phrase)
+
+    def _finditer_substrings(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        spans = []
+        for name, pattern in self._token_patterns.items():
+            spans.extend((match.start(), name, match.end()) for match in pattern.finditer(text))
+        for phrase in self._phrases:
+            start = text.find(phrase)
+            while start != -1:
+                end = start + len(phrase)
+                spans.extend((start, name, end) for name in self._phrase_categories_exact[phrase])
+                start = text.find(phrase, start + 1)
+        for start, name, end in sorted(spans):
+            yield name, start, end
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Number of distinct phrases found per category"""
+        found = self.phrases_found(text)
+        return {
+            name: sum(1 for phrase in set(phrases) if phrase in found)
+            for name, phrases in self.categories.items()
+        }
+
+    def first_category(self, text: str, order: List[str], default: str = None) -> str:
+        """The first category in order that has a phrase in the text"""
+        found = self.categories_found(text)
+        return next((name for name in order if name in found), default)
@@ -9,6 +9,9 @@ from content_engine.story_collector import BusinessStoryCollector
 class PostRecommender:
     """Recommender system for LinkedIn posts with feedback tracking"""
     
+    # Companies per feedback batch
+    MAX_BATCH_COMPANIES = 5
+
     FEEDBACK_OPTIONS = {
         1: "Too technical - needs simpler language",
         2: "Not technical enough - needs more depth",
@@ -17,11 +20,12 @@ class PostRecommender:
         5: "Not engaging enough"
     }
     
-    def __init__(self, db_path: str = "post_feedback.db"):
+    def __init__(self, db_path: str = "post_feedback.db", db_manager: Optional[DatabaseManager] = None,
+                 story_collector: Optional[BusinessStoryCollector] = None):
         """Initialize the recommender system"""
         self.db_path = db_path
-        self.db_manager = DatabaseManager()
-        self.story_collector = BusinessStoryCollector()
+        self.db_manager = db_manager or DatabaseManager()
+        self.story_collector = story_collector or BusinessStoryCollector()
         self._init_database()
 
     def _init_database(self):
@@ -66,6 +70,13 @@ class PostRecommender:
                 )
             """)
             
+            # Progress of batches generated in the background; kept here rather
+            # than in process memory so every app worker sees it
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(batches)")}
+            for column in ('expected_posts', 'completed_posts', 'failed_posts'):
+                if column not in columns:
+                    cursor.execute(f"ALTER TABLE batches ADD COLUMN {column} INTEGER DEFAULT 0")
+            
             conn.commit()
 
     def create_batch(self) -> int:
@@ -76,6 +87,72 @@ class PostRecommender:
             conn.commit()
             return cursor.lastrowid
 
+    def start_batch_progress(self, batch_id: int, expected_posts: int):
+        """Record that a batch is being generated in the background"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                UPDATE batches
+                SET expected_posts = ?, completed_posts = 0, failed_posts = 0
+                WHERE batch_id = ?
+            """, (expected_posts, batch_id))
+            conn.commit()
+
+    def record_batch_result(self, batch_id: int, succeeded: bool):
+        """Count one finished post of a background batch"""
+        column = 'completed_posts' if succeeded else 'failed_posts'
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f"UPDATE batches SET {column} = {column} + 1 WHERE batch_id = ?", (batch_id,))
+            conn.commit()
+
+    def get_batch_progress(self, batch_id: Optional[int] = None, timeout: float = None) -> Optional[Dict]:
+        """Progress of a batch still generating (the latest one if batch_id is None).
+
+        Batches older than timeout seconds (BATCH_GENERATION_TIMEOUT) are
+        treated as finished, so a worker that died mid-batch doesn't block
+        new batches forever.
+        """
+        timeout = timeout or float(os.getenv('BATCH_GENERATION_TIMEOUT', 600))
+        query = """
+            SELECT batch_id, expected_posts, completed_posts, failed_posts
+            FROM batches
+            WHERE expected_posts > completed_posts + failed_posts
+              AND created_at > datetime('now', ?)
+        """
+        params = [f'-{int(timeout)} seconds']
+        if batch_id is not None:
+            query += " AND batch_id = ?"
+            params.append(batch_id)
+        query += " ORDER BY batch_id DESC LIMIT 1"
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(query, params).fetchone()
+        if not row:
+            return None
+        return {
+            'batch_id': row[0],
+            'total_posts': row[1],
+            'completed': row[2],
+            'failed': row[3]
+        }
+
+    def check_new_batch(self, company_names: List[str], industry: Optional[str]) -> Optional[Dict]:
+        """Why a feedback batch can't be started now, or None if it can.
+
+        Shared by /api/generate-batch and the generate_batch job so both
+        enforce the same rules. Returns {'error': ...} plus 'pending_batch'
+        when an earlier batch is in the way.
+        """
+        if not company_names or not industry:
+            return {'error': 'Company names and industry are required'}
+
+        current_batch = self.get_current_batch_status()
+        if current_batch and current_batch['total_posts'] > current_batch['posts_with_feedback']:
+            return {'error': 'Previous batch requires feedback', 'pending_batch': current_batch}
+
+        generating = self.get_batch_progress()
+        if generating:
+            return {'error': 'Previous batch is still generating', 'pending_batch': generating}
+        return None
+
     def get_current_batch_status(self) -> Optional[Dict]:
         """Get status of the most recent batch"""
         with sqlite3.connect(self.db_path) as conn:
@@ -127,6 +204,27 @@ class PostRecommender:
             conn.commit()
             return cursor.lastrowid
 
+    def save_posts(self, posts: List[Dict], batch_id: Optional[int] = None) -> List[int]:
+        """Save several generated posts in a single transaction"""
+        post_ids = []
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            for post in posts:
+                cursor.execute("""
+                    INSERT INTO posts (content, company_name, industry, post_type, metrics, batch_id)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    post['content'],
+                    post['company_name'],
+                    post['industry'],
+                    post['post_type'],
+                    json.dumps(post.get('metrics', {})),
+                    batch_id
+                ))
+                post_ids.append(cursor.lastrowid)
+            conn.commit()
+        return post_ids
+
     def save_feedback(self, post_id: int, feedback_type: str, feedback_text: Optional[str] = None):
         """Save feedback for a post"""
         with sqlite3.connect(self.db_path) as conn:
@@ -0,0 +1,166 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+from .llm_client import LLMClient, UsageMeter, metered, get_llm_client
+
+
+class AttemptMetrics:
+    """What one regeneration attempt produced and cost"""
+
+    def __init__(self, attempt: int, candidates: int):
+        self.attempt = attempt
+        self.candidates = candidates
+        self.scores: List[Dict[str, float]] = []
+        self.errors = 0
+        self.tokens = 0
+        self.completion_tokens = 0
+        self.llm_calls = 0
+        self.elapsed = 0.0
+        self.accepted = False
+
+    def to_dict(self) -> Dict:
+        return {
+            'attempt': self.attempt,
+            'candidates': self.candidates,
+            'scores': self.scores,
+            'errors': self.errors,
+            'tokens': self.tokens,
+            'completion_tokens': self.completion_tokens,
+            'llm_calls': self.llm_calls,
+            'elapsed': round(self.elapsed, 3),
+            'accepted': self.accepted
+        }
+
+
+class RegenerationResult:
+    """Best candidate found by a RegenerationEngine run"""
+
+    def __init__(self, post: Optional[Dict], scores: Optional[Dict[str, float]],
+                 accepted: bool, stop_reason: str, attempts: List[AttemptMetrics], usage: UsageMeter):
+        self.post = post
+        self.scores = scores
+        self.accepted = accepted
+        self.stop_reason = stop_reason
+        self.attempts = attempts
+        self.usage = usage
+
+    @property
+    def tokens(self) -> int:
+        return self.usage.total_tokens
+
+    def metrics(self) -> Dict:
+        return {
+            'accepted': self.accepted,
+            'stop_reason': self.stop_reason,
+            'attempts': [attempt.to_dict() for attempt in self.attempts],
+            'usage': self.usage.snapshot()
+        }
+
+
+class RegenerationEngine:
+    """Bounded best-of-N regeneration.
+
+    Each attempt generates `candidates` posts concurrently on the LLM
+    client and scores them as one batch. The best candidate seen so far is
+    kept across attempts; the run stops as soon as one is accepted, after
+    max_attempts, or when the next attempt would likely overrun the token
+    budget (judged from the average cost of the attempts so far).
+
+    The budget counts completion tokens only, since that is what max_tokens
+    can cap: prompts are fixed by the story and template, and a candidate
+    may make several calls each with its own prompt. Prompt tokens are
+    still metered and reported in the result's usage. Every candidate is
+    handed max_tokens, its share of the completion budget that is left,
+    which it must split across its calls; once that share drops below
+    min_tokens the run stops.
+    """
+
+    def __init__(self, llm: Optional[LLMClient] = None, max_attempts: Optional[int] = None,
+                 token_budget: Optional[int] = None, candidates: Optional[int] = None,
+                 min_tokens: Optional[int] = None):
+        self.llm = llm or get_llm_client()
+        self.max_attempts = max_attempts or int(os.getenv('REGEN_MAX_ATTEMPTS', 3))
+        self.token_budget = token_budget or int(os.getenv('REGEN_TOKEN_BUDGET', 12000))
+        self.candidates = candidates or int(os.getenv('REGEN_CANDIDATES', 1))
+        self.min_tokens = min_tokens or int(os.getenv('REGEN_MIN_TOKENS', 200))
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _rank(scores: Dict[str, float], accepted: bool):
+        """Accepted candidates first, then by total score"""
+        return (accepted, sum(scores.values()))
+
+    async def _attempt(self, generate: Callable[[int], Awaitable[Dict]], count: int, max_tokens: int) -> List:
+        return await asyncio.gather(
+            *(generate(max_tokens) for _ in range(count)),
+            return_exceptions=True
+        )
+
+    def run(self, generate: Callable[[int], Awaitable[Dict]],
+            score_batch: Callable[[List[str]], List[Dict[str, float]]],
+            accept: Callable[[Dict[str, float]], bool]) -> RegenerationResult:
+        """Generate until a candidate is accepted or the attempt/token budget runs out.
+
+        generate(max_tokens) returns a coroutine producing a post dict with
+        a 'content' key, spending at most max_tokens completion tokens in
+        total across all of its LLM calls and
+        bypassing the LLM response cache (a regeneration has to produce a
+        different draft); score_batch scores a list of contents; accept
+        decides whether a candidate's scores are good enough.
+        """
+        usage = UsageMeter()
+        attempts: List[AttemptMetrics] = []
+        best_post, best_scores, best_rank = None, None, None
+        stop_reason = 'max_attempts'
+
+        for number in range(1, self.max_attempts + 1):
+            remaining = self.token_budget - usage.completion_tokens
+            if attempts and usage.completion_tokens / len(attempts) > remaining:
+                stop_reason = 'token_budget'
+                break
+            max_tokens = remaining // self.candidates
+            if max_tokens < self.min_tokens:
+                stop_reason = 'token_budget'
+                break
+
+            metrics = AttemptMetrics(number, self.candidates)
+            before = usage.snapshot()
+            start = time.perf_counter()
+            results = self.llm.run(metered(self._attempt(generate, self.candidates, max_tokens), usage))
+            metrics.elapsed = time.perf_counter() - start
+            metrics.tokens = usage.total_tokens - before['total_tokens']
+            metrics.completion_tokens = usage.completion_tokens - before['completion_tokens']
+            metrics.llm_calls = usage.calls - before['calls']
+
+            posts = []
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Candidate generation failed: {result}")
+                    metrics.errors += 1
+                elif result and result.get('content'):
+                    posts.append(result)
+            attempts.append(metrics)
+
+            if posts:
+                metrics.scores = score_batch([post['content'] for post in posts])
+                for post, scores in zip(posts, metrics.scores):
+                    accepted = accept(scores)
+                    metrics.accepted = metrics.accepted or accepted
+                    rank = self._rank(scores, accepted)
+                    if best_rank is None or rank > best_rank:
+                        best_post, best_scores, best_rank = post, scores, rank
+
+            self.logger.info(
+                f"Regeneration attempt {number}: {len(posts)}/{self.candidates} candidates, "
+                f"{metrics.tokens} tokens, accepted={metrics.accepted}"
+            )
+            if metrics.accepted:
+                stop_reason = 'accepted'
+                break
+
+        return RegenerationResult(
+            best_post, best_scores, bool(best_rank and best_rank[0]),
+            stop_reason, attempts, usage
+        )
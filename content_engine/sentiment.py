@@ -0,0 +1,190 @@
+import os
+import re
+import hashlib
+import logging
+import threading
+import importlib.util
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+NEGATIONS = {'not', 'never', 'no', "n't"}
+
+_TOKEN = re.compile(r"[a-z][a-z'-]*|!|[:;=8][-o*']?[()\[\]dDpP/\\|]")
+
+# Used when TextBlob's lexicon file isn't installed: (polarity, subjectivity, intensity)
+BUILTIN_LEXICON = {
+    'good': (0.7, 0.6, 1.0), 'great': (0.8, 0.75, 1.0), 'excellent': (1.0, 1.0, 1.0),
+    'amazing': (0.6, 0.9, 1.0), 'best': (1.0, 0.3, 1.0), 'better': (0.5, 0.5, 1.0),
+    'positive': (0.23, 0.54, 1.0), 'success': (0.3, 0.4, 1.0), 'successful': (0.75, 0.95, 1.0),
+    'innovative': (0.5, 0.75, 1.0), 'impressive': (1.0, 1.0, 1.0), 'strong': (0.43, 0.73, 1.0),
+    'happy': (0.8, 1.0, 1.0), 'love': (0.5, 0.6, 1.0), 'exciting': (0.3, 0.8, 1.0),
+    'new': (0.14, 0.45, 1.0), 'huge': (0.4, 0.9, 1.0), 'smart': (0.21, 0.64, 1.0),
+    'bad': (-0.7, 0.67, 1.0), 'worst': (-1.0, 1.0, 1.0), 'worse': (-0.4, 0.6, 1.0),
+    'poor': (-0.4, 0.6, 1.0), 'negative': (-0.3, 0.4, 1.0), 'difficult': (-0.5, 1.0, 1.0),
+    'hard': (-0.29, 0.54, 1.0), 'wrong': (-0.5, 0.9, 1.0), 'terrible': (-1.0, 1.0, 1.0),
+    'frustrating': (-0.4, 0.7, 1.0), 'failed': (-0.5, 0.3, 1.0), 'problem': (-0.2, 0.5, 1.0),
+    'very': (0.2, 0.3, 1.3), 'really': (0.2, 0.2, 1.4), 'extremely': (0.0, 1.0, 1.5),
+    'incredibly': (0.9, 0.9, 1.5), 'highly': (0.16, 0.54, 1.4), 'slightly': (0.0, 0.0, 0.6)
+}
+
+
+def _textblob_lexicon_path() -> Optional[str]:
+    """Path to TextBlob's en-sentiment.xml, found without importing textblob"""
+    spec = importlib.util.find_spec('textblob')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    path = os.path.join(list(spec.submodule_search_locations)[0], 'en', 'en-sentiment.xml')
+    return path if os.path.exists(path) else None
+
+
+def load_lexicon(path: Optional[str] = None) -> Dict[str, Tuple[float, float, float]]:
+    """Load a pattern-style sentiment lexicon, averaging each word's senses"""
+    path = path or os.getenv('SENTIMENT_LEXICON') or _textblob_lexicon_path()
+    if not path:
+        return dict(BUILTIN_LEXICON)
+
+    senses: Dict[str, List[Tuple[float, float, float]]] = {}
+    for word in ET.parse(path).getroot().iter('word'):
+        form = word.get('form', '').lower()
+        if not form:
+            continue
+        senses.setdefault(form, []).append((
+            float(word.get('polarity', 0.0)),
+            float(word.get('subjectivity', 0.0)),
+            float(word.get('intensity', 1.0))
+        ))
+    return {
+        form: tuple(round(sum(values) / len(values), 2) for values in zip(*entries))
+        for form, entries in senses.items()
+    }
+
+
+class LexiconSentiment:
+    """Polarity from a precompiled word lexicon.
+
+    Follows the scheme of TextBlob's PatternAnalyzer: intensifiers scale the
+    next known word, negations flip and halve it, exclamation marks boost
+    the previous word, and polarity is the mean over assessed words. It
+    skips POS tagging and the rest of the TextBlob pipeline, so results
+    are close to TextBlob's but not identical.
+    """
+
+    def __init__(self, lexicon: Dict[str, Tuple[float, float, float]] = None):
+        self.lexicon = lexicon if lexicon is not None else load_lexicon()
+
+    def polarity(self, text: str) -> float:
+        assessments = []  # [polarity, intensity, negated]
+        modifier = None
+        negation = None
+        for token in _TOKEN.findall(text.lower()):
+            entry = self.lexicon.get(token)
+            if entry is not None:
+                polarity, _, intensity = entry
+                if modifier is not None and assessments:
+                    # Known word after an intensifier ("really good")
+                    previous = assessments[-1]
+                    previous[0] = max(-1.0, min(polarity * previous[1], 1.0))
+                    previous[1] = intensity
+                else:
+                    assessments.append([polarity, intensity, False])
+                modifier = token if intensity != 1.0 else None
+                if negation is not None:
+                    # Known word after a negation ("not good")
+                    assessments[-1][2] = True
+                    negation = None
+                continue
+
+            if token == '!':
+                if assessments:
+                    assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+                continue
+            if token in NEGATIONS or token.endswith("n't"):
+                negation = token
+                continue
+            # Keep negations and modifiers across short words ("not a good")
+            if negation is not None and len(token.strip("'")) > 1:
+                negation = None
+            if modifier is not None and len(token) > 2:
+                modifier = None
+
+        if not assessments:
+            return 0.0
+        scores = [
+            max(-1.0, min(-polarity * 0.5, 1.0)) if negated else polarity
+            for polarity, _, negated in assessments
+        ]
+        return sum(scores) / len(scores)
+
+
+def textblob_polarity(text: str) -> float:
+    """Exact TextBlob polarity, for parity checks"""
+    from textblob import TextBlob
+    return TextBlob(text).sentiment.polarity
+
+
+class SentimentAnalyzer:
+    """Cached sentiment polarity with a batch API.
+
+    SENTIMENT_MODE=lexicon (default) uses LexiconSentiment; 'textblob' runs
+    the full TextBlob pipeline for exact parity. Results are kept in an LRU
+    keyed by a hash of the text.
+    """
+
+    MODES = ('lexicon', 'textblob')
+
+    def __init__(self, mode: str = None, cache_size: int = None, lexicon: Dict = None):
+        self.mode = (mode or os.getenv('SENTIMENT_MODE', 'lexicon')).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown sentiment mode: {self.mode}")
+        self.cache_size = cache_size or int(os.getenv('SENTIMENT_CACHE_SIZE', 10000))
+        self.logger = logging.getLogger(__name__)
+        self._scorer = textblob_polarity if self.mode == 'textblob' else LexiconSentiment(lexicon).polarity
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def polarity(self, text: str) -> float:
+        """Polarity of text, from -1.0 to 1.0"""
+        if not text:
+            return 0.0
+        key = self._key(text)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        value = self._scorer(text)
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def polarity_batch(self, texts: List[str]) -> List[float]:
+        """Polarity of each text, scoring repeated texts once"""
+        scored = {}
+        return [scored[text] if text in scored else scored.setdefault(text, self.polarity(text)) for text in texts]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {'mode': self.mode, 'entries': len(self._cache), 'hits': self.hits, 'misses': self.misses}
+
+
+_default_analyzer = None
+_default_analyzer_lock = threading.Lock()
+
+
+def get_sentiment_analyzer() -> SentimentAnalyzer:
+    """Get the process-wide sentiment analyzer"""
+    global _default_analyzer
+    with _default_analyzer_lock:
+        if _default_analyzer is None:
+            _default_analyzer = SentimentAnalyzer()
+        return _default_analyzer
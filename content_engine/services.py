@@ -0,0 +1,174 @@
+import os
+import time
+import logging
+import threading
+from typing import Callable, Dict, List
+
+
+def _build_db(services: 'ServiceContainer'):
+    from database.db_manager import DatabaseManager
+    return DatabaseManager()
+
+
+def _build_collector(services: 'ServiceContainer'):
+    from .story_collector import BusinessStoryCollector
+    return BusinessStoryCollector(db=services.db)
+
+
+def _build_generator(services: 'ServiceContainer'):
+    from .enhanced_generator import EnhancedContentGenerator
+    return EnhancedContentGenerator(story_collector=services.collector)
+
+
+def _build_content_generator(services: 'ServiceContainer'):
+    from .content_generator import ContentGenerator
+    return ContentGenerator(enhanced_generator=services.generator)
+
+
+def _build_recommender(services: 'ServiceContainer'):
+    from .post_recommender import PostRecommender
+    return PostRecommender(db_manager=services.db, story_collector=services.collector)
+
+
+def _build_scorer(services: 'ServiceContainer'):
+    from .quality_scorer import QualityScorer
+    return QualityScorer()
+
+
+def _build_auto_recommender(services: 'ServiceContainer'):
+    from .auto_recommender import AutoPostRecommender
+    return AutoPostRecommender(
+        db_manager=services.db,
+        story_collector=services.collector,
+        post_generator=services.generator,
+        scorer=services.scorer
+    )
+
+
+def _build_job_queue(services: 'ServiceContainer'):
+    from .job_queue import JobQueue
+    return JobQueue()
+
+
+def _build_batch_executor(services: 'ServiceContainer'):
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(
+        max_workers=int(os.getenv('BATCH_MAX_WORKERS', 5)),
+        thread_name_prefix='batch'
+    )
+
+
+DEFAULT_FACTORIES = {
+    'db': _build_db,
+    'collector': _build_collector,
+    'generator': _build_generator,
+    'content_generator': _build_content_generator,
+    'recommender': _build_recommender,
+    'scorer': _build_scorer,
+    'auto_recommender': _build_auto_recommender,
+    'job_queue': _build_job_queue,
+    'batch_executor': _build_batch_executor
+}
+
+
+class ServiceContainer:
+    """Lazily built, shared application components.
+
+    Each component is constructed on first access (services.collector or
+    services.get('collector')) and reused afterwards; factories receive
+    the container so dependencies are injected rather than rebuilt. Init
+    time is recorded per component, both in total and excluding the
+    dependencies it pulled in.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[['ServiceContainer'], object]] = None):
+        self._factories = dict(DEFAULT_FACTORIES if factories is None else factories)
+        self._instances = {}
+        self._timings = {}
+        self._building: List[str] = []
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger(__name__)
+
+    def register(self, name: str, factory: Callable[['ServiceContainer'], object]):
+        """Add or replace a component factory"""
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def get(self, name: str):
+        """Get a component, building it and its dependencies on first use"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+            if name not in self._factories:
+                raise KeyError(f"Unknown service: {name}")
+            if name in self._building:
+                raise RuntimeError(f"Circular service dependency: {' -> '.join(self._building + [name])}")
+
+            self._building.append(name)
+            nested_before = sum(self._timings[dep]['self'] for dep in self._timings)
+            start = time.perf_counter()
+            try:
+                instance = self._factories[name](self)
+            finally:
+                self._building.pop()
+            total = time.perf_counter() - start
+            nested = sum(self._timings[dep]['self'] for dep in self._timings) - nested_before
+
+            self._instances[name] = instance
+            self._timings[name] = {'total': total, 'self': total - nested}
+            self.logger.info(f"Initialized {name} in {total:.3f}s")
+            return instance
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self.get(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def initialized(self, name: str) -> bool:
+        return name in self._instances
+
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """Init time of each built component, in seconds"""
+        with self._lock:
+            return {
+                name: {key: round(value, 4) for key, value in timing.items()}
+                for name, timing in self._timings.items()
+            }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'registered': sorted(self._factories),
+                'initialized': list(self._instances),
+                'timings': self.timings()
+            }
+
+    def reset(self):
+        """Forget every built component, e.g. after fork"""
+        with self._lock:
+            self._instances = {}
+            self._timings = {}
+
+
+_default_services = None
+_default_services_pid = None
+_default_services_lock = threading.Lock()
+
+
+def get_services() -> ServiceContainer:
+    """Get the process-wide service container (recreated after fork)"""
+    global _default_services, _default_services_pid
+    if _default_services is None or _default_services_pid != os.getpid():
+        with _default_services_lock:
+            if _default_services is None or _default_services_pid != os.getpid():
+                _default_services = ServiceContainer()
+                _default_services_pid = os.getpid()
+    return _default_services
@@ -1,31 +1,53 @@
-import wikipediaapi
-import newspaper
-from bs4 import BeautifulSoup
-import requests
 import json
 from datetime import datetime
 from typing import List, Dict, Optional, Union
 import logging
-import time
 import random
-from textblob import TextBlob
-from newspaper import Article
+import threading
 from database.db_manager import DatabaseManager
-import os
-from duckduckgo_search import DDGS
-from urllib.parse import urlparse
-import re
+from .story_sampler import StorySampler
+from .news_cache import get_news_cache
+from .fetcher import get_fetch_engine
+from .news_providers import build_default_chain
+from .wiki_store import WikiPage, get_wiki_store, relevant_sections
+from .company_extractor import get_company_extractor
+from .phrase_matcher import PhraseMatcher
+from .sentiment import get_sentiment_analyzer
+from .lazy_imports import lazy_import
+
+# Loaded on first use rather than at import
+wikipediaapi = lazy_import('wikipediaapi')
+duckduckgo_search = lazy_import('duckduckgo_search')
+
+STORY_TYPE_MATCHER = PhraseMatcher({
+    'pivot': ['pivot', 'transform', 'change direction', 'reinvent'],
+    'innovation': ['innovate', 'breakthrough', 'revolutionary', 'disrupt'],
+    'success': ['success', 'growth', 'achievement', 'milestone']
+})
+REPUTABLE_SOURCE_MATCHER = PhraseMatcher({
+    'reputable': ['reuters', 'bloomberg', 'forbes', 'techcrunch', 'wsj', 'nytimes']
+})
+ENGAGING_TITLE_MATCHER = PhraseMatcher({
+    'engaging': ['breakthrough', 'innovative', 'disrupting', 'revolutionary', 'success']
+})
+TRENDING_INDUSTRY_MATCHER = PhraseMatcher({
+    'trending': ['technology', 'healthcare', 'ai', 'renewable']
+})
 
 class BusinessStoryCollector:
-    def __init__(self):
+    def __init__(self, db: Optional[DatabaseManager] = None):
         """Initialize the story collector."""
-        self.wiki = wikipediaapi.Wikipedia(
-            language='en',
-            extract_format=wikipediaapi.ExtractFormat.WIKI,
-            user_agent='LinkedInContentAI/1.0'
-        )
-        self.ddgs = DDGS()
-        self.db = DatabaseManager()
+        self._wiki = None
+        self._ddgs = None
+        self._clients_lock = threading.Lock()
+        self.db = db or DatabaseManager()
+        self.sampler = StorySampler(self.db)
+        self.news_cache = get_news_cache()
+        self.fetcher = get_fetch_engine()
+        self.wiki_store = get_wiki_store()
+        self.company_extractor = get_company_extractor()
+        self.sentiment = get_sentiment_analyzer()
+        self.providers = build_default_chain(self)
         self.logger = logging.getLogger(__name__)
         self.business_categories = [
             'Business_pivots',
@@ -50,7 +72,29 @@ class BusinessStoryCollector:
             'reuters.com': {'weight': 0.95, 'base_url': 'https://www.reuters.com'},
             'bloomberg.com': {'weight': 0.9, 'base_url': 'https://www.bloomberg.com'}
         }
-        
+
+    @property
+    def wiki(self):
+        """Wikipedia API client, created on first use"""
+        if self._wiki is None:
+            with self._clients_lock:
+                if self._wiki is None:
+                    self._wiki = wikipediaapi.Wikipedia(
+                        language='en',
+                        extract_format=wikipediaapi.ExtractFormat.WIKI,
+                        user_agent='LinkedInContentAI/1.0'
+                    )
+        return self._wiki
+
+    @property
+    def ddgs(self):
+        """DuckDuckGo search client, created on first use"""
+        if self._ddgs is None:
+            with self._clients_lock:
+                if self._ddgs is None:
+                    self._ddgs = duckduckgo_search.DDGS()
+        return self._ddgs
+
     def collect_pivot_stories(self) -> List[Dict]:
         """Collect stories specifically about business pivots"""
         pivot_keywords = [
@@ -62,15 +106,11 @@ class BusinessStoryCollector:
         ]
         stories = []
         
-        # Search Wikipedia for pivot stories
-        for keyword in pivot_keywords:
-            wiki_results = self.wiki.search(keyword)
-            for page_title in wiki_results:
-                page = self.wiki.page(page_title)
-                if page.exists():
-                    story = self._extract_pivot_story(page)
-                    if story:
-                        stories.append(story)
+        # Search Wikipedia for pivot stories, fetching all result pages in one batch
+        for page in self.wiki_store.search_pages(pivot_keywords):
+            story = self._extract_pivot_story(page)
+            if story:
+                stories.append(story)
         
         return stories
 
@@ -100,14 +140,16 @@ class BusinessStoryCollector:
         stories = []
         
         # Search Wikipedia for success stories
+        titles = []
         for category in ['Business_success_stories', 'Startup_companies']:
             category_members = self.wiki.page(category).categorymembers
-            for title in list(category_members.keys())[:5]:  # Limit to 5 stories per category
-                page = self.wiki.page(title)
-                if page.exists():
-                    story = self._extract_success_story(page)
-                    if story:
-                        stories.append(story)
+            titles.extend(list(category_members.keys())[:5])  # Limit to 5 stories per category
+        
+        for page in self.wiki_store.pages(titles):
+            if page.exists():
+                story = self._extract_success_story(page)
+                if story:
+                    stories.append(story)
         
         return stories
 
@@ -122,14 +164,10 @@ class BusinessStoryCollector:
         ]
         stories = []
         
-        for keyword in innovation_keywords:
-            wiki_results = self.wiki.search(keyword)
-            for page_title in wiki_results:
-                page = self.wiki.page(page_title)
-                if page.exists():
-                    story = self._extract_innovation_story(page)
-                    if story:
-                        stories.append(story)
+        for page in self.wiki_store.search_pages(innovation_keywords):
+            story = self._extract_innovation_story(page)
+            if story:
+                stories.append(story)
         
         return stories
 
@@ -138,23 +176,9 @@ class BusinessStoryCollector:
         try:
             # Search for recent news about the company/topic
             company_name = story['title'].split('(')[0].strip()
-            news_articles = []
             
-            for source in self.news_sources:
-                paper = newspaper.build(source, memoize_articles=False)
-                for article in paper.articles[:5]:  # Check first 5 articles
-                    try:
-                        article.download()
-                        article.parse()
-                        if company_name.lower() in article.text.lower():
-                            news_articles.append({
-                                'title': article.title,
-                                'url': article.url,
-                                'text': article.text[:500],  # First 500 chars
-                                'published_date': article.publish_date.isoformat() if article.publish_date else None
-                            })
-                    except Exception:
-                        continue
+            # Match against articles cached for the current refresh window
+            news_articles = self.news_cache.find_mentions(self.news_sources, company_name)
             
             story['recent_news'] = news_articles
         except Exception as e:
@@ -164,12 +188,10 @@ class BusinessStoryCollector:
 
     def _extract_relevant_sections(self, page) -> Dict:
         """Extract relevant sections from a Wikipedia page"""
-        sections = {}
-        for section in page.sections:
-            if any(keyword in section.title.lower() for keyword in 
-                  ['history', 'business', 'development', 'growth', 'pivot', 'transformation']):
-                sections[section.title] = section.text
-        return sections
+        if isinstance(page, WikiPage):
+            # Already extracted when the page was stored
+            return dict(page.relevant_sections)
+        return relevant_sections((section.title, section.text) for section in page.sections)
 
     def save_stories(self, stories: List[Dict], filename: str):
         """Save collected stories to a JSON file"""
@@ -199,16 +221,13 @@ class BusinessStoryCollector:
         return all_stories
 
     def analyze_sentiment(self, text: str) -> float:
-        """Analyze sentiment of text using TextBlob."""
-        blob = TextBlob(text)
-        return blob.sentiment.polarity
+        """Analyze sentiment polarity of text."""
+        return self.sentiment.polarity(text)
 
     def extract_article_data(self, url: str) -> Optional[Dict]:
         """Extract and analyze article data using newspaper3k."""
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
+            article = self.fetcher.download_article(url)
             article.nlp()
 
             # Calculate sentiment score
@@ -230,65 +249,6 @@ class BusinessStoryCollector:
             print(f"Error extracting article data from {url}: {str(e)}")
             return None
 
-    def collect_story(self, company_name: str, industry: str) -> Optional[Dict]:
-        """Collect and analyze business story with enhanced data collection."""
-        try:
-            # Get Wikipedia data
-            wiki_data = self._get_wikipedia_data(company_name)
-            if not wiki_data:
-                return None
-
-            # Create base story
-            story_data = {
-                'title': f"{company_name} Business Story",
-                'company_name': company_name,
-                'industry': industry,
-                'summary': wiki_data.get('summary', ''),
-                'content': wiki_data,
-                'source': 'wikipedia',
-                'story_type': self._determine_story_type(wiki_data)
-            }
-
-            # Save story to database
-            story_id = self.db.save_story(story_data)
-
-            # Collect related news articles
-            news_articles = self._collect_news_articles(company_name)
-            for article in news_articles:
-                if article:
-                    article['story_id'] = story_id
-                    self.db.save_news_article(article)
-
-            # Update source reliability metrics
-            for source in self.trusted_sources:
-                success = any(source in article['url'] for article in news_articles if article)
-                articles_count = sum(1 for article in news_articles if article and source in article['url'])
-                self.db.update_source_reliability(source, success, articles_count)
-
-            return self.db.get_story_by_id(story_id)
-
-        except Exception as e:
-            print(f"Error collecting story for {company_name}: {str(e)}")
-            return None
-
-    def _collect_news_articles(self, company_name: str) -> List[Dict]:
-        """Collect and analyze news articles from trusted sources."""
-        articles = []
-        for source, info in self.trusted_sources.items():
-            try:
-                # Search for company news using newspaper3k
-                search_url = f"{info['base_url']}/search?q={company_name.replace(' ', '+')}"
-                article_data = self.extract_article_data(search_url)
-                
-                if article_data:
-                    article_data['source'] = source
-                    articles.append(article_data)
-            except Exception as e:
-                print(f"Error collecting news from {source}: {str(e)}")
-                continue
-
-        return articles
-
     def get_trending_stories(self, days: int = 7) -> List[Dict]:
         """Get trending business stories based on recent coverage and sentiment."""
         return self.db.get_trending_stories(days=days)
@@ -297,9 +257,10 @@ class BusinessStoryCollector:
         """Get list of current reliable sources."""
         return self.db.get_reliable_sources()
 
-    def populate_initial_stories(self, target_count=500, industries=None, story_types=None):
+    def populate_initial_stories(self, target_count=500, industries=None, story_types=None, chunk_size=1000):
         """
         Populate database with pre-curated business stories across industries and story types.
+        Stories are written with bulk inserts, one transaction per chunk.
         """
         stories = []
         
@@ -451,6 +412,11 @@ class BusinessStoryCollector:
             ]
         }
         
+        if industries is None:
+            industries = sorted({story['industry'] for story in curated_stories} | set(industry_specific_stories))
+        if story_types is None:
+            story_types = sorted({story['story_type'] for story in curated_stories})
+        
         def generate_unique_stories():
             """Generate unique stories based on templates and industry/type combinations"""
             generated = []
@@ -542,325 +508,23 @@ class BusinessStoryCollector:
         
         # Generate and save stories
         stories = generate_unique_stories()
+        self.db.create_business_stories_table()
         saved_count = 0
         
-        for story in stories:
+        for start in range(0, len(stories), chunk_size):
+            chunk = stories[start:start + chunk_size]
             try:
-                self.db.save_story(story)
-                saved_count += 1
-                print(f"Saved story {saved_count}/{target_count}: {story['title']}")
+                saved_count += len(self.db.bulk_insert_stories(chunk, chunk_size=chunk_size))
+                print(f"Saved stories {saved_count}/{target_count}")
             except Exception as e:
-                print(f"Error saving story: {str(e)}")
+                print(f"Error saving stories {start + 1}-{start + len(chunk)}: {str(e)}")
                 continue
         
+        self.sampler.invalidate()
         return stories
 
-    def collect_story(self, search_query, industry, subcategory=None, company_size=None, innovation_type=None):
-        """Collect a business innovation story based on search criteria"""
-        try:
-            # Search for news articles and case studies
-            news_data = self._search_news(search_query)
-            if not news_data:
-                return None
-            
-            # Extract key information
-            story = {
-                'title': news_data.get('title', ''),
-                'content': news_data.get('content', ''),
-                'url': news_data.get('url', ''),
-                'source': news_data.get('source', ''),
-                'published_date': news_data.get('published_date', datetime.now().isoformat()),
-                'industry': industry,
-                'subcategory': subcategory,
-                'company_size': company_size,
-                'innovation_type': innovation_type,
-                'sentiment_score': self._analyze_sentiment(news_data.get('content', '')),
-                'reliability_score': self._calculate_source_reliability(news_data.get('source', '')),
-                'collected_at': datetime.now().isoformat()
-            }
-            
-            # Save to database
-            self.db.save_story(story)
-            return story
-            
-        except Exception as e:
-            print(f"Error in collect_story: {str(e)}")
-            return None
-
-    def _search_news(self, query: str) -> Optional[Dict]:
-        """Search for news articles using various news APIs and web scraping"""
-        try:
-            # Try multiple news sources in sequence
-            news_data = (
-                self._try_newsapi(query) or
-                self._try_gnews(query) or
-                self._try_web_scraping(query)
-            )
-            return news_data
-        except Exception as e:
-            print(f"Error in _search_news: {str(e)}")
-            return None
-
-    def _try_newsapi(self, query: str) -> Optional[Dict]:
-        """Try to get story from NewsAPI"""
-        try:
-            if not os.getenv('NEWSAPI_KEY'):
-                return None
-                
-            url = 'https://newsapi.org/v2/everything'
-            params = {
-                'q': query,
-                'apiKey': os.getenv('NEWSAPI_KEY'),
-                'language': 'en',
-                'sortBy': 'relevancy',
-                'pageSize': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with NewsAPI: {str(e)}")
-            return None
-            
-    def _try_gnews(self, query: str) -> Optional[Dict]:
-        """Try to get story from GNews"""
-        try:
-            if not os.getenv('GNEWS_API_KEY'):
-                return None
-                
-            url = 'https://gnews.io/api/v4/search'
-            params = {
-                'q': query,
-                'token': os.getenv('GNEWS_API_KEY'),
-                'lang': 'en',
-                'max': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with GNews: {str(e)}")
-            return None
-            
-    def _extract_company_name(self, text):
-        """Extract company name from text using NLP"""
-        try:
-            # Common company suffixes
-            suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
-            
-            # Try to find company name with suffix
-            for suffix in suffixes:
-                pattern = fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b'
-                matches = re.findall(pattern, text)
-                if matches:
-                    return matches[0].strip()
-            
-            # Try to find standalone capitalized names (likely company names)
-            pattern = r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b'
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out common non-company words
-                non_companies = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
-                companies = [m for m in matches if m not in non_companies and len(m) > 2]
-                if companies:
-                    return companies[0]
-            
-            return None
-        except Exception as e:
-            print(f"Error extracting company name: {str(e)}")
-            return None
-            
-    def search_duckduckgo(self, query, num_results=10):
-        """Search DuckDuckGo for business stories with rate limiting."""
-        try:
-            time.sleep(2)  # Rate limiting
-            results = list(self.ddgs.text(query, max_results=num_results))
-            processed_results = []
-            
-            for r in results:
-                company_name = self._extract_company_name(r['title'] + ' ' + r['body'])
-                if company_name:
-                    processed_results.append({
-                        'title': r['title'],
-                        'company_name': company_name,
-                        'summary': r['body'],
-                        'url': r['link'],
-                        'source': 'DuckDuckGo',
-                        'content': r['body']
-                    })
-            
-            return processed_results
-        except Exception as e:
-            print(f"Error searching DuckDuckGo: {str(e)}")
-            return []
-            
-    def _try_web_scraping(self, query: str) -> Optional[Dict]:
-        """Fallback to web scraping trusted business news sites"""
-        try:
-            # List of trusted business news sites to search
-            sites = [
-                'techcrunch.com',
-                'forbes.com',
-                'hbr.org',
-                'bloomberg.com',
-                'reuters.com',
-                'fastcompany.com',
-                'inc.com',
-                'technologyreview.com',
-                'businessinsider.com',
-                'wired.com'
-            ]
-            
-            # Create a Google search query targeting specific sites
-            site_query = ' OR '.join(f'site:{site}' for site in sites)
-            search_query = f'{query} ({site_query})'
-            
-            # Use DuckDuckGo as a fallback search engine (no API key needed)
-            results = self.search_duckduckgo(search_query, num_results=1)
-            
-            if results:
-                result = results[0]
-                # Use newspaper3k to extract article content
-                article = Article(result['url'])
-                article.download()
-                article.parse()
-                
-                return {
-                    'title': article.title,
-                    'content': article.text,
-                    'url': result['url'],
-                    'source': urlparse(result['url']).netloc,
-                    'published_date': article.publish_date.isoformat() if article.publish_date else datetime.now().isoformat()
-                }
-            return None
-        except Exception:
-            return None
-
-    def _get_wikipedia_data(self, company_name: str) -> Optional[Dict]:
-        """Get Wikipedia data for a company"""
-        try:
-            # Search Wikipedia for company page
-            search_results = self.wiki.search(company_name)
-            if not search_results:
-                return None
-            
-            # Try to find the most relevant page
-            for page_title in search_results:
-                page = self.wiki.page(page_title)
-                if page.exists() and company_name.lower() in page.title.lower():
-                    # Extract key sections
-                    sections = self._extract_relevant_sections(page)
-                    
-                    # Determine company details
-                    company_details = {
-                        'title': page.title,
-                        'summary': page.summary,
-                        'url': page.fullurl,
-                        'sections': sections,
-                        'content': page.text[:5000],  # First 5000 chars
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    
-                    return company_details
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting Wikipedia data: {str(e)}")
-            return None
-
-    def _determine_story_type(self, wiki_data: Dict) -> str:
-        """Determine the type of story based on content"""
-        content = wiki_data.get('content', '').lower()
-        
-        if any(word in content for word in ['pivot', 'transform', 'change direction', 'reinvent']):
-            return 'pivot'
-        elif any(word in content for word in ['innovate', 'breakthrough', 'revolutionary', 'disrupt']):
-            return 'innovation'
-        elif any(word in content for word in ['success', 'growth', 'achievement', 'milestone']):
-            return 'success'
-        else:
-            return 'general'
-
-    def _calculate_reliability_score(self, story):
-        """Calculate a reliability score for the story based on various factors"""
-        score = 0.5  # Base score
-        
-        # Increase score for reputable sources
-        reputable_sources = ['reuters', 'bloomberg', 'forbes', 'techcrunch', 'wsj', 'nytimes']
-        if any(source in story.get('source', '').lower() for source in reputable_sources):
-            score += 0.3
-            
-        # Check for content quality
-        if story.get('content'):
-            # Length check
-            if len(story['content']) > 1000:
-                score += 0.1
-                
-            # Quote check
-            if '"' in story['content']:
-                score += 0.1
-                
-        return min(1.0, score)
-        
-    def _calculate_engagement_potential(self, story):
-        """Calculate potential engagement score for the story"""
-        score = 0.5  # Base score
-        
-        # Check title appeal
-        title = story.get('title', '').lower()
-        engaging_words = ['breakthrough', 'innovative', 'disrupting', 'revolutionary', 'success']
-        score += 0.1 * sum(1 for word in engaging_words if word in title)
-        
-        # Check content sentiment
-        if story.get('content'):
-            blob = TextBlob(story['content'])
-            sentiment = blob.sentiment.polarity
-            score += 0.2 if sentiment > 0 else 0.1
-            
-        # Industry factor
-        trending_industries = ['technology', 'healthcare', 'ai', 'renewable']
-        if any(ind in story.get('industry', '').lower() for ind in trending_industries):
-            score += 0.2
-            
-        return min(1.0, score)
-
-    def collect_story(self, search_query, industry, subcategory=None, company_size=None, innovation_type=None):
-        """Collect a business innovation story based on search criteria"""
+    def collect_story(self, search_query, industry=None, subcategory=None, company_size=None, innovation_type=None):
+        """Collect a business story for a company (or other search query) from the news providers"""
         try:
             # Search for news articles and case studies
             news_data = self._search_news(search_query)
@@ -868,9 +532,11 @@ class BusinessStoryCollector:
                 return None
             
             # Extract key information
+            content = news_data.get('content', '')
             story = {
                 'title': news_data.get('title', ''),
-                'content': news_data.get('content', ''),
+                'company_name': search_query,
+                'content': content,
                 'url': news_data.get('url', ''),
                 'source': news_data.get('source', ''),
                 'published_date': news_data.get('published_date', datetime.now().isoformat()),
@@ -878,13 +544,16 @@ class BusinessStoryCollector:
                 'subcategory': subcategory,
                 'company_size': company_size,
                 'innovation_type': innovation_type,
-                'sentiment_score': self._analyze_sentiment(news_data.get('content', '')),
-                'reliability_score': self._calculate_source_reliability(news_data.get('source', '')),
+                'story_type': self._determine_story_type({'content': content}),
+                'sentiment_score': self.analyze_sentiment(content),
+                'reliability_score': self._calculate_source_reliability(
+                    news_data.get('source', ''), news_data.get('url', '')
+                ),
                 'collected_at': datetime.now().isoformat()
             }
             
             # Save to database
-            self.db.save_story(story)
+            story['id'] = self.db.save_story(story)
             return story
             
         except Exception as e:
@@ -892,118 +561,17 @@ class BusinessStoryCollector:
             return None
 
     def _search_news(self, query: str) -> Optional[Dict]:
-        """Search for news articles using various news APIs and web scraping"""
+        """Search for news articles across the registered providers"""
         try:
-            # Try multiple news sources in sequence
-            news_data = (
-                self._try_newsapi(query) or
-                self._try_gnews(query) or
-                self._try_web_scraping(query)
-            )
-            return news_data
+            return self.providers.search(query)
         except Exception as e:
             print(f"Error in _search_news: {str(e)}")
             return None
 
-    def _try_newsapi(self, query: str) -> Optional[Dict]:
-        """Try to get story from NewsAPI"""
-        try:
-            if not os.getenv('NEWSAPI_KEY'):
-                return None
-                
-            url = 'https://newsapi.org/v2/everything'
-            params = {
-                'q': query,
-                'apiKey': os.getenv('NEWSAPI_KEY'),
-                'language': 'en',
-                'sortBy': 'relevancy',
-                'pageSize': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with NewsAPI: {str(e)}")
-            return None
-            
-    def _try_gnews(self, query: str) -> Optional[Dict]:
-        """Try to get story from GNews"""
-        try:
-            if not os.getenv('GNEWS_API_KEY'):
-                return None
-                
-            url = 'https://gnews.io/api/v4/search'
-            params = {
-                'q': query,
-                'token': os.getenv('GNEWS_API_KEY'),
-                'lang': 'en',
-                'max': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with GNews: {str(e)}")
-            return None
-            
     def _extract_company_name(self, text):
-        """Extract company name from text using NLP"""
+        """Extract company name from text"""
         try:
-            # Common company suffixes
-            suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
-            
-            # Try to find company name with suffix
-            for suffix in suffixes:
-                pattern = fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b'
-                matches = re.findall(pattern, text)
-                if matches:
-                    return matches[0].strip()
-            
-            # Try to find standalone capitalized names (likely company names)
-            pattern = r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b'
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out common non-company words
-                non_companies = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
-                companies = [m for m in matches if m not in non_companies and len(m) > 2]
-                if companies:
-                    return companies[0]
-            
-            return None
+            return self.company_extractor.extract(text)
         except Exception as e:
             print(f"Error extracting company name: {str(e)}")
             return None
@@ -1011,12 +579,12 @@ class BusinessStoryCollector:
     def search_duckduckgo(self, query, num_results=10):
         """Search DuckDuckGo for business stories with rate limiting."""
         try:
-            time.sleep(2)  # Rate limiting
+            self.fetcher.throttle('duckduckgo.com')  # Rate limiting
             results = list(self.ddgs.text(query, max_results=num_results))
             processed_results = []
+            company_names = self.company_extractor.extract_many(r['title'] + ' ' + r['body'] for r in results)
             
-            for r in results:
-                company_name = self._extract_company_name(r['title'] + ' ' + r['body'])
+            for r, company_name in zip(results, company_names):
                 if company_name:
                     processed_results.append({
                         'title': r['title'],
@@ -1032,59 +600,17 @@ class BusinessStoryCollector:
             print(f"Error searching DuckDuckGo: {str(e)}")
             return []
             
-    def _try_web_scraping(self, query: str) -> Optional[Dict]:
-        """Fallback to web scraping trusted business news sites"""
-        try:
-            # List of trusted business news sites to search
-            sites = [
-                'techcrunch.com',
-                'forbes.com',
-                'hbr.org',
-                'bloomberg.com',
-                'reuters.com',
-                'fastcompany.com',
-                'inc.com',
-                'technologyreview.com',
-                'businessinsider.com',
-                'wired.com'
-            ]
-            
-            # Create a Google search query targeting specific sites
-            site_query = ' OR '.join(f'site:{site}' for site in sites)
-            search_query = f'{query} ({site_query})'
-            
-            # Use DuckDuckGo as a fallback search engine (no API key needed)
-            results = self.search_duckduckgo(search_query, num_results=1)
-            
-            if results:
-                result = results[0]
-                # Use newspaper3k to extract article content
-                article = Article(result['url'])
-                article.download()
-                article.parse()
-                
-                return {
-                    'title': article.title,
-                    'content': article.text,
-                    'url': result['url'],
-                    'source': urlparse(result['url']).netloc,
-                    'published_date': article.publish_date.isoformat() if article.publish_date else datetime.now().isoformat()
-                }
-            return None
-        except Exception:
-            return None
-
     def _get_wikipedia_data(self, company_name: str) -> Optional[Dict]:
         """Get Wikipedia data for a company"""
         try:
             # Search Wikipedia for company page
-            search_results = self.wiki.search(company_name)
+            search_results = self.wiki_store.search(company_name)
             if not search_results:
                 return None
             
-            # Try to find the most relevant page
-            for page_title in search_results:
-                page = self.wiki.page(page_title)
+            # Load the matching candidates in one batch, served locally when stored
+            candidates = [title for title in search_results if company_name.lower() in title.lower()]
+            for page in self.wiki_store.pages(candidates):
                 if page.exists() and company_name.lower() in page.title.lower():
                     # Extract key sections
                     sections = self._extract_relevant_sections(page)
@@ -1109,936 +635,24 @@ class BusinessStoryCollector:
 
     def _determine_story_type(self, wiki_data: Dict) -> str:
         """Determine the type of story based on content"""
-        content = wiki_data.get('content', '').lower()
-        
-        if any(word in content for word in ['pivot', 'transform', 'change direction', 'reinvent']):
-            return 'pivot'
-        elif any(word in content for word in ['innovate', 'breakthrough', 'revolutionary', 'disrupt']):
-            return 'innovation'
-        elif any(word in content for word in ['success', 'growth', 'achievement', 'milestone']):
-            return 'success'
-        else:
-            return 'general'
+        return STORY_TYPE_MATCHER.first_category(
+            wiki_data.get('content', ''), ['pivot', 'innovation', 'success'], default='general'
+        )
 
-    def _calculate_reliability_score(self, story):
-        """Calculate a reliability score for the story based on various factors"""
-        score = 0.5  # Base score
-        
-        # Increase score for reputable sources
-        reputable_sources = ['reuters', 'bloomberg', 'forbes', 'techcrunch', 'wsj', 'nytimes']
-        if any(source in story.get('source', '').lower() for source in reputable_sources):
-            score += 0.3
-            
-        # Check for content quality
-        if story.get('content'):
-            # Length check
-            if len(story['content']) > 1000:
-                score += 0.1
-                
-            # Quote check
-            if '"' in story['content']:
-                score += 0.1
-                
-        return min(1.0, score)
-        
-    def _calculate_engagement_potential(self, story):
-        """Calculate potential engagement score for the story"""
-        score = 0.5  # Base score
-        
-        # Check title appeal
-        title = story.get('title', '').lower()
-        engaging_words = ['breakthrough', 'innovative', 'disrupting', 'revolutionary', 'success']
-        score += 0.1 * sum(1 for word in engaging_words if word in title)
-        
-        # Check content sentiment
-        if story.get('content'):
-            blob = TextBlob(story['content'])
-            sentiment = blob.sentiment.polarity
-            score += 0.2 if sentiment > 0 else 0.1
-            
-        # Industry factor
-        trending_industries = ['technology', 'healthcare', 'ai', 'renewable']
-        if any(ind in story.get('industry', '').lower() for ind in trending_industries):
-            score += 0.2
-            
-        return min(1.0, score)
-
-    def collect_story(self, search_query, industry, subcategory=None, company_size=None, innovation_type=None):
-        """Collect a business innovation story based on search criteria"""
-        try:
-            # Search for news articles and case studies
-            news_data = self._search_news(search_query)
-            if not news_data:
-                return None
-            
-            # Extract key information
-            story = {
-                'title': news_data.get('title', ''),
-                'content': news_data.get('content', ''),
-                'url': news_data.get('url', ''),
-                'source': news_data.get('source', ''),
-                'published_date': news_data.get('published_date', datetime.now().isoformat()),
-                'industry': industry,
-                'subcategory': subcategory,
-                'company_size': company_size,
-                'innovation_type': innovation_type,
-                'sentiment_score': self._analyze_sentiment(news_data.get('content', '')),
-                'reliability_score': self._calculate_source_reliability(news_data.get('source', '')),
-                'collected_at': datetime.now().isoformat()
-            }
-            
-            # Save to database
-            self.db.save_story(story)
-            return story
-            
-        except Exception as e:
-            print(f"Error in collect_story: {str(e)}")
-            return None
-
-    def _search_news(self, query: str) -> Optional[Dict]:
-        """Search for news articles using various news APIs and web scraping"""
-        try:
-            # Try multiple news sources in sequence
-            news_data = (
-                self._try_newsapi(query) or
-                self._try_gnews(query) or
-                self._try_web_scraping(query)
-            )
-            return news_data
-        except Exception as e:
-            print(f"Error in _search_news: {str(e)}")
-            return None
-
-    def _try_newsapi(self, query: str) -> Optional[Dict]:
-        """Try to get story from NewsAPI"""
-        try:
-            if not os.getenv('NEWSAPI_KEY'):
-                return None
-                
-            url = 'https://newsapi.org/v2/everything'
-            params = {
-                'q': query,
-                'apiKey': os.getenv('NEWSAPI_KEY'),
-                'language': 'en',
-                'sortBy': 'relevancy',
-                'pageSize': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with NewsAPI: {str(e)}")
-            return None
-            
-    def _try_gnews(self, query: str) -> Optional[Dict]:
-        """Try to get story from GNews"""
-        try:
-            if not os.getenv('GNEWS_API_KEY'):
-                return None
-                
-            url = 'https://gnews.io/api/v4/search'
-            params = {
-                'q': query,
-                'token': os.getenv('GNEWS_API_KEY'),
-                'lang': 'en',
-                'max': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with GNews: {str(e)}")
-            return None
-            
-    def _extract_company_name(self, text):
-        """Extract company name from text using NLP"""
-        try:
-            # Common company suffixes
-            suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
-            
-            # Try to find company name with suffix
-            for suffix in suffixes:
-                pattern = fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b'
-                matches = re.findall(pattern, text)
-                if matches:
-                    return matches[0].strip()
-            
-            # Try to find standalone capitalized names (likely company names)
-            pattern = r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b'
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out common non-company words
-                non_companies = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
-                companies = [m for m in matches if m not in non_companies and len(m) > 2]
-                if companies:
-                    return companies[0]
-            
-            return None
-        except Exception as e:
-            print(f"Error extracting company name: {str(e)}")
-            return None
-            
-    def search_duckduckgo(self, query, num_results=10):
-        """Search DuckDuckGo for business stories with rate limiting."""
-        try:
-            time.sleep(2)  # Rate limiting
-            results = list(self.ddgs.text(query, max_results=num_results))
-            processed_results = []
-            
-            for r in results:
-                company_name = self._extract_company_name(r['title'] + ' ' + r['body'])
-                if company_name:
-                    processed_results.append({
-                        'title': r['title'],
-                        'company_name': company_name,
-                        'summary': r['body'],
-                        'url': r['link'],
-                        'source': 'DuckDuckGo',
-                        'content': r['body']
-                    })
-            
-            return processed_results
-        except Exception as e:
-            print(f"Error searching DuckDuckGo: {str(e)}")
-            return []
-            
-    def _try_web_scraping(self, query: str) -> Optional[Dict]:
-        """Fallback to web scraping trusted business news sites"""
-        try:
-            # List of trusted business news sites to search
-            sites = [
-                'techcrunch.com',
-                'forbes.com',
-                'hbr.org',
-                'bloomberg.com',
-                'reuters.com',
-                'fastcompany.com',
-                'inc.com',
-                'technologyreview.com',
-                'businessinsider.com',
-                'wired.com'
-            ]
-            
-            # Create a Google search query targeting specific sites
-            site_query = ' OR '.join(f'site:{site}' for site in sites)
-            search_query = f'{query} ({site_query})'
-            
-            # Use DuckDuckGo as a fallback search engine (no API key needed)
-            results = self.search_duckduckgo(search_query, num_results=1)
-            
-            if results:
-                result = results[0]
-                # Use newspaper3k to extract article content
-                article = Article(result['url'])
-                article.download()
-                article.parse()
-                
-                return {
-                    'title': article.title,
-                    'content': article.text,
-                    'url': result['url'],
-                    'source': urlparse(result['url']).netloc,
-                    'published_date': article.publish_date.isoformat() if article.publish_date else datetime.now().isoformat()
-                }
-            return None
-        except Exception:
-            return None
-
-    def _get_wikipedia_data(self, company_name: str) -> Optional[Dict]:
-        """Get Wikipedia data for a company"""
-        try:
-            # Search Wikipedia for company page
-            search_results = self.wiki.search(company_name)
-            if not search_results:
-                return None
-            
-            # Try to find the most relevant page
-            for page_title in search_results:
-                page = self.wiki.page(page_title)
-                if page.exists() and company_name.lower() in page.title.lower():
-                    # Extract key sections
-                    sections = self._extract_relevant_sections(page)
-                    
-                    # Determine company details
-                    company_details = {
-                        'title': page.title,
-                        'summary': page.summary,
-                        'url': page.fullurl,
-                        'sections': sections,
-                        'content': page.text[:5000],  # First 5000 chars
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    
-                    return company_details
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting Wikipedia data: {str(e)}")
-            return None
-
-    def _determine_story_type(self, wiki_data: Dict) -> str:
-        """Determine the type of story based on content"""
-        content = wiki_data.get('content', '').lower()
-        
-        if any(word in content for word in ['pivot', 'transform', 'change direction', 'reinvent']):
-            return 'pivot'
-        elif any(word in content for word in ['innovate', 'breakthrough', 'revolutionary', 'disrupt']):
-            return 'innovation'
-        elif any(word in content for word in ['success', 'growth', 'achievement', 'milestone']):
-            return 'success'
-        else:
-            return 'general'
-
-    def _calculate_reliability_score(self, story):
-        """Calculate a reliability score for the story based on various factors"""
-        score = 0.5  # Base score
-        
-        # Increase score for reputable sources
-        reputable_sources = ['reuters', 'bloomberg', 'forbes', 'techcrunch', 'wsj', 'nytimes']
-        if any(source in story.get('source', '').lower() for source in reputable_sources):
-            score += 0.3
-            
-        # Check for content quality
-        if story.get('content'):
-            # Length check
-            if len(story['content']) > 1000:
-                score += 0.1
-                
-            # Quote check
-            if '"' in story['content']:
-                score += 0.1
-                
-        return min(1.0, score)
-        
-    def _calculate_engagement_potential(self, story):
-        """Calculate potential engagement score for the story"""
-        score = 0.5  # Base score
-        
-        # Check title appeal
-        title = story.get('title', '').lower()
-        engaging_words = ['breakthrough', 'innovative', 'disrupting', 'revolutionary', 'success']
-        score += 0.1 * sum(1 for word in engaging_words if word in title)
-        
-        # Check content sentiment
-        if story.get('content'):
-            blob = TextBlob(story['content'])
-            sentiment = blob.sentiment.polarity
-            score += 0.2 if sentiment > 0 else 0.1
-            
-        # Industry factor
-        trending_industries = ['technology', 'healthcare', 'ai', 'renewable']
-        if any(ind in story.get('industry', '').lower() for ind in trending_industries):
-            score += 0.2
-            
-        return min(1.0, score)
-
-    def collect_story(self, search_query, industry, subcategory=None, company_size=None, innovation_type=None):
-        """Collect a business innovation story based on search criteria"""
-        try:
-            # Search for news articles and case studies
-            news_data = self._search_news(search_query)
-            if not news_data:
-                return None
-            
-            # Extract key information
-            story = {
-                'title': news_data.get('title', ''),
-                'content': news_data.get('content', ''),
-                'url': news_data.get('url', ''),
-                'source': news_data.get('source', ''),
-                'published_date': news_data.get('published_date', datetime.now().isoformat()),
-                'industry': industry,
-                'subcategory': subcategory,
-                'company_size': company_size,
-                'innovation_type': innovation_type,
-                'sentiment_score': self._analyze_sentiment(news_data.get('content', '')),
-                'reliability_score': self._calculate_source_reliability(news_data.get('source', '')),
-                'collected_at': datetime.now().isoformat()
-            }
-            
-            # Save to database
-            self.db.save_story(story)
-            return story
-            
-        except Exception as e:
-            print(f"Error in collect_story: {str(e)}")
-            return None
-
-    def _search_news(self, query: str) -> Optional[Dict]:
-        """Search for news articles using various news APIs and web scraping"""
-        try:
-            # Try multiple news sources in sequence
-            news_data = (
-                self._try_newsapi(query) or
-                self._try_gnews(query) or
-                self._try_web_scraping(query)
-            )
-            return news_data
-        except Exception as e:
-            print(f"Error in _search_news: {str(e)}")
-            return None
-
-    def _try_newsapi(self, query: str) -> Optional[Dict]:
-        """Try to get story from NewsAPI"""
-        try:
-            if not os.getenv('NEWSAPI_KEY'):
-                return None
-                
-            url = 'https://newsapi.org/v2/everything'
-            params = {
-                'q': query,
-                'apiKey': os.getenv('NEWSAPI_KEY'),
-                'language': 'en',
-                'sortBy': 'relevancy',
-                'pageSize': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with NewsAPI: {str(e)}")
-            return None
-            
-    def _try_gnews(self, query: str) -> Optional[Dict]:
-        """Try to get story from GNews"""
-        try:
-            if not os.getenv('GNEWS_API_KEY'):
-                return None
-                
-            url = 'https://gnews.io/api/v4/search'
-            params = {
-                'q': query,
-                'token': os.getenv('GNEWS_API_KEY'),
-                'lang': 'en',
-                'max': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with GNews: {str(e)}")
-            return None
-            
-    def _extract_company_name(self, text):
-        """Extract company name from text using NLP"""
-        try:
-            # Common company suffixes
-            suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
-            
-            # Try to find company name with suffix
-            for suffix in suffixes:
-                pattern = fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b'
-                matches = re.findall(pattern, text)
-                if matches:
-                    return matches[0].strip()
-            
-            # Try to find standalone capitalized names (likely company names)
-            pattern = r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b'
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out common non-company words
-                non_companies = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
-                companies = [m for m in matches if m not in non_companies and len(m) > 2]
-                if companies:
-                    return companies[0]
-            
-            return None
-        except Exception as e:
-            print(f"Error extracting company name: {str(e)}")
-            return None
-            
-    def search_duckduckgo(self, query, num_results=10):
-        """Search DuckDuckGo for business stories with rate limiting."""
-        try:
-            time.sleep(2)  # Rate limiting
-            results = list(self.ddgs.text(query, max_results=num_results))
-            processed_results = []
-            
-            for r in results:
-                company_name = self._extract_company_name(r['title'] + ' ' + r['body'])
-                if company_name:
-                    processed_results.append({
-                        'title': r['title'],
-                        'company_name': company_name,
-                        'summary': r['body'],
-                        'url': r['link'],
-                        'source': 'DuckDuckGo',
-                        'content': r['body']
-                    })
-            
-            return processed_results
-        except Exception as e:
-            print(f"Error searching DuckDuckGo: {str(e)}")
-            return []
-            
-    def _try_web_scraping(self, query: str) -> Optional[Dict]:
-        """Fallback to web scraping trusted business news sites"""
-        try:
-            # List of trusted business news sites to search
-            sites = [
-                'techcrunch.com',
-                'forbes.com',
-                'hbr.org',
-                'bloomberg.com',
-                'reuters.com',
-                'fastcompany.com',
-                'inc.com',
-                'technologyreview.com',
-                'businessinsider.com',
-                'wired.com'
-            ]
-            
-            # Create a Google search query targeting specific sites
-            site_query = ' OR '.join(f'site:{site}' for site in sites)
-            search_query = f'{query} ({site_query})'
-            
-            # Use DuckDuckGo as a fallback search engine (no API key needed)
-            results = self.search_duckduckgo(search_query, num_results=1)
-            
-            if results:
-                result = results[0]
-                # Use newspaper3k to extract article content
-                article = Article(result['url'])
-                article.download()
-                article.parse()
-                
-                return {
-                    'title': article.title,
-                    'content': article.text,
-                    'url': result['url'],
-                    'source': urlparse(result['url']).netloc,
-                    'published_date': article.publish_date.isoformat() if article.publish_date else datetime.now().isoformat()
-                }
-            return None
-        except Exception:
-            return None
-
-    def _get_wikipedia_data(self, company_name: str) -> Optional[Dict]:
-        """Get Wikipedia data for a company"""
-        try:
-            # Search Wikipedia for company page
-            search_results = self.wiki.search(company_name)
-            if not search_results:
-                return None
-            
-            # Try to find the most relevant page
-            for page_title in search_results:
-                page = self.wiki.page(page_title)
-                if page.exists() and company_name.lower() in page.title.lower():
-                    # Extract key sections
-                    sections = self._extract_relevant_sections(page)
-                    
-                    # Determine company details
-                    company_details = {
-                        'title': page.title,
-                        'summary': page.summary,
-                        'url': page.fullurl,
-                        'sections': sections,
-                        'content': page.text[:5000],  # First 5000 chars
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    
-                    return company_details
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting Wikipedia data: {str(e)}")
-            return None
-
-    def _determine_story_type(self, wiki_data: Dict) -> str:
-        """Determine the type of story based on content"""
-        content = wiki_data.get('content', '').lower()
-        
-        if any(word in content for word in ['pivot', 'transform', 'change direction', 'reinvent']):
-            return 'pivot'
-        elif any(word in content for word in ['innovate', 'breakthrough', 'revolutionary', 'disrupt']):
-            return 'innovation'
-        elif any(word in content for word in ['success', 'growth', 'achievement', 'milestone']):
-            return 'success'
-        else:
-            return 'general'
-
-    def _calculate_reliability_score(self, story):
-        """Calculate a reliability score for the story based on various factors"""
-        score = 0.5  # Base score
-        
-        # Increase score for reputable sources
-        reputable_sources = ['reuters', 'bloomberg', 'forbes', 'techcrunch', 'wsj', 'nytimes']
-        if any(source in story.get('source', '').lower() for source in reputable_sources):
-            score += 0.3
-            
-        # Check for content quality
-        if story.get('content'):
-            # Length check
-            if len(story['content']) > 1000:
-                score += 0.1
-                
-            # Quote check
-            if '"' in story['content']:
-                score += 0.1
-                
-        return min(1.0, score)
-        
-    def _calculate_engagement_potential(self, story):
-        """Calculate potential engagement score for the story"""
-        score = 0.5  # Base score
-        
-        # Check title appeal
-        title = story.get('title', '').lower()
-        engaging_words = ['breakthrough', 'innovative', 'disrupting', 'revolutionary', 'success']
-        score += 0.1 * sum(1 for word in engaging_words if word in title)
-        
-        # Check content sentiment
-        if story.get('content'):
-            blob = TextBlob(story['content'])
-            sentiment = blob.sentiment.polarity
-            score += 0.2 if sentiment > 0 else 0.1
-            
-        # Industry factor
-        trending_industries = ['technology', 'healthcare', 'ai', 'renewable']
-        if any(ind in story.get('industry', '').lower() for ind in trending_industries):
-            score += 0.2
-            
-        return min(1.0, score)
-
-    def collect_story(self, search_query, industry, subcategory=None, company_size=None, innovation_type=None):
-        """Collect a business innovation story based on search criteria"""
-        try:
-            # Search for news articles and case studies
-            news_data = self._search_news(search_query)
-            if not news_data:
-                return None
-            
-            # Extract key information
-            story = {
-                'title': news_data.get('title', ''),
-                'content': news_data.get('content', ''),
-                'url': news_data.get('url', ''),
-                'source': news_data.get('source', ''),
-                'published_date': news_data.get('published_date', datetime.now().isoformat()),
-                'industry': industry,
-                'subcategory': subcategory,
-                'company_size': company_size,
-                'innovation_type': innovation_type,
-                'sentiment_score': self._analyze_sentiment(news_data.get('content', '')),
-                'reliability_score': self._calculate_source_reliability(news_data.get('source', '')),
-                'collected_at': datetime.now().isoformat()
-            }
-            
-            # Save to database
-            self.db.save_story(story)
-            return story
-            
-        except Exception as e:
-            print(f"Error in collect_story: {str(e)}")
-            return None
-
-    def _search_news(self, query: str) -> Optional[Dict]:
-        """Search for news articles using various news APIs and web scraping"""
-        try:
-            # Try multiple news sources in sequence
-            news_data = (
-                self._try_newsapi(query) or
-                self._try_gnews(query) or
-                self._try_web_scraping(query)
-            )
-            return news_data
-        except Exception as e:
-            print(f"Error in _search_news: {str(e)}")
-            return None
-
-    def _try_newsapi(self, query: str) -> Optional[Dict]:
-        """Try to get story from NewsAPI"""
-        try:
-            if not os.getenv('NEWSAPI_KEY'):
-                return None
-                
-            url = 'https://newsapi.org/v2/everything'
-            params = {
-                'q': query,
-                'apiKey': os.getenv('NEWSAPI_KEY'),
-                'language': 'en',
-                'sortBy': 'relevancy',
-                'pageSize': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with NewsAPI: {str(e)}")
-            return None
-            
-    def _try_gnews(self, query: str) -> Optional[Dict]:
-        """Try to get story from GNews"""
-        try:
-            if not os.getenv('GNEWS_API_KEY'):
-                return None
-                
-            url = 'https://gnews.io/api/v4/search'
-            params = {
-                'q': query,
-                'token': os.getenv('GNEWS_API_KEY'),
-                'lang': 'en',
-                'max': 1
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['articles']:
-                    article = data['articles'][0]
-                    
-                    # Extract company name from title or description
-                    company_name = self._extract_company_name(article['title'] + ' ' + article['description'])
-                    
-                    if company_name:
-                        return {
-                            'title': article['title'],
-                            'company_name': company_name,
-                            'summary': article['description'],
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'content': article['content'] if 'content' in article else article['description']
-                        }
-            return None
-        except Exception as e:
-            print(f"Error with GNews: {str(e)}")
-            return None
-            
-    def _extract_company_name(self, text):
-        """Extract company name from text using NLP"""
-        try:
-            # Common company suffixes
-            suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
-            
-            # Try to find company name with suffix
-            for suffix in suffixes:
-                pattern = fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b'
-                matches = re.findall(pattern, text)
-                if matches:
-                    return matches[0].strip()
-            
-            # Try to find standalone capitalized names (likely company names)
-            pattern = r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b'
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out common non-company words
-                non_companies = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
-                companies = [m for m in matches if m not in non_companies and len(m) > 2]
-                if companies:
-                    return companies[0]
-            
-            return None
-        except Exception as e:
-            print(f"Error extracting company name: {str(e)}")
-            return None
-            
-    def search_duckduckgo(self, query, num_results=10):
-        """Search DuckDuckGo for business stories with rate limiting."""
-        try:
-            time.sleep(2)  # Rate limiting
-            results = list(self.ddgs.text(query, max_results=num_results))
-            processed_results = []
-            
-            for r in results:
-                company_name = self._extract_company_name(r['title'] + ' ' + r['body'])
-                if company_name:
-                    processed_results.append({
-                        'title': r['title'],
-                        'company_name': company_name,
-                        'summary': r['body'],
-                        'url': r['link'],
-                        'source': 'DuckDuckGo',
-                        'content': r['body']
-                    })
-            
-            return processed_results
-        except Exception as e:
-            print(f"Error searching DuckDuckGo: {str(e)}")
-            return []
-            
-    def _try_web_scraping(self, query: str) -> Optional[Dict]:
-        """Fallback to web scraping trusted business news sites"""
-        try:
-            # List of trusted business news sites to search
-            sites = [
-                'techcrunch.com',
-                'forbes.com',
-                'hbr.org',
-                'bloomberg.com',
-                'reuters.com',
-                'fastcompany.com',
-                'inc.com',
-                'technologyreview.com',
-                'businessinsider.com',
-                'wired.com'
-            ]
-            
-            # Create a Google search query targeting specific sites
-            site_query = ' OR '.join(f'site:{site}' for site in sites)
-            search_query = f'{query} ({site_query})'
-            
-            # Use DuckDuckGo as a fallback search engine (no API key needed)
-            results = self.search_duckduckgo(search_query, num_results=1)
-            
-            if results:
-                result = results[0]
-                # Use newspaper3k to extract article content
-                article = Article(result['url'])
-                article.download()
-                article.parse()
-                
-                return {
-                    'title': article.title,
-                    'content': article.text,
-                    'url': result['url'],
-                    'source': urlparse(result['url']).netloc,
-                    'published_date': article.publish_date.isoformat() if article.publish_date else datetime.now().isoformat()
-                }
-            return None
-        except Exception:
-            return None
-
-    def _get_wikipedia_data(self, company_name: str) -> Optional[Dict]:
-        """Get Wikipedia data for a company"""
-        try:
-            # Search Wikipedia for company page
-            search_results = self.wiki.search(company_name)
-            if not search_results:
-                return None
-            
-            # Try to find the most relevant page
-            for page_title in search_results:
-                page = self.wiki.page(page_title)
-                if page.exists() and company_name.lower() in page.title.lower():
-                    # Extract key sections
-                    sections = self._extract_relevant_sections(page)
-                    
-                    # Determine company details
-                    company_details = {
-                        'title': page.title,
-                        'summary': page.summary,
-                        'url': page.fullurl,
-                        'sections': sections,
-                        'content': page.text[:5000],  # First 5000 chars
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    
-                    return company_details
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting Wikipedia data: {str(e)}")
-            return None
-
-    def _determine_story_type(self, wiki_data: Dict) -> str:
-        """Determine the type of story based on content"""
-        content = wiki_data.get('content', '').lower()
-        
-        if any(word in content for word in ['pivot', 'transform', 'change direction', 'reinvent']):
-            return 'pivot'
-        elif any(word in content for word in ['innovate', 'breakthrough', 'revolutionary', 'disrupt']):
-            return 'innovation'
-        elif any(word in content for word in ['success', 'growth', 'achievement', 'milestone']):
-            return 'success'
-        else:
-            return 'general'
+    def _calculate_source_reliability(self, source: str, url: str = '') -> float:
+        """Reliability of a news source, from the trusted source weights"""
+        text = f"{source} {url}".lower()
+        for domain, info in self.trusted_sources.items():
+            if domain in text or domain.split('.')[0] in text.split():
+                return info['weight']
+        return 0.8 if REPUTABLE_SOURCE_MATCHER.categories_found(text) else 0.5
 
     def _calculate_reliability_score(self, story):
         """Calculate a reliability score for the story based on various factors"""
         score = 0.5  # Base score
         
         # Increase score for reputable sources
-        reputable_sources = ['reuters', 'bloomberg', 'forbes', 'techcrunch', 'wsj', 'nytimes']
-        if any(source in story.get('source', '').lower() for source in reputable_sources):
+        if REPUTABLE_SOURCE_MATCHER.categories_found(story.get('source', '')):
             score += 0.3
             
         # Check for content quality
@@ -2058,31 +672,24 @@ class BusinessStoryCollector:
         score = 0.5  # Base score
         
         # Check title appeal
-        title = story.get('title', '').lower()
-        engaging_words = ['breakthrough', 'innovative', 'disrupting', 'revolutionary', 'success']
-        score += 0.1 * sum(1 for word in engaging_words if word in title)
+        score += 0.1 * ENGAGING_TITLE_MATCHER.counts(story.get('title', ''))['engaging']
         
         # Check content sentiment
         if story.get('content'):
-            blob = TextBlob(story['content'])
-            sentiment = blob.sentiment.polarity
+            sentiment = self.sentiment.polarity(story['content'])
             score += 0.2 if sentiment > 0 else 0.1
             
         # Industry factor
-        trending_industries = ['technology', 'healthcare', 'ai', 'renewable']
-        if any(ind in story.get('industry', '').lower() for ind in trending_industries):
+        if TRENDING_INDUSTRY_MATCHER.categories_found(story.get('industry', '')):
             score += 0.2
             
         return min(1.0, score)
 
-    def get_random_stories(self, count: int = 5) -> List[Dict]:
-        """Get random stories from the database"""
+    def get_random_stories(self, count: int = 5, industry: Optional[str] = None,
+                           exclude_recent: bool = True) -> List[Dict]:
+        """Get random stories from the database, weighted by story preferences"""
         print("Fetching random stories from database...")
-        stories = self.db.execute("""
-            SELECT * FROM business_stories 
-            ORDER BY RANDOM() 
-            LIMIT %s
-        """, (count,))
+        stories = self.sampler.sample(count, industry=industry, exclude_recent=exclude_recent)
         print(f"Found {len(stories)} stories in database")
         return stories
 
@@ -0,0 +1,193 @@
+import os
+import time
+import random
+import bisect
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+
+class StorySampler:
+    """Random story sampling from a cached pool of story IDs.
+
+    The pool of (id, industry, story_type) rows and preference weights is
+    loaded once and refreshed in the background, so each sample costs O(k)
+    draws plus a primary key lookup instead of ORDER BY RANDOM() over the
+    whole table.
+    """
+
+    def __init__(self, db, refresh_interval: float = None, recent_size: int = None):
+        self.db = db
+        self.refresh_interval = refresh_interval or float(os.getenv('STORY_POOL_REFRESH', 300))
+        self.recent = deque(maxlen=recent_size or int(os.getenv('STORY_RECENT_SIZE', 50)))
+        self.logger = logging.getLogger(__name__)
+        self._groups = None
+        self._loaded_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        # Held while the pool is loaded synchronously, so concurrent first
+        # samples wait for one load instead of each running their own
+        self._load_lock = threading.Lock()
+
+    def _load_weights(self) -> List[Dict]:
+        """Load story preference weights, if the table exists"""
+        try:
+            return self.db.execute("""
+                SELECT industry, story_type, weight
+                FROM story_preferences
+                WHERE weight IS NOT NULL
+            """)
+        except Exception:
+            return []
+
+    def _story_weight(self, row: Dict, preferences: List[Dict]) -> float:
+        """Combine every preference that matches a story's industry and type"""
+        weight = 1.0
+        for pref in preferences:
+            if pref['industry'] and pref['industry'] != row['industry']:
+                continue
+            if pref['story_type'] and pref['story_type'] != row['story_type']:
+                continue
+            weight *= pref['weight']
+        return max(weight, 0.0)
+
+    def _build_groups(self) -> Dict:
+        """Load the id pool and index it by industry"""
+        rows = self.db.execute("SELECT id, industry, story_type FROM business_stories")
+        preferences = self._load_weights()
+
+        members = {None: []}
+        for row in rows:
+            entry = (row['id'], self._story_weight(row, preferences))
+            members[None].append(entry)
+            members.setdefault((row['industry'] or '').lower(), []).append(entry)
+
+        groups = {}
+        for key, entries in members.items():
+            ids = [story_id for story_id, _ in entries]
+            weights = [weight for _, weight in entries]
+            if len(set(weights)) > 1 or not any(weights):
+                cumulative = []
+                total = 0.0
+                for weight in weights:
+                    total += weight
+                    cumulative.append(total)
+            else:
+                cumulative = None  # Uniform
+            groups[key] = (ids, cumulative)
+        return groups
+
+    def _refresh(self):
+        try:
+            groups = self._build_groups()
+            with self._lock:
+                self._groups = groups
+                self._loaded_at = time.monotonic()
+        except Exception as e:
+            self.logger.error(f"Error refreshing story pool: {str(e)}")
+        finally:
+            self._refreshing = False
+
+    def _get_groups(self) -> Dict:
+        """Get the id pool, loading it on first use and refreshing it in the background"""
+        with self._lock:
+            groups = self._groups
+            stale = time.monotonic() - self._loaded_at > self.refresh_interval
+            if groups is not None and stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh, name='story-pool-refresh', daemon=True).start()
+        if groups is None:
+            with self._load_lock:
+                groups = self._groups
+                if groups is None:
+                    self._refreshing = True
+                    self._refresh()
+                    groups = self._groups or {}
+        return groups
+
+    def invalidate(self):
+        """Force the next sample to reload the id pool"""
+        with self._lock:
+            self._groups = None
+
+    def _draw(self, ids: List[int], cumulative: Optional[List[float]], k: int, exclude: set) -> List[int]:
+        """Draw up to k distinct ids not in exclude"""
+        chosen = []
+        seen = set(exclude)
+        if not ids or (cumulative is not None and cumulative[-1] <= 0):
+            return chosen
+
+        max_attempts = 10 * k + 20
+        for _ in range(max_attempts):
+            if len(chosen) >= k:
+                break
+            if cumulative is None:
+                index = random.randrange(len(ids))
+            else:
+                index = min(bisect.bisect_right(cumulative, random.random() * cumulative[-1]), len(ids) - 1)
+            story_id = ids[index]
+            if story_id not in seen:
+                seen.add(story_id)
+                chosen.append(story_id)
+
+        if len(chosen) < k:
+            # Most of the group was excluded or already drawn; finish over what is left
+            chosen.extend(self._draw_remaining(ids, cumulative, k - len(chosen), seen))
+        return chosen
+
+    @staticmethod
+    def _draw_remaining(ids: List[int], cumulative: Optional[List[float]], k: int, seen: set) -> List[int]:
+        """Draw up to k ids not in seen without replacement, keeping the weights"""
+        if cumulative is None:
+            remaining = [story_id for story_id in ids if story_id not in seen]
+            return random.sample(remaining, min(k, len(remaining)))
+
+        remaining, weights = [], []
+        previous = 0.0
+        for story_id, total in zip(ids, cumulative):
+            weight = total - previous
+            previous = total
+            if weight > 0 and story_id not in seen:
+                remaining.append(story_id)
+                weights.append(weight)
+
+        chosen = []
+        while remaining and len(chosen) < k:
+            totals = []
+            total = 0.0
+            for weight in weights:
+                total += weight
+                totals.append(total)
+            index = min(bisect.bisect_right(totals, random.random() * total), len(remaining) - 1)
+            chosen.append(remaining.pop(index))
+            weights.pop(index)
+        return chosen
+
+    def sample_ids(self, count: int, industry: Optional[str] = None, exclude_recent: bool = True) -> List[int]:
+        """Sample story ids, optionally within an industry"""
+        groups = self._get_groups()
+        ids, cumulative = groups.get(industry.lower() if industry else None, ([], None))
+        exclude = set(self.recent) if exclude_recent else set()
+
+        sampled = self._draw(ids, cumulative, count, exclude)
+        if len(sampled) < count and exclude:
+            # Not enough unused stories; allow recently used ones
+            sampled.extend(self._draw(ids, cumulative, count - len(sampled), set(sampled)))
+        return sampled
+
+    def sample(self, count: int, industry: Optional[str] = None, exclude_recent: bool = True) -> List[Dict]:
+        """Sample full story rows"""
+        story_ids = self.sample_ids(count, industry, exclude_recent)
+        if not story_ids:
+            return []
+
+        rows = self.db.execute("SELECT * FROM business_stories WHERE id = ANY(%s)", (story_ids,))
+        if len(rows) < len(story_ids):
+            # Some ids were deleted since the pool was loaded
+            self.invalidate()
+
+        by_id = {row['id']: row for row in rows}
+        stories = [by_id[story_id] for story_id in story_ids if story_id in by_id]
+        self.recent.extend(story['id'] for story in stories)
+        return stories
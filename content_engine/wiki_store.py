@@ -0,0 +1,313 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from .fetcher import get_fetch_engine
+
+WIKI_API_URL = 'https://en.wikipedia.org/w/api.php'
+
+# Section titles worth keeping for business stories
+RELEVANT_SECTION_KEYWORDS = ['history', 'business', 'development', 'growth', 'pivot', 'transformation']
+
+# MediaWiki allows up to 50 titles per query. TextExtracts only returns
+# one full-text extract per request (several only with exintro), so page
+# text is fetched per title, concurrently, after the batched revision check
+TITLES_PER_REQUEST = 50
+
+_HEADING = re.compile(r'^(={2,6})\s*(.+?)\s*\1\s*$', re.MULTILINE)
+
+
+def split_sections(text: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """Split a plain-text extract into its lead and (heading, body) sections"""
+    matches = list(_HEADING.finditer(text))
+    if not matches:
+        return text.strip(), []
+    sections = []
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        sections.append((match.group(2), text[match.end():end].strip()))
+    return text[:matches[0].start()].strip(), sections
+
+
+def relevant_sections(sections: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Keep the sections whose titles mention a business keyword"""
+    return {
+        title: body for title, body in sections
+        if any(keyword in title.lower() for keyword in RELEVANT_SECTION_KEYWORDS)
+    }
+
+
+class WikiSection:
+    """A stored page section, shaped like a wikipediaapi section"""
+
+    def __init__(self, title: str, text: str):
+        self.title = title
+        self.text = text
+
+
+class WikiPage:
+    """A Wikipedia page served from the local store.
+
+    Exposes the attributes the collector reads from wikipediaapi pages
+    (title, summary, fullurl, text, sections, exists()); sections holds
+    only the pre-extracted relevant ones.
+    """
+
+    def __init__(self, title: str, pageid: Optional[int] = None, revision: Optional[int] = None,
+                 fullurl: str = '', summary: str = '', text: str = '',
+                 relevant_sections: Dict[str, str] = None):
+        self.title = title
+        self.pageid = pageid
+        self.revision = revision
+        self.fullurl = fullurl
+        self.summary = summary
+        self.text = text
+        self.relevant_sections = relevant_sections or {}
+
+    @property
+    def sections(self) -> List[WikiSection]:
+        return [WikiSection(title, text) for title, text in self.relevant_sections.items()]
+
+    def exists(self) -> bool:
+        return self.pageid is not None
+
+
+class WikiPageStore:
+    """Local Wikipedia page store keyed by title and revision.
+
+    Pages are kept in SQLite with their summary and relevant sections.
+    Within the TTL a page is served locally; after it, one batched
+    MediaWiki query checks the latest revision of every stale title and
+    only pages that actually changed are downloaded again. Search results
+    are cached for the same TTL.
+    """
+
+    def __init__(self, db_path: str = None, ttl: float = None, fetcher=None):
+        self.fetcher = fetcher or get_fetch_engine()
+        self.db_path = db_path or os.getenv('WIKI_STORE_PATH', 'wiki_pages.db')
+        self.ttl = ttl if ttl is not None else float(os.getenv('WIKI_STORE_TTL', 7 * 24 * 3600))
+        self.logger = logging.getLogger(__name__)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the page store tables if they don't exist"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS wiki_pages (
+                    title TEXT PRIMARY KEY,
+                    pageid INTEGER NOT NULL,
+                    revision INTEGER NOT NULL,
+                    fullurl TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    sections TEXT NOT NULL,
+                    checked_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS wiki_aliases (
+                    alias TEXT PRIMARY KEY,
+                    title TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS wiki_searches (
+                    query TEXT PRIMARY KEY,
+                    titles TEXT NOT NULL,
+                    searched_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def _api(self, **params) -> Dict:
+        """Call the MediaWiki query API"""
+        params.update({'action': 'query', 'format': 'json', 'formatversion': 2})
+        response = self.fetcher.get(WIKI_API_URL, params=params, use_cache=False)
+        response.raise_for_status()
+        return response.json()
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Search page titles, cached for the TTL"""
+        key = f"{query.lower()}|{limit}"
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT titles, searched_at FROM wiki_searches WHERE query = ?", (key,)
+            ).fetchone()
+        if row and time.time() - row[1] < self.ttl:
+            return json.loads(row[0])
+
+        data = self._api(list='search', srsearch=query, srlimit=limit, srprop='')
+        titles = [result['title'] for result in data.get('query', {}).get('search', [])]
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO wiki_searches (query, titles, searched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(titles), time.time())
+            )
+            conn.commit()
+        return titles
+
+    def _load(self, titles: List[str]) -> Dict[str, Tuple[WikiPage, float]]:
+        """Load stored pages for the requested titles, following aliases"""
+        loaded = {}
+        with self._connect() as conn:
+            for title in titles:
+                alias = conn.execute("SELECT title FROM wiki_aliases WHERE alias = ?", (title,)).fetchone()
+                row = conn.execute("""
+                    SELECT title, pageid, revision, fullurl, summary, text, sections, checked_at
+                    FROM wiki_pages WHERE title = ?
+                """, (alias[0] if alias else title,)).fetchone()
+                if row:
+                    page = WikiPage(row[0], row[1], row[2], row[3], row[4], row[5], json.loads(row[6]))
+                    loaded[title] = (page, row[7])
+        return loaded
+
+    def _save(self, page: WikiPage, aliases: List[str]):
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO wiki_pages
+                    (title, pageid, revision, fullurl, summary, text, sections, checked_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (page.title, page.pageid, page.revision, page.fullurl, page.summary, page.text,
+                  json.dumps(page.relevant_sections), time.time()))
+            conn.executemany(
+                "INSERT OR REPLACE INTO wiki_aliases (alias, title) VALUES (?, ?)",
+                [(alias, page.title) for alias in aliases if alias != page.title]
+            )
+            conn.commit()
+
+    def _touch(self, titles: List[str]):
+        """Mark unchanged pages as checked"""
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE wiki_pages SET checked_at = ? WHERE title = ?",
+                [(time.time(), title) for title in titles]
+            )
+            conn.commit()
+
+    def _fetch_revisions(self, titles: List[str]) -> Dict[str, Tuple[str, Optional[int]]]:
+        """Resolve titles to (canonical title, latest revision) in batched requests"""
+        revisions = {}
+        for start in range(0, len(titles), TITLES_PER_REQUEST):
+            chunk = titles[start:start + TITLES_PER_REQUEST]
+            query = self._api(prop='info', titles='|'.join(chunk), redirects=1).get('query', {})
+
+            resolved = {title: title for title in chunk}
+            for mapping in query.get('normalized', []) + query.get('redirects', []):
+                for title, target in resolved.items():
+                    if target == mapping['from']:
+                        resolved[title] = mapping['to']
+
+            latest = {
+                page['title']: None if page.get('missing') else page.get('lastrevid')
+                for page in query.get('pages', [])
+            }
+            for title, canonical in resolved.items():
+                revisions[title] = (canonical, latest.get(canonical))
+        return revisions
+
+    def _fetch_page(self, title: str) -> WikiPage:
+        """Download a page's plain text and pre-extract its summary and sections.
+
+        One title per request: a multi-title extracts query would return the
+        first page's text and defer the rest to `excontinue`.
+        """
+        query = self._api(
+            prop='extracts|info', inprop='url', explaintext=1, exsectionformat='wiki',
+            titles=title, redirects=1
+        ).get('query', {})
+        page = query['pages'][0]
+        if page.get('missing'):
+            return WikiPage(title)
+
+        text = page.get('extract', '')
+        summary, sections = split_sections(text)
+        return WikiPage(
+            title=page['title'],
+            pageid=page['pageid'],
+            revision=page['lastrevid'],
+            fullurl=page.get('fullurl', ''),
+            summary=summary,
+            text=text,
+            relevant_sections=relevant_sections(sections)
+        )
+
+    def pages(self, titles: List[str]) -> List[WikiPage]:
+        """Get pages by title, refreshing stale or changed ones in batches"""
+        titles = list(dict.fromkeys(titles))
+        stored = self._load(titles)
+        now = time.time()
+        pages = {title: page for title, (page, checked_at) in stored.items() if now - checked_at < self.ttl}
+
+        stale = [title for title in titles if title not in pages]
+        if stale:
+            try:
+                revisions = self._fetch_revisions(stale)
+            except Exception as e:
+                self.logger.error(f"Error checking Wikipedia revisions: {str(e)}")
+                revisions = {}
+
+            unchanged, to_fetch = [], {}
+            for title in stale:
+                if title not in revisions:
+                    # Couldn't reach the API; serve what we have
+                    if title in stored:
+                        pages[title] = stored[title][0]
+                    continue
+                canonical, revision = revisions[title]
+                if revision is None:
+                    pages[title] = WikiPage(canonical)
+                elif title in stored and stored[title][0].revision == revision:
+                    pages[title] = stored[title][0]
+                    unchanged.append(pages[title].title)
+                else:
+                    to_fetch.setdefault(canonical, []).append(title)
+
+            if unchanged:
+                self._touch(unchanged)
+
+            canonicals = list(to_fetch)
+            for canonical, page in zip(canonicals, self.fetcher.map(self._fetch_page, canonicals)):
+                if isinstance(page, Exception):
+                    self.logger.error(f"Error fetching Wikipedia page {canonical}: {str(page)}")
+                    page = next((stored[t][0] for t in to_fetch[canonical] if t in stored), WikiPage(canonical))
+                elif page.exists():
+                    self._save(page, to_fetch[canonical] + [canonical])
+                for title in to_fetch[canonical]:
+                    pages[title] = page
+
+        return [pages.get(title, WikiPage(title)) for title in titles]
+
+    def page(self, title: str) -> WikiPage:
+        """Get a single page by title"""
+        return self.pages([title])[0]
+
+    def search_pages(self, queries: List[str], limit: int = 10) -> List[WikiPage]:
+        """Search several queries and fetch every distinct result in one batch"""
+        titles = []
+        for query in queries:
+            try:
+                titles.extend(self.search(query, limit))
+            except Exception as e:
+                self.logger.error(f"Error searching Wikipedia for {query}: {str(e)}")
+        return [page for page in self.pages(titles) if page.exists()]
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_wiki_store() -> WikiPageStore:
+    """Get the process-wide Wikipedia page store"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = WikiPageStore()
+        return _default_store
@@ -1,11 +1,188 @@
 import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import extensions, pool as pg_pool
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime, timedelta
 import json
 from typing import Dict, List, Optional, Union
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
+# Statements execute() may safely run a second time after a connection error
+READ_ONLY_STATEMENTS = ('SELECT', 'SHOW')
+
+
+class ConnectionPool:
+    """Thread-safe psycopg2 connection pool with health checks and reconnects"""
+
+    def __init__(self, db_params: Dict, minconn: int = 1, maxconn: int = 10,
+                 max_retries: int = 5, backoff: float = 0.5, checkout_timeout: float = 30,
+                 health_check_interval: float = 30):
+        self.db_params = db_params
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.created_database = False
+        self.schema_initialized = False
+        # Per-thread connection checked out by DatabaseManager.connection()
+        self.local = threading.local()
+        self._pool = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._last_used = {}
+        self._create_pool()
+
+    def _create_database(self):
+        """Create the target database from the default postgres database"""
+        temp_params = dict(self.db_params)
+        temp_params['dbname'] = 'postgres'
+        temp_conn = psycopg2.connect(**temp_params)
+        temp_conn.autocommit = True
+        temp_cur = temp_conn.cursor()
+        temp_cur.execute(f"CREATE DATABASE {self.db_params['dbname']}")
+        temp_cur.close()
+        temp_conn.close()
+        self.created_database = True
+
+    def _create_pool(self):
+        """Create the underlying pool, retrying with exponential backoff"""
+        for attempt in range(self.max_retries):
+            try:
+                self._pool = pg_pool.ThreadedConnectionPool(self.minconn, self.maxconn, **self.db_params)
+                return
+            except psycopg2.OperationalError as e:
+                if "does not exist" in str(e) and not self.created_database:
+                    self._create_database()
+                    continue
+                if attempt == self.max_retries - 1:
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                logger.warning(f"Database connection failed ({str(e).strip()}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def reconnect(self):
+        """Drop every pooled connection and build a fresh pool.
+
+        Closes connections other threads may be using, so this is for
+        maintenance only; the request path discards just the failing
+        connection instead.
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.closeall()
+            self._last_used = {}
+            self._create_pool()
+
+    def _is_healthy(self, conn) -> bool:
+        """Check a connection before handing it out"""
+        if conn.closed:
+            return False
+        if conn.get_transaction_status() == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        last_used = self._last_used.get(id(conn), 0)
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        """Check out a healthy connection, waiting if the pool is exhausted"""
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise pg_pool.PoolError(f"No database connection available after {self.checkout_timeout}s")
+        try:
+            for attempt in range(self.max_retries):
+                with self._lock:
+                    pool = self._pool
+                try:
+                    conn = pool.getconn()
+                except (psycopg2.OperationalError, pg_pool.PoolError):
+                    # Opening a new connection failed (or the pool is momentarily
+                    # full); back off and try again without touching the
+                    # connections other threads hold
+                    if attempt == self.max_retries - 1:
+                        raise
+                    time.sleep(self.backoff * (2 ** attempt))
+                    continue
+                if self._is_healthy(conn):
+                    return conn
+                self._last_used.pop(id(conn), None)
+                pool.putconn(conn, close=True)
+            raise psycopg2.OperationalError("Could not obtain a healthy database connection")
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn, close: bool = False):
+        """Return a connection to the pool, closing it if broken or close=True"""
+        try:
+            close = close or bool(conn.closed)
+            if not close and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    close = True
+            if close:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            with self._lock:
+                pool = self._pool
+            try:
+                pool.putconn(conn, close=close)
+            except pg_pool.PoolError:
+                # Checked out before a reconnect replaced the pool
+                conn.close()
+        finally:
+            self._slots.release()
+
+    def closeall(self):
+        """Close every pooled connection"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.closeall()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_params: Dict) -> ConnectionPool:
+    """Get the process-wide pool for a set of connection parameters"""
+    key = (os.getpid(), tuple(sorted(db_params.items())))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(
+                db_params,
+                minconn=int(os.getenv('DB_POOL_MIN', 1)),
+                maxconn=int(os.getenv('DB_POOL_MAX', 10)),
+                max_retries=int(os.getenv('DB_CONNECT_RETRIES', 5)),
+                checkout_timeout=float(os.getenv('DB_POOL_TIMEOUT', 30))
+            )
+        return _pools[key]
+
+
+def close_all_pools():
+    """Close the pools owned by this process"""
+    with _pools_lock:
+        for (pid, _), pool in list(_pools.items()):
+            if pid == os.getpid():
+                pool.closeall()
+                del _pools[(pid, _)]
+
+
 class DatabaseManager:
     def __init__(self):
         load_dotenv()
@@ -19,62 +196,178 @@ class DatabaseManager:
         self.connect()
 
     def connect(self):
-        """Connect to the database, creating it if it doesn't exist"""
-        try:
-            # Try connecting to the target database
-            self.conn = psycopg2.connect(**self.db_params)
-            self.cur = self.conn.cursor(cursor_factory=RealDictCursor)
-        except psycopg2.OperationalError as e:
-            if "does not exist" in str(e):
-                # Connect to default postgres database to create our database
-                temp_params = dict(self.db_params)
-                temp_params['dbname'] = 'postgres'
-                temp_conn = psycopg2.connect(**temp_params)
-                temp_conn.autocommit = True
-                temp_cur = temp_conn.cursor()
-                
-                # Create database
-                temp_cur.execute(f"CREATE DATABASE {self.db_params['dbname']}")
-                
-                temp_cur.close()
-                temp_conn.close()
-                
-                # Connect to the newly created database
-                self.conn = psycopg2.connect(**self.db_params)
-                self.cur = self.conn.cursor(cursor_factory=RealDictCursor)
-                
-                # Initialize schema
-                self.initialize_schema()
-            else:
-                raise e
+        """Attach to the shared connection pool, creating the database if it doesn't exist"""
+        self.pool = get_pool(self.db_params)
+        if self.pool.created_database and not self.pool.schema_initialized:
+            self.pool.schema_initialized = True
+            self.initialize_schema()
 
-    def execute(self, query: str, params: tuple = None) -> List[Dict]:
-        """Execute a query and return results"""
+    @contextmanager
+    def connection(self):
+        """Check out a pooled connection for the current thread.
+
+        Nested calls on the same thread reuse the outer connection, so several
+        execute() calls inside one ``with`` block share a single transaction.
+        The transaction is committed when the outermost block exits and
+        rolled back if it raises.
+        """
+        local = self.pool.local
+        if getattr(local, 'conn', None) is not None:
+            local.depth += 1
+            try:
+                yield local.conn
+            finally:
+                local.depth -= 1
+            return
+
+        conn = self.pool.getconn()
+        local.conn, local.depth = conn, 1
+        discard = False
         try:
-            self.cur.execute(query, params)
-            self.conn.commit()
-            
+            yield conn
+            conn.commit()
+        except Exception as e:
+            # A connection-level error means this socket is unusable; drop it
+            discard = isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
+            if not conn.closed and not discard:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    discard = True
+            raise
+        finally:
+            local.conn, local.depth = None, 0
+            self.pool.putconn(conn, close=discard)
+
+    @contextmanager
+    def cursor(self):
+        """Get a dict cursor on a pooled connection"""
+        with self.connection() as conn:
+            cur = conn.cursor(cursor_factory=RealDictCursor)
             try:
-                return self.cur.fetchall()
-            except psycopg2.ProgrammingError:
-                # No results to fetch (e.g., for INSERT/UPDATE)
-                return []
-                
-        except (psycopg2.OperationalError, psycopg2.InterfaceError):
-            # Try reconnecting once
-            self.connect()
-            self.cur.execute(query, params)
-            self.conn.commit()
-            
+                yield cur
+            finally:
+                cur.close()
+
+    def execute(self, query: str, params: tuple = None) -> List[Dict]:
+        """Execute a query and return results.
+
+        A connection-level error is retried once on a fresh connection, but
+        only when the statement can't have reached the server (checking out
+        or health-checking the connection failed) or is read-only. A write
+        that may already have been applied is not repeated, since a second
+        INSERT could duplicate the row; the error goes to the caller.
+        """
+        # Inside a caller's transaction the caller decides
+        in_transaction = getattr(self.pool.local, 'conn', None) is not None
+        words = query.split(None, 1)
+        read_only = bool(words) and words[0].upper() in READ_ONLY_STATEMENTS
+        for attempt in range(2):
+            checked_out = False
             try:
-                return self.cur.fetchall()
-            except psycopg2.ProgrammingError:
-                return []
+                with self.cursor() as cur:
+                    checked_out = True
+                    cur.execute(query, params)
+                    rows = cur.fetchall() if cur.description else []
+                break
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                if attempt or in_transaction or (checked_out and not read_only):
+                    raise
+                # The failing connection was discarded; retry once on a fresh one
+        if rows and 'id' in rows[0] and query.lstrip().upper().startswith('INSERT'):
+            self.pool.local.last_row_id = rows[0]['id']
+        return rows
+
+    def ping(self) -> Dict:
+        """Readiness check: run SELECT 1 on a pooled connection, with timings"""
+        start = time.perf_counter()
+        checked_out = start
+        try:
+            with self.cursor() as cur:
+                checked_out = time.perf_counter()
+                cur.execute("SELECT 1")
+                cur.fetchone()
+        except psycopg2.Error as e:
+            return {
+                'ready': False,
+                'error': str(e).strip(),
+                'total_ms': round((time.perf_counter() - start) * 1000, 2)
+            }
+        end = time.perf_counter()
+        return {
+            'ready': True,
+            'checkout_ms': round((checked_out - start) * 1000, 2),
+            'query_ms': round((end - checked_out) * 1000, 2),
+            'total_ms': round((end - start) * 1000, 2)
+        }
 
     def get_last_row_id(self) -> int:
-        """Get the ID of the last inserted row"""
-        self.cur.execute("SELECT lastval()")
-        return self.cur.fetchone()['lastval']
+        """Get the ID returned by this thread's last INSERT ... RETURNING id"""
+        return getattr(self.pool.local, 'last_row_id', None)
+
+    # Columns written by bulk_insert_stories, in insert order
+    STORY_COLUMNS = (
+        'title', 'content', 'company_name', 'industry', 'story_type',
+        'source', 'url', 'reliability_score', 'engagement_score'
+    )
+
+    def create_business_stories_table(self):
+        """Create the business_stories table if it doesn't exist"""
+        self.execute("""
+            CREATE TABLE IF NOT EXISTS business_stories (
+                id SERIAL PRIMARY KEY,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                company_name TEXT NOT NULL,
+                industry TEXT NOT NULL,
+                story_type TEXT NOT NULL,
+                source TEXT,
+                url TEXT,
+                reliability_score FLOAT,
+                engagement_score FLOAT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def _story_row(self, story: Dict) -> tuple:
+        """Map a story dict onto STORY_COLUMNS"""
+        meta_tags = story.get('meta_tags') or {}
+        content = story.get('content', '')
+        if not isinstance(content, str):
+            content = json.dumps(content, default=str)
+        return (
+            story.get('title', ''),
+            content,
+            story.get('company_name', ''),
+            story.get('industry') or '',
+            story.get('story_type') or story.get('type') or '',
+            story.get('source'),
+            story.get('url'),
+            story.get('reliability_score', meta_tags.get('reliability_score')),
+            story.get('engagement_score', meta_tags.get('engagement_potential'))
+        )
+
+    def bulk_insert_stories(self, stories: List[Dict], chunk_size: int = 1000) -> List[int]:
+        """Insert stories into business_stories and return their IDs in input order.
+
+        Each chunk is written with a single multi-row INSERT and committed in
+        its own transaction (or the caller's, inside ``with connection()``).
+        """
+        query = (
+            f"INSERT INTO business_stories ({', '.join(self.STORY_COLUMNS)}) "
+            "VALUES %s RETURNING id"
+        )
+        story_ids = []
+        for start in range(0, len(stories), chunk_size):
+            rows = [self._story_row(story) for story in stories[start:start + chunk_size]]
+            with self.cursor() as cur:
+                result = execute_values(cur, query, rows, page_size=len(rows), fetch=True)
+            story_ids.extend(row['id'] for row in result)
+        return story_ids
+
+    def save_story(self, story: Dict) -> int:
+        """Insert a single story and return its ID"""
+        return self.bulk_insert_stories([story])[0]
 
     def initialize_schema(self):
         """Initialize the database schema"""
@@ -93,7 +386,7 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
+
         # Create posts table
         self.execute("""
             CREATE TABLE IF NOT EXISTS posts (
@@ -107,7 +400,7 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
+
         # Create examples table
         self.execute("""
             CREATE TABLE IF NOT EXISTS examples (
@@ -117,7 +410,7 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
+
         # Create batches table
         self.execute("""
             CREATE TABLE IF NOT EXISTS batches (
@@ -129,7 +422,7 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
+
         # Create batch_posts table
         self.execute("""
             CREATE TABLE IF NOT EXISTS batch_posts (
@@ -142,10 +435,3 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-
-    def __del__(self):
-        """Clean up database connections"""
-        if hasattr(self, 'cur') and self.cur is not None:
-            self.cur.close()
-        if hasattr(self, 'conn') and self.conn is not None:
-            self.conn.close()
@@ -0,0 +1,42 @@
+import os
+import multiprocessing
+
+# Production server settings; every value can be overridden from the environment.
+# Run with: gunicorn -c gunicorn.conf.py wsgi:app  (or: python run.py serve --prod)
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5001)}"
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Generation requests wait on the LLM, so allow long requests
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 180))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 60))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then to bound memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Import the app and prewarm shared modules once in the master; workers are
+# forked from it. SIGHUP gracefully replaces the workers (restart the master
+# to pick up code changes).
+preload_app = True
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def pre_fork(server, worker):
+    """Close the master's database connections so workers don't share sockets"""
+    from database.db_manager import close_all_pools
+    close_all_pools()
+
+
+def post_fork(server, worker):
+    """Give each worker its own service container, so components with
+    connections and threads are built inside the worker"""
+    from app import app
+    from content_engine.services import get_services
+    app.services = get_services()
+    server.log.info(f"Worker {worker.pid} ready")
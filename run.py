@@ -5,6 +5,7 @@ import subprocess
 import time
 import psutil
 import signal
+import argparse
 from subprocess import Popen, PIPE
 import socket
 
@@ -36,6 +37,17 @@ def kill_process_on_port(port):
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
 
+def init_environment():
+    """One-time setup: dependencies, PostgreSQL and every component's tables"""
+    install_dependencies()
+    
+    from scripts.setup import setup_environment
+    start = time.perf_counter()
+    if not setup_environment():
+        print("Init failed. Please check the error messages above.")
+        sys.exit(1)
+    print(f"Init completed in {time.perf_counter() - start:.1f}s")
+
 def run_flask_app():
     port = int(os.getenv('PORT', 5001))
     
@@ -60,9 +72,30 @@ def run_flask_app():
         print(f"Error starting Flask app: {e}")
         sys.exit(1)
 
+def run_production_server():
+    """Serve with gunicorn: pre-forked workers with threads, settings in gunicorn.conf.py"""
+    port = int(os.getenv('PORT', 5001))
+    if is_port_in_use(port):
+        print(f"Port {port} is in use. Please free up the port first.")
+        sys.exit(1)
+    
+    print(f"Starting gunicorn on port {port}...")
+    os.execvp(sys.executable, [
+        sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'
+    ])
+
 if __name__ == "__main__":
-    # First install dependencies
-    install_dependencies()
+    parser = argparse.ArgumentParser(description="LinkedIn content AI")
+    parser.add_argument('command', nargs='?', default='serve', choices=['init', 'serve'],
+                        help="'init' installs dependencies and sets up the database once; "
+                             "'serve' (default) starts the app with a quick readiness check")
+    parser.add_argument('--prod', action='store_true',
+                        help="serve with gunicorn instead of the Flask development server")
+    args = parser.parse_args()
     
-    # Then run the Flask app
-    run_flask_app()
+    if args.command == 'init':
+        init_environment()
+    elif args.prod:
+        run_production_server()
+    else:
+        run_flask_app()
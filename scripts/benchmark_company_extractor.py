@@ -0,0 +1,88 @@
+import re
+import sys
+import json
+import time
+import random
+from pathlib import Path
+
+# Add parent directory to path to import from project
+parent_dir = str(Path(__file__).resolve().parent.parent)
+sys.path.append(parent_dir)
+
+from content_engine.company_extractor import CompanyNameExtractor
+
+def legacy_extract_company_name(text):
+    """The original per-call implementation, kept here for comparison"""
+    suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Company', 'Co', 'Corporation', 'Technologies', 'Tech']
+    for suffix in suffixes:
+        pattern = fr'\b[A-Z][A-Za-z0-9\s&]+\s{suffix}\b'
+        matches = re.findall(pattern, text)
+        if matches:
+            return matches[0].strip()
+
+    pattern = r'\b[A-Z][A-Za-z0-9]+(?:\s+[A-Z][A-Za-z0-9]+)*\b'
+    matches = re.findall(pattern, text)
+    if matches:
+        non_companies = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'It', 'They'}
+        companies = [m for m in matches if m not in non_companies and len(m) > 2]
+        if companies:
+            return companies[0]
+    return None
+
+def build_corpus(size):
+    """Search-result style title + snippet texts, from examples.json plus synthetic headlines"""
+    examples_path = Path(parent_dir) / 'content_engine' / 'data' / 'examples.json'
+    with open(examples_path, encoding='utf-8') as f:
+        snippets = [example['content'][:300] for example in json.load(f)['examples']]
+
+    names = ['Acme', 'Northwind', 'Globex', 'Initech', 'Umbrella', 'Stark Industries', 'Hooli']
+    suffixes = ['Inc', 'Corp', 'Ltd', 'LLC', 'Technologies', '']
+    verbs = ['raises $40M to expand', 'pivots toward', 'launches a new', 'reports record growth in']
+    topics = ['AI tooling', 'grocery delivery', 'climate software', 'consumer fintech']
+
+    rng = random.Random(42)
+    corpus = []
+    for _ in range(size):
+        title = f"{rng.choice(names)} {rng.choice(suffixes)} {rng.choice(verbs)} {rng.choice(topics)}".replace('  ', ' ')
+        corpus.append(f"{title} {rng.choice(snippets)}")
+    return corpus
+
+def bench(label, func, corpus, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            func(text)
+    elapsed = time.perf_counter() - start
+    calls = len(corpus) * repeat
+    print(f"{label:<32} {calls / elapsed:>12,.0f} texts/s  ({elapsed:.3f}s)")
+    return elapsed
+
+def main():
+    """Compare the compiled extractor against the original implementation"""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    corpus = build_corpus(size)
+    unique = len(set(corpus))
+
+    # No gazetteer, no memo hits across repeats beyond the corpus itself
+    compiled = CompanyNameExtractor(known_companies=[], cache_size=1)
+    memoized = CompanyNameExtractor(known_companies=[])
+
+    mismatches = sum(
+        1 for text in corpus
+        if legacy_extract_company_name(text) != compiled.extract(text)
+    )
+    print(f"{len(corpus)} texts ({unique} unique), {repeat} passes, {mismatches} mismatches vs legacy\n")
+
+    legacy = bench('legacy', legacy_extract_company_name, corpus, repeat)
+    fresh = bench('compiled (no memo)', compiled.extract, corpus, repeat)
+    cached = bench('compiled + memo', memoized.extract, corpus, repeat)
+
+    start = time.perf_counter()
+    CompanyNameExtractor(known_companies=[]).extract_many(corpus)
+    print(f"{'extract_many (cold)':<32} {len(corpus) / (time.perf_counter() - start):>12,.0f} texts/s")
+
+    print(f"\nSpeedup: {legacy / fresh:.1f}x compiled, {legacy / cached:.1f}x with memo")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import sys
+import json
+import time
+from pathlib import Path
+
+# Add parent directory to path to import from project
+parent_dir = str(Path(__file__).resolve().parent.parent)
+sys.path.append(parent_dir)
+
+from content_engine.marker_scanner import MarkerScanner
+
+def legacy_authenticity_markers(content):
+    """The original per-character implementation, kept here for comparison"""
+    content = content.lower()
+    return {
+        'specific_dates': any(char.isdigit() and ("," in content or "-" in content) for char in content),
+        'real_numbers': any(char.isdigit() for char in content),
+        'named_sources': any(m in content for m in ["according to", "said", "stated", "ceo", "founder", "director", "leader"]),
+        'direct_quotes': '"' in content,
+        'verifiable_facts': any(m in content for m in ["reported", "announced", "published", "confirmed", "launched", "achieved", "milestone"])
+    }
+
+def legacy_insight_markers(content):
+    """The original per-phrase implementation, kept here for comparison"""
+    content = content.lower()
+    return {
+        'behind_scenes': any(m in content for m in [
+            "internally", "behind the scenes", "within the company",
+            "process", "system", "building", "development", "integration"
+        ]),
+        'counter_intuitive': any(m in content for m in [
+            "surprisingly", "contrary to", "unexpected", "unlike",
+            "instead of", "rather than", "despite", "however"
+        ]),
+        'industry_specific': any(m in content for m in [
+            "in the industry", "sector-specific", "market dynamics",
+            "landscape", "segment", "vertical", "market"
+        ]),
+        'decision_rationale': any(m in content for m in [
+            "decided to", "chose to", "reasoning behind",
+            "strategy", "approach", "solution", "method"
+        ]),
+        'failure_lessons': any(m in content for m in [
+            "learned from", "mistake", "challenge", "hurdle",
+            "obstacle", "issue", "problem", "difficulty"
+        ])
+    }
+
+def legacy_scan(content):
+    return legacy_authenticity_markers(content), legacy_insight_markers(content)
+
+def bench(label, func, corpus):
+    start = time.perf_counter()
+    for content in corpus:
+        func(content)
+    elapsed = time.perf_counter() - start
+    size = sum(len(content) for content in corpus)
+    print(f"{label:<28} {elapsed:>8.3f}s  {size / elapsed / 1e6:>8.1f} MB/s")
+    return elapsed
+
+def main():
+    """Benchmark marker scanning over examples.json scaled up (default 1000x)"""
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with open(Path(parent_dir) / 'content_engine' / 'data' / 'examples.json', encoding='utf-8') as f:
+        examples = [example['content'] for example in json.load(f)['examples']]
+
+    scanner = MarkerScanner()
+    trie_only = MarkerScanner(trie_max_chars=sys.maxsize)
+    substrings_only = MarkerScanner(trie_max_chars=0)
+
+    def scan(content):
+        result = scanner.scan(content)
+        return result.authenticity, result.insight
+
+    def scan_trie(content):
+        result = trie_only.scan(content)
+        return result.authenticity, result.insight
+
+    def scan_substrings(content):
+        result = substrings_only.scan(content)
+        return result.authenticity, result.insight
+
+    mismatches = sum(
+        1 for content in examples
+        for func in (scan, scan_trie, scan_substrings)
+        if legacy_scan(content) != func(content)
+    )
+    print(f"{len(examples)} examples, {mismatches} mismatches vs legacy\n")
+
+    # Many posts: every example repeated `scale` times
+    posts = examples * scale
+    print(f"{len(posts)} posts:")
+    legacy = bench('  legacy', legacy_scan, posts)
+    bench('  trie only', scan_trie, posts)
+    bench('  substrings only', scan_substrings, posts)
+    single = bench('  scanner', scan, posts)
+    print(f"  speedup: {legacy / single:.1f}x\n")
+
+    # Short posts: the first sentence of every example
+    short = [content.split('.')[0][:scanner.trie_max_chars - 1] for content in examples] * scale
+    print(f"{len(short)} short posts (under {scanner.trie_max_chars} chars):")
+    legacy = bench('  legacy', legacy_scan, short)
+    bench('  trie only', scan_trie, short)
+    bench('  substrings only', scan_substrings, short)
+    single = bench('  scanner', scan, short)
+    print(f"  speedup: {legacy / single:.1f}x\n")
+
+    # One long draft: all examples joined and scaled, without separators so the
+    # legacy specific_dates check rescans the post for every digit
+    draft = ' '.join(examples).replace(',', ' ').replace('-', ' ')
+    draft = ' '.join([draft] * max(1, scale // 10))
+    print(f"Long draft without separators ({len(draft):,} chars):")
+    legacy = bench('  legacy', legacy_scan, [draft])
+    bench('  trie only', scan_trie, [draft])
+    bench('  substrings only', scan_substrings, [draft])
+    single = bench('  scanner', scan, [draft])
+    print(f"  speedup: {legacy / single:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import sys
+import json
+import time
+import random
+from pathlib import Path
+
+# Add parent directory to path to import from project
+parent_dir = str(Path(__file__).resolve().parent.parent)
+sys.path.append(parent_dir)
+
+from content_engine.marker_scanner import INSIGHT_PHRASES
+from content_engine.phrase_matcher import PhraseMatcher, TRIE_MIN_PHRASES
+
+def naive_categories(categories, text):
+    """The per-phrase loops PhraseMatcher replaces, kept here for comparison"""
+    text = text.lower()
+    return {name for name, phrases in categories.items() if any(phrase in text for phrase in phrases)}
+
+def random_vocabulary(size, rng):
+    """`size` made-up words split over ten categories"""
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 12)))
+             for _ in range(size)]
+    return {f'category_{index}': words[index::10] for index in range(10)}
+
+def bench(func, corpus):
+    start = time.perf_counter()
+    for text in corpus:
+        func(text)
+    return time.perf_counter() - start
+
+def compare(label, categories, corpus):
+    """Time the naive loops, both matcher paths and the default choice"""
+    substrings = PhraseMatcher(categories, use_trie=False)
+    trie = PhraseMatcher(categories, use_trie=True)
+    default = PhraseMatcher(categories)
+    for text in corpus[:50]:
+        expected = naive_categories(categories, text)
+        assert substrings.categories_found(text) == expected == trie.categories_found(text)
+
+    naive = bench(lambda text: naive_categories(categories, text), corpus)
+    times = {
+        'substrings': bench(substrings.categories_found, corpus),
+        'trie': bench(trie.categories_found, corpus),
+        'default': bench(default.categories_found, corpus)
+    }
+    chosen = 'trie' if default.use_trie else 'substrings'
+    print(f"{label:<34} naive {naive:>7.3f}s  substrings {times['substrings']:>7.3f}s  "
+          f"trie {times['trie']:>7.3f}s  default ({chosen}) {times['default']:>7.3f}s  "
+          f"{naive / times['default']:>5.1f}x")
+
+def main():
+    """Benchmark PhraseMatcher against naive per-phrase checks (default 1000x examples.json)"""
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with open(Path(parent_dir) / 'content_engine' / 'data' / 'examples.json', encoding='utf-8') as f:
+        examples = [example['content'] for example in json.load(f)['examples']]
+    posts = examples * scale
+    rng = random.Random(0)
+
+    print(f"{len(posts)} posts, trie used from {TRIE_MIN_PHRASES} phrases\n")
+    insight_size = sum(len(phrases) for phrases in INSIGHT_PHRASES.values())
+    compare(f"INSIGHT markers ({insight_size} phrases)", INSIGHT_PHRASES, posts)
+    for size in (100, 300, 1000, 3000):
+        # Fewer posts for the big vocabularies, where the naive loops get slow
+        compare(f"random vocabulary ({size} phrases)", random_vocabulary(size, rng),
+                posts[:max(len(examples), len(posts) * 100 // size)])
+
+if __name__ == "__main__":
+    main()
@@ -18,21 +18,7 @@ def main():
     db = DatabaseManager()
     
     # Create stories table if it doesn't exist
-    db.execute("""
-        CREATE TABLE IF NOT EXISTS business_stories (
-            id SERIAL PRIMARY KEY,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            company_name TEXT NOT NULL,
-            industry TEXT NOT NULL,
-            story_type TEXT NOT NULL,
-            source TEXT,
-            url TEXT,
-            reliability_score FLOAT,
-            engagement_score FLOAT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    db.create_business_stories_table()
     
     # Sample business stories
     stories = [
@@ -74,23 +60,8 @@ def main():
     print(f"Inserting {len(stories)} sample stories...")
     
     # Insert stories into database
-    for story in stories:
-        db.execute("""
-            INSERT INTO business_stories 
-            (title, content, company_name, industry, story_type, source, url, reliability_score, engagement_score)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT DO NOTHING
-        """, (
-            story['title'],
-            story['content'],
-            story['company_name'],
-            story['industry'],
-            story['story_type'],
-            story['source'],
-            story['url'],
-            story['reliability_score'],
-            story['engagement_score']
-        ))
+    story_ids = db.bulk_insert_stories(stories)
+    print(f"Inserted stories with IDs: {story_ids}")
     
     print("Database population completed!")
 
@@ -0,0 +1,127 @@
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+# Add parent directory to path to import from project
+parent_dir = str(Path(__file__).resolve().parent.parent)
+sys.path.append(parent_dir)
+
+# Libraries that should only load once a collector or scorer path runs
+HEAVY_MODULES = ['newspaper', 'nltk', 'textblob', 'wikipediaapi', 'duckduckgo_search', 'bs4', 'numpy']
+
+# Imports the module in a fresh interpreter and reports wall time, peak RSS
+# and which heavy libraries ended up in sys.modules
+PROBE = """
+import sys, json, time, resource
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == 'darwin':
+    rss_kb //= 1024
+print(json.dumps({{
+    'seconds': elapsed,
+    'rss_mb': rss_kb / 1024,
+    'loaded': [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+def parse_importtime(stderr: str):
+    """Parse `-X importtime` output into (module, self_us, cumulative_us) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def importtime_breakdown(module: str, top: int):
+    """Top modules by cumulative import time, and self time per top-level package"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=parent_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else 'import failed')
+        sys.exit(1)
+
+    rows = parse_importtime(result.stderr)
+    by_package = {}
+    for name, self_us, _ in rows:
+        package = name.split('.')[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+
+    print(f"Slowest imports for `import {module}` (cumulative):")
+    for name, _, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:>9.1f} ms  {name}")
+    print("\nSelf time by top-level package:")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:>9.1f} ms  {package}")
+    return by_package
+
+
+def measure(module: str, runs: int):
+    """Median wall time and RSS of importing the module, over several cold runs"""
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=parent_dir, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(result.stderr.splitlines()[-1] if result.stderr else 'import failed')
+            sys.exit(1)
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return {
+        'module': module,
+        'runs': runs,
+        'seconds': statistics.median(sample['seconds'] for sample in samples),
+        'rss_mb': statistics.median(sample['rss_mb'] for sample in samples),
+        'loaded': samples[-1]['loaded']
+    }
+
+
+def main():
+    """Profile the import-time cost of the app and track it against a saved baseline"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--module', default='app', help='module to import (default: app)')
+    parser.add_argument('--runs', type=int, default=5, help='cold imports to time')
+    parser.add_argument('--top', type=int, default=20, help='rows to show in the breakdown')
+    parser.add_argument('--save', metavar='PATH', help='write the measurement to a JSON file')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a saved measurement')
+    args = parser.parse_args()
+
+    by_package = importtime_breakdown(args.module, args.top)
+    stats = measure(args.module, args.runs)
+    stats['packages_ms'] = {package: self_us / 1000 for package, self_us in by_package.items()}
+
+    print(f"\n`import {args.module}`: {stats['seconds'] * 1000:.0f} ms, "
+          f"peak RSS {stats['rss_mb']:.1f} MB (median of {args.runs})")
+    print(f"Heavy libraries loaded: {', '.join(stats['loaded']) or 'none'}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nAgainst {args.compare}:")
+        print(f"  time: {baseline['seconds'] * 1000:.0f} ms -> {stats['seconds'] * 1000:.0f} ms "
+              f"({baseline['seconds'] / stats['seconds']:.1f}x)")
+        print(f"  RSS:  {baseline['rss_mb']:.1f} MB -> {stats['rss_mb']:.1f} MB "
+              f"({stats['rss_mb'] - baseline['rss_mb']:+.1f} MB)")
+        dropped = sorted(set(baseline['loaded']) - set(stats['loaded']))
+        if dropped:
+            print(f"  no longer loaded at import: {', '.join(dropped)}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2)
+        print(f"\nSaved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+import signal
+import logging
+from pathlib import Path
+
+# Add parent directory to path to import from project
+parent_dir = str(Path(__file__).resolve().parent.parent)
+sys.path.append(parent_dir)
+
+from dotenv import load_dotenv
+from content_engine.job_queue import WorkerPool
+
+def main():
+    """Run a pool of job workers until interrupted"""
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    
+    num_workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    pool = WorkerPool(num_workers=num_workers)
+    pool.start()
+    print(f"Started {pool.num_workers} job workers on {pool.queue.db_path}")
+    
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    try:
+        while not stopping and pool.alive():
+            pool.maintain()
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    
+    print("Stopping job workers...")
+    pool.stop()
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import os
 import sys
+import time
 from pathlib import Path
+from typing import Dict
 import subprocess
 import psycopg2
 from dotenv import load_dotenv
@@ -9,8 +11,6 @@ from dotenv import load_dotenv
 parent_dir = str(Path(__file__).resolve().parent.parent)
 sys.path.append(parent_dir)
 
-from database.db_manager import DatabaseManager
-from content_engine.story_collector import BusinessStoryCollector
 
 def check_postgres():
     """Check if PostgreSQL server is running"""
@@ -41,7 +41,11 @@ def start_postgres():
         return False
 
 def setup_environment():
-    """Setup the environment and database"""
+    """One-time init: make sure PostgreSQL is running and create every component's tables.
+
+    Run this once per deployment (`python run.py init`); serving processes
+    only call check_ready().
+    """
     load_dotenv()
     
     print("Checking PostgreSQL server...")
@@ -51,19 +55,38 @@ def setup_environment():
             return False
     
     try:
-        print("Initializing database...")
-        db = DatabaseManager()
-        
-        # Initialize story collector to populate database
-        print("Initializing story collector...")
-        collector = BusinessStoryCollector()
+        from content_engine.services import get_services
+        services = get_services()
+
+        # Building each component creates its tables if they don't exist
+        for name in ('db', 'collector', 'recommender', 'auto_recommender', 'job_queue'):
+            print(f"Initializing {name}...")
+            services.get(name)
         
+        for name, timing in services.timings().items():
+            print(f"  {name}: {timing['self'] * 1000:.0f} ms")
         return True
         
     except Exception as e:
         print(f"Error during setup: {str(e)}")
         return False
 
+def check_ready(services=None) -> Dict:
+    """Fast readiness check for serving: attach to the shared pool and run SELECT 1"""
+    from content_engine.services import get_services
+    services = services or get_services()
+    start = time.perf_counter()
+    try:
+        db = services.db
+    except psycopg2.Error as e:
+        return {
+            'ready': False,
+            'error': str(e).strip(),
+            'pool_ms': round((time.perf_counter() - start) * 1000, 2)
+        }
+    pool_ms = round((time.perf_counter() - start) * 1000, 2)
+    return {'pool_ms': pool_ms, **db.ping()}
+
 if __name__ == "__main__":
     if setup_environment():
         print("Setup completed successfully!")
@@ -0,0 +1,61 @@
+import sys
+import pytest
+from scripts import setup
+
+class StubAutoRecommender:
+    def get_pending_posts(self):
+        return [{'id': 1, 'content': 'pending post', 'industry': 'tech', 'company_name': 'Acme'}]
+
+    def generate_batch_posts(self, count, max_workers=None, timeout=None):
+        return {
+            'posts': [{'content': 'new post', 'industry': 'tech', 'company_name': 'Acme'}],
+            'failures': [{'index': 1, 'story_id': 2, 'company_name': 'Globex', 'error': 'Timed out after 90s'}],
+            'elapsed': 0.1
+        }
+
+class StubServices:
+    auto_recommender = StubAutoRecommender()
+
+@pytest.fixture
+def client(monkeypatch):
+    if 'app' not in sys.modules:
+        # Importing app runs create_app, which checks the database
+        monkeypatch.setattr(setup, 'check_ready', lambda services=None: {
+            'ready': True, 'pool_ms': 0.0, 'total_ms': 0.0
+        })
+    import app as app_module
+    monkeypatch.setattr(app_module.app, 'services', StubServices(), raising=False)
+    return app_module.app.test_client()
+
+def test_pending_posts_is_a_list(client):
+    """loadPendingPosts() renders the response directly"""
+    response = client.get('/api/pending_posts')
+    assert response.status_code == 200
+    assert isinstance(response.get_json(), list)
+
+def test_generate_posts_returns_posts_and_failures(client):
+    """generateBatch() renders result.posts and reports result.failures"""
+    response = client.post('/api/generate_posts', json={'count': 2})
+    assert response.status_code == 200
+    result = response.get_json()
+    assert isinstance(result['posts'], list) and result['posts'][0]['content'] == 'new post'
+    assert result['failures'][0]['company_name'] == 'Globex'
+
+class StubJobQueue:
+    def __init__(self):
+        self.enqueued = []
+
+    def enqueue(self, job_type, payload, max_attempts=3):
+        self.enqueued.append(max_attempts)
+        return len(self.enqueued)
+
+def test_create_job_clamps_max_attempts(client, monkeypatch):
+    """A request can't ask for more retries than JOB_MAX_ATTEMPTS_LIMIT"""
+    import app as app_module
+    queue = StubJobQueue()
+    monkeypatch.setattr(app_module.app.services, 'job_queue', queue, raising=False)
+    monkeypatch.setenv('JOB_MAX_ATTEMPTS_LIMIT', '4')
+    for requested in (1000, 0, 2):
+        response = client.post('/api/jobs', json={'type': 'generate_posts', 'max_attempts': requested})
+        assert response.status_code == 202
+    assert queue.enqueued == [4, 1, 2]
@@ -0,0 +1,116 @@
+import asyncio
+from content_engine.auto_recommender import AutoPostRecommender
+from content_engine.llm_client import UsageMeter
+from content_engine.regeneration import RegenerationResult
+
+PASSING = {'engagement_score': 0.9, 'relevance_score': 0.8, 'readability_score': 1.0, 'authenticity_score': 0.7}
+FAILING = {**PASSING, 'readability_score': 0.5}
+STORY = {'id': 7, 'industry': 'technology', 'company_name': 'Acme', 'story_type': 'pivot'}
+
+class FakeDB:
+    def __init__(self):
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+        return [{'id': 1}]
+
+class StubGenerator:
+    llm = None
+
+    def _story_post_type(self, story):
+        return 'pivot'
+
+class StubRegenerator:
+    def __init__(self, post, scores, accepted):
+        self.result = RegenerationResult(post, scores, accepted, 'max_attempts', [], UsageMeter())
+        self.runs = 0
+
+    def run(self, generate, score_batch, accept):
+        self.runs += 1
+        return self.result
+
+def _recommender(regenerator):
+    recommender = AutoPostRecommender(
+        db_manager=FakeDB(), story_collector=object(), post_generator=StubGenerator(), scorer=object()
+    )
+    recommender.regenerator = regenerator
+    recommender.db_manager.queries = []
+    return recommender
+
+def _inserts(recommender, table):
+    return [query for query, _ in recommender.db_manager.queries if f'INSERT INTO {table}' in query]
+
+def test_review_post_saves_a_passing_draft_without_regenerating():
+    regenerator = StubRegenerator(None, None, False)
+    recommender = _recommender(regenerator)
+    review = recommender.review_post(STORY, 'streamed draft', PASSING)
+    assert review['accepted'] and review['post_id'] == 1
+    assert regenerator.runs == 0
+    assert _inserts(recommender, 'auto_posts') and _inserts(recommender, 'post_cache')
+
+def test_review_post_regenerates_a_failing_draft():
+    regenerator = StubRegenerator({'content': 'better post'}, PASSING, True)
+    recommender = _recommender(regenerator)
+    review = recommender.review_post(STORY, 'streamed draft', FAILING)
+    assert review['accepted'] and review['content'] == 'better post'
+    assert review['scores'] == PASSING and regenerator.runs == 1
+
+def test_review_post_rejects_when_nothing_passes():
+    regenerator = StubRegenerator({'content': 'still weak'}, FAILING, False)
+    recommender = _recommender(regenerator)
+    review = recommender.review_post(STORY, 'streamed draft', FAILING)
+    assert not review['accepted'] and review['post_id'] is None
+    assert not _inserts(recommender, 'auto_posts') and not _inserts(recommender, 'post_cache')
+
+class ConcurrencyGenerator(StubGenerator):
+    class llm:
+        run = staticmethod(asyncio.run)
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def agenerate_single_post(self, story, use_cache=True):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if story['id'] == 3:
+            raise ValueError('no content')
+        return {'content': f"post {story['id']}"}
+
+def test_run_batch_clamps_workers_and_reports_failures(monkeypatch):
+    monkeypatch.setenv('BATCH_MAX_WORKERS_LIMIT', '2')
+    recommender = _recommender(StubRegenerator(None, None, False))
+    recommender.post_generator = ConcurrencyGenerator()
+    stories = [{'id': index, 'company_name': f'Company {index}'} for index in range(6)]
+
+    result = recommender.run_batch(stories, max_workers=50)
+    assert recommender.post_generator.peak == 2
+    assert [post['content'] for post in result['posts']] == ['post 0', 'post 1', 'post 2', 'post 4', 'post 5']
+    assert result['failures'] == [{'index': 3, 'story_id': 3, 'company_name': 'Company 3', 'error': 'no content'}]
+
+class RecordingAnalyzer:
+    def __init__(self, polarity):
+        self.polarity = polarity
+        self.batches = []
+
+    def polarity_batch(self, texts):
+        self.batches.append(list(texts))
+        return [self.polarity] * len(texts)
+
+def test_live_quality_score_takes_sentiment_from_shared_analyzer(monkeypatch):
+    """_validate_post_quality gets engagement sentiment from get_sentiment_analyzer()"""
+    from content_engine import quality_scorer
+    content = 'Plain update'
+    scores = {}
+    for polarity in (0.4, -0.4):
+        analyzer = RecordingAnalyzer(polarity)
+        monkeypatch.setattr(quality_scorer, 'get_sentiment_analyzer', lambda: analyzer)
+        recommender = AutoPostRecommender(
+            db_manager=FakeDB(), story_collector=object(), post_generator=StubGenerator()
+        )
+        scores[polarity] = recommender._validate_post_quality(content)['engagement_score']
+        assert analyzer.batches == [[content]]
+    assert round(scores[0.4] - scores[-0.4], 6) == 0.1
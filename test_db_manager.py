@@ -0,0 +1,74 @@
+import threading
+import psycopg2
+import pytest
+from database.db_manager import DatabaseManager
+
+class FakeCursor:
+    def __init__(self, pool):
+        self.pool = pool
+        self.description = None
+
+    def execute(self, query, params=None):
+        self.pool.statements.append(query)
+        if self.pool.statement_errors:
+            raise self.pool.statement_errors.pop(0)
+        self.description = [('id',)]
+
+    def fetchall(self):
+        return [{'id': len(self.pool.statements)}]
+
+    def close(self):
+        pass
+
+class FakeConn:
+    closed = 0
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self.pool)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+class FakePool:
+    def __init__(self, checkout_errors=(), statement_errors=()):
+        self.local = threading.local()
+        self.checkout_errors = list(checkout_errors)
+        self.statement_errors = list(statement_errors)
+        self.statements = []
+
+    def getconn(self):
+        if self.checkout_errors:
+            raise self.checkout_errors.pop(0)
+        return FakeConn(self)
+
+    def putconn(self, conn, close=False):
+        pass
+
+def _manager(pool):
+    manager = DatabaseManager.__new__(DatabaseManager)
+    manager.pool = pool
+    return manager
+
+def test_write_that_reached_the_server_is_not_retried():
+    """A dropped connection during an INSERT goes to the caller instead of inserting twice"""
+    pool = FakePool(statement_errors=[psycopg2.OperationalError('server closed the connection')])
+    with pytest.raises(psycopg2.OperationalError):
+        _manager(pool).execute("INSERT INTO auto_posts (content) VALUES (%s) RETURNING id", ('post',))
+    assert len(pool.statements) == 1
+
+def test_reads_and_checkout_failures_are_retried():
+    """A read-only statement, or one that never got a connection, runs again once"""
+    pool = FakePool(statement_errors=[psycopg2.OperationalError('server closed the connection')])
+    assert _manager(pool).execute("SELECT id FROM auto_posts") == [{'id': 2}]
+    assert len(pool.statements) == 2
+
+    pool = FakePool(checkout_errors=[psycopg2.OperationalError('Could not obtain a healthy database connection')])
+    manager = _manager(pool)
+    assert manager.execute("INSERT INTO auto_posts (content) VALUES (%s) RETURNING id", ('post',)) == [{'id': 1}]
+    assert len(pool.statements) == 1 and manager.get_last_row_id() == 1
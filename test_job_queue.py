@@ -0,0 +1,91 @@
+import time
+import sqlite3
+import threading
+import pytest
+from content_engine.job_queue import JobQueue, run_worker
+
+def test_stale_jobs_requeue_until_attempts_run_out(tmp_path):
+    """A job stuck in 'running' is retried, and failed once it has used every attempt"""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue('generate_post', {}, max_attempts=2)
+
+    assert queue.claim('worker-1')['attempts'] == 1
+    time.sleep(0.01)
+    assert queue.requeue_stale(timeout=0) == 1
+    assert queue.get(job_id)['status'] == 'queued'
+
+    assert queue.claim('worker-2')['attempts'] == 2
+    time.sleep(0.01)
+    assert queue.requeue_stale(timeout=0) == 0
+    assert queue.get(job_id)['status'] == 'failed'
+
+def test_fail_without_retry_is_final(tmp_path):
+    """Errors another attempt cannot fix skip the retry backoff"""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue('no_such_type', {}, max_attempts=3)
+    queue.claim('worker-1')
+    assert queue.fail(job_id, 'worker-1', 'Unknown job type: no_such_type', retry=False)
+    job = queue.get(job_id)
+    assert job['status'] == 'failed' and job['attempts'] == 1
+
+def test_only_the_owning_worker_can_finish_a_job(tmp_path):
+    """A worker whose job was re-queued and re-claimed can no longer overwrite it"""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue('generate_post', {}, max_attempts=3)
+    queue.claim('worker-1')
+    time.sleep(0.01)
+    queue.requeue_stale(timeout=0)
+    queue.claim('worker-2')
+
+    assert not queue.complete(job_id, 'worker-1', {'content': 'stale'})
+    assert not queue.fail(job_id, 'worker-1', 'late error')
+    assert queue.get(job_id)['status'] == 'running'
+
+    assert queue.complete(job_id, 'worker-2', {'content': 'fresh'})
+    assert queue.get(job_id)['result'] == {'content': 'fresh'}
+    assert not queue.fail(job_id, 'worker-2', 'after success')
+    assert queue.get(job_id)['status'] == 'succeeded'
+
+def test_worker_survives_claim_errors(tmp_path, monkeypatch):
+    """A locked database while claiming is logged and retried, not fatal"""
+    stop_event = threading.Event()
+    claims = []
+
+    def claim(self, worker):
+        claims.append(worker)
+        if len(claims) == 1:
+            raise sqlite3.OperationalError('database is locked')
+        stop_event.set()
+        return None
+
+    monkeypatch.setattr(JobQueue, 'claim', claim)
+    # Keep run_worker from replacing pytest's own SIGTERM handler
+    monkeypatch.setattr('signal.signal', lambda *args: None)
+    run_worker(str(tmp_path / 'jobs.db'), stop_event, poll_interval=0.01)
+    assert len(claims) == 2
+
+def test_generate_batch_job_enforces_the_endpoint_gate(tmp_path, monkeypatch):
+    """The job refuses a new batch while the previous one still needs feedback"""
+    from concurrent.futures import ThreadPoolExecutor
+    from content_engine import job_handlers
+    from content_engine.job_queue import JobRejected
+    from content_engine.post_recommender import PostRecommender
+
+    class Services:
+        recommender = PostRecommender(str(tmp_path / 'feedback.db'), db_manager=object(), story_collector=object())
+        batch_executor = ThreadPoolExecutor(max_workers=2)
+
+    monkeypatch.setattr(job_handlers, 'get_services', lambda: Services)
+    monkeypatch.setattr(job_handlers, 'build_company_post', lambda company_name, industry: {
+        'content': f'post about {company_name}', 'company_name': company_name,
+        'industry': industry, 'post_type': 'insight', 'metrics': {}
+    })
+
+    with pytest.raises(JobRejected, match='required'):
+        job_handlers.generate_batch({'company_names': [], 'industry': 'tech'})
+
+    result = job_handlers.generate_batch({'company_names': ['Acme', 'Globex'], 'industry': 'tech'})
+    assert [post['company_name'] for post in result['posts']] == ['Acme', 'Globex']
+
+    with pytest.raises(JobRejected, match='requires feedback'):
+        job_handlers.generate_batch({'company_names': ['Initech'], 'industry': 'tech'})
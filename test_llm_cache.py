@@ -0,0 +1,64 @@
+from content_engine.llm_cache import (
+    LLMResponseCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    make_cache_key
+)
+
+MESSAGES = [
+    {"role": "system", "content": "You are a professional business content writer."},
+    {"role": "user", "content": "Write about Amul"}
+]
+
+def test_cache_key_depends_on_request():
+    """Keys are stable for identical requests and differ otherwise"""
+    key = make_cache_key('gpt-4', MESSAGES, temperature=0.7, max_tokens=800)
+    assert key == make_cache_key('gpt-4', MESSAGES, max_tokens=800, temperature=0.7)
+    assert key != make_cache_key('gpt-3.5-turbo', MESSAGES, temperature=0.7, max_tokens=800)
+    assert key != make_cache_key('gpt-4', MESSAGES, temperature=0.2, max_tokens=800)
+
+def test_get_or_create_counts_hits_and_misses():
+    """Repeated requests are served from the cache"""
+    cache = LLMResponseCache(backend=MemoryCacheBackend())
+    calls = []
+
+    def create():
+        calls.append(1)
+        return "post"
+
+    for _ in range(3):
+        assert cache.get_or_create('gpt-4', MESSAGES, create, temperature=0.7) == "post"
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+
+def test_memory_backend_evicts_least_recently_used():
+    """The memory backend keeps at most max_entries"""
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set('a', '1')
+    backend.set('b', '2')
+    backend.get('a')
+    backend.set('c', '3')
+    assert backend.get('a') == '1'
+    assert backend.get('b') is None
+    assert backend.get('c') == '3'
+
+def test_expired_entries_are_misses():
+    """Entries past their TTL are not returned"""
+    backend = MemoryCacheBackend()
+    backend.set('a', '1', ttl=-1)
+    assert backend.get('a') is None
+
+def test_sqlite_backend_persists_and_evicts(tmp_path):
+    """The SQLite backend survives reopening and enforces its size cap"""
+    db_path = str(tmp_path / 'llm_cache.db')
+    backend = SQLiteCacheBackend(db_path=db_path, max_entries=2)
+    backend.set('a', '1')
+    backend.set('b', '2')
+    backend.set('c', '3')
+
+    reopened = SQLiteCacheBackend(db_path=db_path, max_entries=2)
+    assert len(reopened) == 2
+    assert reopened.get('c') == '3'
@@ -0,0 +1,39 @@
+import random
+import pytest
+from content_engine.phrase_matcher import PhraseMatcher
+
+CATEGORIES = {
+    'pivot': ['pivot', 'transform', 'change direction', 'reinvent'],
+    'overlap': ['in', 'internal', 'internally', 'nal', 'ally'],
+    'market': ['market', 'market dynamics', 'ket dyn']
+}
+
+@pytest.mark.parametrize('use_trie', [False, True])
+def test_matches_agree_with_substring_checks(use_trie):
+    """Every category and phrase is reported exactly when `phrase in text` holds"""
+    rng = random.Random(7)
+    words = ['pivot', 'internally', 'market', 'dynamics', 'Transformed', 'ally', 'the', 'reinvention']
+    matcher = PhraseMatcher(CATEGORIES, use_trie=use_trie)
+
+    for _ in range(500):
+        text = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+        lowered = text.lower()
+        expected = {
+            name: [phrase for phrase in phrases if phrase in lowered]
+            for name, phrases in CATEGORIES.items()
+        }
+        assert matcher.matches(text) == {name: bool(found) for name, found in expected.items()}
+        assert matcher.counts(text) == {name: len(found) for name, found in expected.items()}
+
+def test_first_category_respects_order():
+    """Story typing picks the first category in priority order"""
+    matcher = PhraseMatcher({'a': ['growth'], 'b': ['pivot']})
+    assert matcher.first_category('A pivot drove growth', ['b', 'a']) == 'b'
+    assert matcher.first_category('Nothing here', ['b', 'a'], default='general') == 'general'
+
+def test_finditer_is_the_same_on_both_paths():
+    """The substring path reports the same spans as the trie scan"""
+    text = 'Internally, the market dynamics shifted in 2023 - a pivot'
+    substrings = PhraseMatcher(CATEGORIES, tokens={'numbers': r'\d+'}, use_trie=False)
+    trie = PhraseMatcher(CATEGORIES, tokens={'numbers': r'\d+'}, use_trie=True)
+    assert sorted(substrings.finditer(text)) == sorted(trie.finditer(text))
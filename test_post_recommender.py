@@ -0,0 +1,15 @@
+from content_engine.post_recommender import PostRecommender
+
+def test_batch_progress_is_shared_through_the_database(tmp_path):
+    """Progress written by one recommender is visible to another on the same database"""
+    db_path = str(tmp_path / 'feedback.db')
+    writer = PostRecommender(db_path=db_path, db_manager=object(), story_collector=object())
+    reader = PostRecommender(db_path=db_path, db_manager=object(), story_collector=object())
+
+    batch_id = writer.create_batch()
+    writer.start_batch_progress(batch_id, 2)
+    writer.record_batch_result(batch_id, True)
+    assert reader.get_batch_progress() == {'batch_id': batch_id, 'total_posts': 2, 'completed': 1, 'failed': 0}
+
+    writer.record_batch_result(batch_id, False)
+    assert reader.get_batch_progress(batch_id) is None
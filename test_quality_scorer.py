@@ -0,0 +1,111 @@
+import re
+import json
+from pathlib import Path
+import pytest
+
+np = pytest.importorskip('numpy')
+from content_engine.quality_scorer import QualityScorer
+
+# The per-post scoring functions AutoPostRecommender used before QualityScorer
+# replaced them. This is the only remaining copy of the legacy rules; it is
+# kept as the parity reference, with the two intended differences applied:
+# - the question mark check searches r'\?'; the original passed '?' to
+#   re.search, which raised on every post
+# - relevance is 0.5 plus 0.1 per RELEVANCE_PHRASES category; the original
+#   called _calculate_relevance_score without ever defining it
+# Anything else the batch scorer does differently is a regression.
+
+def legacy_engagement(content, polarity):
+    score = 0.5
+    engagement_elements = {
+        'question_marks': r'\?',
+        'call_to_action': ['comment', 'share', 'like', 'follow', 'thoughts'],
+        'emojis': r'[\U0001F300-\U0001F9FF]',
+        'hashtags': '#',
+        'numbers': r'\d+'
+    }
+    for element, pattern in engagement_elements.items():
+        if isinstance(pattern, list):
+            if any(word in content.lower() for word in pattern):
+                score += 0.1
+        else:
+            if re.search(pattern, content):
+                score += 0.1
+    score += 0.2 if polarity > 0 else 0.1
+    return min(1.0, score)
+
+def legacy_relevance(content):
+    score = 0.5
+    for phrases in [['company', 'business', 'startup', 'brand'],
+                    ['customer', 'user', 'client', 'consumer'],
+                    ['growth', 'revenue', 'profit', 'impact', 'results'],
+                    ['today', 'this year', 'recently', 'launch'],
+                    ['lesson', 'learn', 'takeaway', 'insight', 'strategy']]:
+        if any(phrase in content.lower() for phrase in phrases):
+            score += 0.1
+    return min(1.0, score)
+
+def legacy_readability(content):
+    words = content.split()
+    sentences = content.split('.')
+    if not words or not sentences:
+        return 0.0
+    avg_word_length = sum(len(word) for word in words) / len(words)
+    avg_sentence_length = len(words) / len(sentences)
+    length_score = 1.0
+    if len(words) < 50:
+        length_score = 0.5
+    elif len(words) > 300:
+        length_score = 0.7
+    readability_score = 1.0
+    if avg_word_length > 8:
+        readability_score -= 0.2
+    if avg_sentence_length > 20:
+        readability_score -= 0.2
+    return max(0.0, min(1.0, readability_score * length_score))
+
+def legacy_authenticity(content):
+    score = 0.5
+    authenticity_markers = {
+        'specific_dates': r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b',
+        'numbers_and_stats': r'\b\d+%|\$\d+|\d+x|\d+\+\b',
+        'credible_sources': ['according to', 'research shows', 'study finds'],
+        'industry_terms': ['market', 'industry', 'sector', 'technology'],
+        'real_examples': ['for example', 'such as', 'like']
+    }
+    for marker, pattern in authenticity_markers.items():
+        if isinstance(pattern, list):
+            if any(phrase in content.lower() for phrase in pattern):
+                score += 0.1
+        else:
+            if re.search(pattern, content):
+                score += 0.1
+    return min(1.0, score)
+
+def fixture_posts():
+    with open(Path(__file__).parent / 'content_engine' / 'data' / 'examples.json', encoding='utf-8') as f:
+        examples = [example['content'] for example in json.load(f)['examples']]
+    return examples + [
+        '',
+        'Short and plain',
+        'What would you do? Share your thoughts below 🚀 #startups',
+        'On 3/14/2023 revenue grew 40% to $2M, 10x the market average according to research shows.',
+        'Internationalization-of-telecommunications infrastructure notwithstanding ' * 40,
+        ' '.join(['word'] * 400) + '.',
+        'Customers learned a lesson today: the company brand drives growth. ' * 8
+    ]
+
+def test_batch_scores_match_legacy_functions():
+    """score_batch returns exactly the legacy per-post floats for every fixture post"""
+    posts = fixture_posts()
+    polarities = [0.3 if index % 2 else -0.1 for index in range(len(posts))]
+    by_content = dict(zip(posts, polarities))
+    scorer = QualityScorer(sentiment=lambda contents: [by_content[content] for content in contents])
+
+    for content, scores in zip(posts, scorer.score_batch(posts)):
+        assert scores == {
+            'engagement_score': legacy_engagement(content, by_content[content]),
+            'relevance_score': legacy_relevance(content),
+            'readability_score': legacy_readability(content),
+            'authenticity_score': legacy_authenticity(content)
+        }, content[:60]
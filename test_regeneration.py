@@ -0,0 +1,57 @@
+from content_engine.llm_cache import LLMResponseCache, MemoryCacheBackend
+from content_engine.llm_client import LLMClient, _current_meter
+from content_engine.regeneration import RegenerationEngine
+
+def _engine(**kwargs):
+    return RegenerationEngine(LLMClient(cache=LLMResponseCache(backend=MemoryCacheBackend())), **kwargs)
+
+def _generator(contents, calls, tokens=0, prompt_tokens=0):
+    async def generate(max_tokens):
+        calls.append(max_tokens)
+        # Stands in for the usage an achat() call would record
+        _current_meter.get().completion_tokens += tokens
+        _current_meter.get().prompt_tokens += prompt_tokens
+        return {'content': contents[len(calls) - 1]}
+    return generate
+
+def _score(contents):
+    return [{'quality': float(content)} for content in contents]
+
+def test_stops_at_first_accepted_attempt():
+    """The run ends as soon as a candidate passes"""
+    calls = []
+    result = _engine(max_attempts=5).run(_generator(['0.2', '0.9', '0.5'], calls), _score, lambda s: s['quality'] >= 0.7)
+    assert result.accepted and result.post['content'] == '0.9'
+    assert result.stop_reason == 'accepted'
+    assert len(calls) == 2
+
+def test_keeps_best_candidate_when_attempts_run_out():
+    """With n candidates per attempt the highest-scoring one across attempts wins"""
+    calls = []
+    result = _engine(max_attempts=2, candidates=3).run(
+        _generator(['0.1', '0.4', '0.2', '0.3', '0.6', '0.5'], calls), _score, lambda s: s['quality'] >= 0.7
+    )
+    assert not result.accepted and result.post['content'] == '0.6'
+    assert [attempt.candidates for attempt in result.attempts] == [3, 3]
+    assert len(calls) == 6
+
+def test_candidates_get_their_share_of_the_remaining_budget():
+    """max_tokens shrinks with what earlier attempts spent until the budget can't cover another attempt"""
+    calls = []
+    result = _engine(max_attempts=5, candidates=2, token_budget=2000, min_tokens=300).run(
+        _generator(['0.1'] * 10, calls, tokens=300), _score, lambda s: s['quality'] >= 0.7
+    )
+    assert calls == [1000, 1000, 700, 700, 400, 400]
+    assert result.stop_reason == 'token_budget'
+    assert result.tokens == 1800
+
+def test_prompt_tokens_are_reported_but_not_budgeted():
+    """Only completion tokens, which max_tokens caps, count against the budget"""
+    calls = []
+    result = _engine(max_attempts=5, candidates=2, token_budget=2000, min_tokens=300).run(
+        _generator(['0.1'] * 10, calls, tokens=300, prompt_tokens=900), _score, lambda s: s['quality'] >= 0.7
+    )
+    assert calls == [1000, 1000, 700, 700, 400, 400]
+    assert result.usage.completion_tokens == 1800 <= 2000
+    assert result.usage.prompt_tokens == 5400
+    assert [attempt.completion_tokens for attempt in result.attempts] == [600, 600, 600]
@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+import pytest
+from content_engine.sentiment import BUILTIN_LEXICON, LexiconSentiment, SentimentAnalyzer, textblob_polarity
+
+def test_lexicon_scorer_handles_modifiers_and_negation():
+    """Intensifiers strengthen, negations flip, unknown text is neutral"""
+    scorer = LexiconSentiment(BUILTIN_LEXICON)
+    assert scorer.polarity("a very good launch") > scorer.polarity("a good launch") > 0
+    assert scorer.polarity("not a good quarter") < 0
+    assert scorer.polarity("quarterly filing") == 0.0
+
+def test_analyzer_caches_by_content():
+    """Repeated texts are scored once"""
+    analyzer = SentimentAnalyzer(mode='lexicon', lexicon=BUILTIN_LEXICON)
+    assert analyzer.polarity_batch(["great team", "great team", "bad call"]) == [0.8, 0.8, -0.7]
+    analyzer.polarity("great team")
+    assert analyzer.stats()['hits'] == 1
+    assert analyzer.stats()['misses'] == 2
+
+def test_lexicon_tracks_textblob_on_fixture_posts():
+    """Lexicon mode makes the same engagement call as TextBlob on real posts"""
+    pytest.importorskip('textblob')
+    with open(Path(__file__).parent / 'content_engine' / 'data' / 'examples.json', encoding='utf-8') as f:
+        posts = [example['content'] for example in json.load(f)['examples']]
+    sentences = [s.strip() for post in posts for s in post.replace('\n', '. ').split('.') if len(s.strip()) > 3]
+    scorer = LexiconSentiment()
+
+    # Engagement only looks at polarity > 0, per whole post
+    for post in posts:
+        exact = textblob_polarity(post)
+        assert (scorer.polarity(post) > 0) == (exact > 0)
+        assert abs(scorer.polarity(post) - exact) < 0.05
+
+    # Short texts are noisier; the sign still has to agree almost everywhere
+    agree = sum((scorer.polarity(s) > 0) == (textblob_polarity(s) > 0) for s in sentences)
+    assert agree / len(sentences) >= 0.95
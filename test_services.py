@@ -0,0 +1,31 @@
+import pytest
+from content_engine.services import ServiceContainer
+
+def test_components_are_built_once_and_shared():
+    """Dependencies are injected from the container instead of rebuilt"""
+    built = []
+
+    def build(name, *deps):
+        def factory(services):
+            built.append(name)
+            return {'name': name, **{dep: services.get(dep) for dep in deps}}
+        return factory
+
+    services = ServiceContainer({
+        'db': build('db'),
+        'collector': build('collector', 'db'),
+        'recommender': build('recommender', 'db', 'collector')
+    })
+    assert not services.initialized('db')
+    recommender = services.recommender
+    assert recommender['collector'] is services.collector
+    assert recommender['db'] is services.collector['db']
+    assert built == ['recommender', 'db', 'collector']
+    assert set(services.timings()) == {'db', 'collector', 'recommender'}
+
+def test_unknown_and_circular_services():
+    services = ServiceContainer({'a': lambda s: s.b, 'b': lambda s: s.a})
+    with pytest.raises(AttributeError):
+        services.missing
+    with pytest.raises(RuntimeError):
+        services.get('a')
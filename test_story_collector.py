@@ -0,0 +1,42 @@
+from content_engine import story_collector
+from content_engine.sentiment import BUILTIN_LEXICON, SentimentAnalyzer
+
+class FakeDB:
+    def __init__(self):
+        self.saved = []
+
+    def save_story(self, story):
+        self.saved.append(story)
+        return len(self.saved)
+
+class StubProviders:
+    def search(self, query):
+        return {
+            'title': f"{query} doubles revenue after a bold pivot",
+            'content': f"{query} decided to pivot its strategy, a great success for the team.",
+            'url': 'https://www.reuters.com/business/example',
+            'source': 'Reuters'
+        }
+
+def _collector(monkeypatch):
+    for name in ('get_news_cache', 'get_fetch_engine', 'get_wiki_store', 'get_company_extractor'):
+        monkeypatch.setattr(story_collector, name, lambda: None)
+    monkeypatch.setattr(story_collector, 'StorySampler', lambda db: None)
+    monkeypatch.setattr(story_collector, 'build_default_chain', lambda collector: StubProviders())
+    monkeypatch.setattr(
+        story_collector, 'get_sentiment_analyzer',
+        lambda: SentimentAnalyzer(mode='lexicon', lexicon=BUILTIN_LEXICON)
+    )
+    return story_collector.BusinessStoryCollector(db=FakeDB())
+
+def test_collect_story_builds_and_saves_a_story(monkeypatch):
+    """A provider result becomes a saved story for the requested company"""
+    collector = _collector(monkeypatch)
+    story = collector.collect_story('Acme', 'technology')
+    assert story is not None
+    assert story['id'] == 1 and collector.db.saved == [story]
+    assert story['company_name'] == 'Acme'
+    assert story['industry'] == 'technology'
+    assert story['story_type'] == 'pivot'
+    assert story['reliability_score'] == 0.95
+    assert story['sentiment_score'] > 0
@@ -0,0 +1,42 @@
+import threading
+import time
+from content_engine.story_sampler import StorySampler
+
+class FakeDB:
+    def __init__(self, rows, preferences, delay=0.0):
+        self.rows = rows
+        self.preferences = preferences
+        self.delay = delay
+        self.pool_loads = 0
+
+    def execute(self, query, params=None):
+        if 'story_preferences' in query:
+            return self.preferences
+        self.pool_loads += 1
+        time.sleep(self.delay)
+        return self.rows
+
+ROWS = [
+    {'id': 1, 'industry': 'tech', 'story_type': 'pivot'},
+    {'id': 2, 'industry': 'tech', 'story_type': 'growth'},
+    {'id': 3, 'industry': 'retail', 'story_type': 'growth'},
+    {'id': 4, 'industry': 'retail', 'story_type': 'failure'}
+]
+PREFERENCES = [{'industry': None, 'story_type': 'failure', 'weight': 0.0}]
+
+def test_zero_weight_stories_are_never_drawn():
+    """Excluding most of the pool forces the top-up pass, which still skips zero weights"""
+    sampler = StorySampler(FakeDB(ROWS, PREFERENCES))
+    for _ in range(200):
+        assert 4 not in sampler.sample_ids(3, exclude_recent=False)
+        assert sampler._draw(*sampler._get_groups()[None], 3, exclude={1, 2}) == [3]
+
+def test_concurrent_first_samples_load_the_pool_once():
+    db = FakeDB(ROWS, PREFERENCES, delay=0.05)
+    sampler = StorySampler(db)
+    threads = [threading.Thread(target=sampler.sample_ids, args=(2,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert db.pool_loads == 1
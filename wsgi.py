@@ -0,0 +1,42 @@
+"""Production entry point: gunicorn -c gunicorn.conf.py wsgi:app"""
+import logging
+import importlib
+from app import app
+from content_engine.sentiment import get_sentiment_analyzer
+from content_engine.company_extractor import get_company_extractor
+from content_engine.marker_scanner import get_marker_scanner
+
+logger = logging.getLogger(__name__)
+
+# Modules imported in the master before forking, so every worker shares
+# their memory copy-on-write instead of importing them on first request
+PREWARM_MODULES = [
+    'content_engine.story_collector',
+    'content_engine.enhanced_generator',
+    'content_engine.content_generator',
+    'content_engine.post_recommender',
+    'content_engine.auto_recommender',
+    'newspaper',
+    'wikipediaapi',
+    'duckduckgo_search',
+    'numpy'
+]
+
+
+def prewarm():
+    """Import component modules and build the CPU-only, fork-safe singletons.
+
+    Nothing here opens a socket or starts a thread; database pools and
+    components are built per worker after fork.
+    """
+    for name in PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning(f"Could not prewarm {name}: {e}")
+    get_sentiment_analyzer()
+    get_company_extractor()
+    get_marker_scanner()
+
+
+prewarm()